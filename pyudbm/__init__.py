@@ -6,7 +6,22 @@ the historical UDBM Python binding.
 """
 
 from .config.meta import __VERSION__ as __version__
-from .binding import DBM, Clock, Constraint, Context, Federation, FloatValuation, IntValuation, Valuation, VariableDifference
+from .binding import (
+    DBM,
+    Clock,
+    Constraint,
+    Context,
+    Federation,
+    FloatValuation,
+    IntValuation,
+    RELATION_DIFFERENT,
+    RELATION_EQUAL,
+    RELATION_SUBSET,
+    RELATION_SUPERSET,
+    Valuation,
+    VariableDifference,
+    relation_matrix,
+)
 
 __all__ = [
     "DBM",
@@ -16,7 +31,12 @@ __all__ = [
     "Federation",
     "FloatValuation",
     "IntValuation",
+    "RELATION_DIFFERENT",
+    "RELATION_EQUAL",
+    "RELATION_SUBSET",
+    "RELATION_SUPERSET",
     "Valuation",
     "VariableDifference",
     "__version__",
+    "relation_matrix",
 ]
@@ -18,8 +18,39 @@ Example::
     True
 """
 
-from .udbm import DBM, Clock, Constraint, Context, Federation, FloatValuation, IntValuation, Valuation, VariableDifference
-from .ucdd import BDDTraceSet, CDD, CDDContext, CDDExtraction, CDDBool, CDDClock, CDDLevelInfo
+from .udbm import (
+    AutoReduceInfo,
+    DBM,
+    Clock,
+    Constraint,
+    ConstraintCacheInfo,
+    Context,
+    Federation,
+    FederationStats,
+    FederationStore,
+    FloatValuation,
+    IntValuation,
+    RELATION_DIFFERENT,
+    RELATION_EQUAL,
+    RELATION_SUBSET,
+    RELATION_SUPERSET,
+    SubsumptionIndex,
+    Valuation,
+    VariableDifference,
+    relation_matrix,
+)
+from .ucdd import (
+    BDDTraceSet,
+    CDD,
+    CDDContext,
+    CDDExtraction,
+    CDDBool,
+    CDDClock,
+    CDDLevelInfo,
+    CDDRuntimeStats,
+    configure_runtime,
+    runtime_stats,
+)
 from .utap import (
     Branchpoint,
     Diagnostic,
@@ -66,16 +97,19 @@ from .utap_builder import (
 from .visual import PlotResult, plot_dbm, plot_federation
 
 __all__ = [
+    "AutoReduceInfo",
     "Diagnostic",
     "DBM",
     "Clock",
     "Constraint",
+    "ConstraintCacheInfo",
     "CDDBool",
     "CDD",
     "CDDClock",
     "CDDContext",
     "CDDExtraction",
     "CDDLevelInfo",
+    "CDDRuntimeStats",
     "Context",
     "Branchpoint",
     "Edge",
@@ -83,6 +117,8 @@ __all__ = [
     "Expression",
     "FeatureFlags",
     "Federation",
+    "FederationStats",
+    "FederationStore",
     "FloatValuation",
     "IntValuation",
     "Location",
@@ -100,8 +136,13 @@ __all__ = [
     "Process",
     "Query",
     "QuerySpec",
+    "RELATION_DIFFERENT",
+    "RELATION_EQUAL",
+    "RELATION_SUBSET",
+    "RELATION_SUPERSET",
     "BDDTraceSet",
     "Resource",
+    "SubsumptionIndex",
     "Symbol",
     "Template",
     "TemplateBuilder",
@@ -114,6 +155,7 @@ __all__ = [
     "EdgeSpec",
     "builtin_declarations",
     "build_model",
+    "configure_runtime",
     "load_query",
     "load_xml",
     "load_xta",
@@ -123,5 +165,7 @@ __all__ = [
     "parse_query",
     "plot_dbm",
     "plot_federation",
+    "relation_matrix",
+    "runtime_stats",
     "textual_builtin_preamble",
 ]
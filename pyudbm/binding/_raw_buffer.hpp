@@ -0,0 +1,95 @@
+#pragma once
+
+#include <pybind11/pybind11.h>
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace pyudbm { namespace binding {
+
+// Owning C-contiguous tensor returned by bulk native exports. Python wraps it
+// with memoryview() or numpy.asarray() without copying the cells. A read-only
+// tensor can be handed out repeatedly by its owner without defensive copies.
+template <typename T>
+class TensorBuffer
+{
+public:
+    TensorBuffer(std::vector<T> cells, std::vector<pybind11::ssize_t> shape, bool readonly = false):
+        cells_(std::move(cells)), shape_(std::move(shape)), readonly_(readonly)
+    {}
+
+    const std::vector<pybind11::ssize_t>& shape() const { return shape_; }
+    const std::vector<T>& cells() const { return cells_; }
+
+    pybind11::buffer_info info()
+    {
+        auto strides = std::vector<pybind11::ssize_t>(shape_.size());
+        auto stride = static_cast<pybind11::ssize_t>(sizeof(T));
+        for (auto index = shape_.size(); index-- > 0;) {
+            strides[index] = stride;
+            stride *= shape_[index];
+        }
+        return pybind11::buffer_info(cells_.data(), static_cast<pybind11::ssize_t>(sizeof(T)),
+                                     pybind11::format_descriptor<T>::format(),
+                                     static_cast<pybind11::ssize_t>(shape_.size()), shape_, strides, readonly_);
+    }
+
+private:
+    std::vector<T> cells_;
+    std::vector<pybind11::ssize_t> shape_;
+    bool readonly_;
+};
+
+using RawBuffer = TensorBuffer<int32_t>;
+using RealBuffer = TensorBuffer<double>;
+
+template <typename T>
+void bind_tensor_buffer(pybind11::module& m, const char* name)
+{
+    pybind11::class_<TensorBuffer<T>>(m, name, pybind11::buffer_protocol(), pybind11::module_local())
+        .def_buffer(&TensorBuffer<T>::info)
+        .def_property_readonly("shape", [](const TensorBuffer<T>& buffer) {
+            auto result = pybind11::tuple(buffer.shape().size());
+            for (std::size_t index = 0; index < buffer.shape().size(); ++index) {
+                result[index] = buffer.shape()[index];
+            }
+            return result;
+        });
+}
+
+inline void bind_raw_buffer(pybind11::module& m)
+{
+    bind_tensor_buffer<int32_t>(m, "_NativeRawBuffer");
+    bind_tensor_buffer<double>(m, "_NativeRealBuffer");
+}
+
+// Request a C-contiguous view of ``source`` holding ``T`` items. The returned
+// info keeps the exporter alive, so the pointer stays valid while it is in scope.
+template <typename T>
+pybind11::buffer_info request_contiguous_buffer(const pybind11::buffer& source, const std::string& what,
+                                                const std::string& type_name)
+{
+    auto info = source.request();
+    if (!info.item_type_is_equivalent_to<T>()) {
+        throw std::invalid_argument(what + " must hold " + type_name + " values.");
+    }
+    auto expected = static_cast<pybind11::ssize_t>(sizeof(T));
+    for (auto index = info.shape.size(); index-- > 0;) {
+        if (info.shape[index] > 1 && info.strides[index] != expected) {
+            throw std::invalid_argument(what + " must be C-contiguous.");
+        }
+        expected *= info.shape[index];
+    }
+    return info;
+}
+
+inline pybind11::buffer_info request_int32_buffer(const pybind11::buffer& source, const std::string& what)
+{
+    return request_contiguous_buffer<int32_t>(source, what, "int32");
+}
+
+}}  // namespace pyudbm::binding
@@ -4,12 +4,19 @@
 #include <cdd/cdd.h>
 #include <cdd/kernel.h>
 
+#include "pyudbm/binding/_raw_buffer.hpp"
+
+#include <algorithm>
+#include <atomic>
 #include <cstddef>
 #include <cstdint>
 #include <cstdio>
 #include <cstdlib>
+#include <memory>
+#include <optional>
 #include <stdexcept>
 #include <string>
+#include <tuple>
 #include <utility>
 #include <vector>
 
@@ -17,9 +24,32 @@ namespace py = pybind11;
 
 namespace
 {
+    // (node table size, operation cache size, stack size) for the next
+    // implicit runtime start; empty keeps UCDD's own defaults.
+    using RuntimeSizes = std::tuple<int32_t, int32_t, std::size_t>;
+
+    std::optional<RuntimeSizes> runtime_sizes;
+    std::atomic<std::size_t> runtime_starts{0};
+
+    void start_runtime(int32_t maxsize, int32_t cache_size, std::size_t stack_size)
+    {
+        const auto code = cdd_init(maxsize, cache_size, stack_size);
+        if (code != 0) {
+            throw std::runtime_error("cdd_init failed with error code " + std::to_string(code) + ".");
+        }
+        ++runtime_starts;
+    }
+
     void ensure_runtime_running()
     {
-        cdd_ensure_running();
+        if (!cdd_isrunning()) {
+            if (runtime_sizes) {
+                start_runtime(std::get<0>(*runtime_sizes), std::get<1>(*runtime_sizes), std::get<2>(*runtime_sizes));
+            } else {
+                cdd_ensure_running();
+                runtime_starts += cdd_isrunning() ? 1 : 0;
+            }
+        }
         if (!cdd_isrunning()) {
             throw std::runtime_error("Failed to initialize the UCDD runtime.");
         }
@@ -41,6 +71,51 @@ namespace
         return result;
     }
 
+    // The runtime holds as many clocks as the widest CDDContext created so
+    // far. A context with fewer clocks leaves the remaining ones free: its DBMs
+    // are widened with unconstrained clocks on the way in and cut back to their
+    // leading dim * dim block on the way out. A dim of 0 means the runtime's.
+    // The extra clocks get no bound at all, not even x_k >= 0, so no CDD node
+    // ever mentions them and a context's CDDs do not depend on how wide the
+    // runtime was when they were built.
+    cindex_t runtime_dimension(cindex_t dim)
+    {
+        const auto full = static_cast<cindex_t>(cdd_clocknum);
+        if (dim > full) {
+            throw std::invalid_argument("DBM dimension exceeds the UCDD runtime clock count.");
+        }
+        return full;
+    }
+
+    std::vector<raw_t> widen_dbm(const raw_t* dbm, cindex_t dim, cindex_t full)
+    {
+        auto result = std::vector<raw_t>(static_cast<std::size_t>(full) * static_cast<std::size_t>(full));
+        for (cindex_t i = 0; i < full; ++i) {
+            for (cindex_t j = 0; j < full; ++j) {
+                auto& cell = result[static_cast<std::size_t>(i) * full + j];
+                if (i < dim && j < dim) {
+                    cell = dbm[static_cast<std::size_t>(i) * dim + j];
+                } else if (i == j) {
+                    cell = dbm_LE_ZERO;
+                } else {
+                    cell = dbm_LS_INFINITY;
+                }
+            }
+        }
+        return result;
+    }
+
+    std::vector<int32_t> narrow_dbm(const raw_t* dbm, cindex_t full, cindex_t dim)
+    {
+        auto result = std::vector<int32_t>{};
+        result.reserve(static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim));
+        for (cindex_t i = 0; i < dim; ++i) {
+            const auto* row = dbm + static_cast<std::size_t>(i) * full;
+            result.insert(result.end(), row, row + dim);
+        }
+        return result;
+    }
+
     void ensure_same_size(const std::vector<int32_t>& left, const std::vector<int32_t>& right, const char* message)
     {
         if (left.size() != right.size()) {
@@ -90,44 +165,65 @@ namespace
     class NativeBDDTraceSet
     {
     public:
-        explicit NativeBDDTraceSet(const bdd_arrays& arrays): num_traces_(arrays.numTraces), num_bools_(arrays.numBools)
-        {
-            const auto total_size = static_cast<std::size_t>(num_traces_ > 0 ? num_traces_ : 1) *
-                static_cast<std::size_t>(num_bools_ > 0 ? num_bools_ : 1);
-
-            if (arrays.vars != nullptr) {
-                vars_.assign(arrays.vars, arrays.vars + static_cast<std::ptrdiff_t>(total_size));
-                std::free(arrays.vars);
-            }
-            if (arrays.values != nullptr) {
-                values_.assign(arrays.values, arrays.values + static_cast<std::ptrdiff_t>(total_size));
-                std::free(arrays.values);
-            }
-
-            if (num_traces_ <= 0 || num_bools_ <= 0) {
-                vars_.clear();
-                values_.clear();
-            }
-        }
+        // The native arrays are narrowed once into read-only (num_traces,
+        // num_bools) tensors: levels as int32, values (-1, 0 or 1) as int8.
+        // The buffer accessors return these tensors themselves, kept alive by
+        // the trace set, so exports and row iteration never copy them.
+        explicit NativeBDDTraceSet(const bdd_arrays& arrays):
+            num_traces_(arrays.numTraces),
+            num_bools_(arrays.numBools),
+            vars_(take_cells<int32_t>(arrays.vars, arrays), shape(arrays), true),
+            values_(take_cells<int8_t>(arrays.values, arrays), shape(arrays), true)
+        {}
 
         int32_t num_traces() const { return num_traces_; }
         int32_t num_bools() const { return num_bools_; }
 
         std::vector<std::vector<int32_t>> vars_matrix() const
         {
-            return to_matrix_rows(vars_, num_traces_, num_bools_);
+            return to_matrix_rows(vars_.cells(), num_traces_, num_bools_);
         }
 
         std::vector<std::vector<int32_t>> values_matrix() const
         {
-            return to_matrix_rows(values_, num_traces_, num_bools_);
+            const auto& cells = values_.cells();
+            return to_matrix_rows(std::vector<int32_t>(cells.begin(), cells.end()), num_traces_, num_bools_);
         }
 
+        pyudbm::binding::RawBuffer& vars_buffer() { return vars_; }
+        pyudbm::binding::TensorBuffer<int8_t>& values_buffer() { return values_; }
+
     private:
+        static bool is_empty(const bdd_arrays& arrays) { return arrays.numTraces <= 0 || arrays.numBools <= 0; }
+
+        static std::vector<py::ssize_t> shape(const bdd_arrays& arrays)
+        {
+            if (is_empty(arrays)) {
+                return {0, std::max<py::ssize_t>(arrays.numBools, 0)};
+            }
+            return {arrays.numTraces, arrays.numBools};
+        }
+
+        // Copy (and narrow) one malloc'ed native array, then release it.
+        template <typename T, typename Source>
+        static std::vector<T> take_cells(Source* data, const bdd_arrays& arrays)
+        {
+            auto cells = std::vector<T>{};
+            if (data != nullptr) {
+                if (!is_empty(arrays)) {
+                    const auto size = static_cast<std::size_t>(arrays.numTraces) *
+                        static_cast<std::size_t>(arrays.numBools);
+                    cells.assign(data, data + static_cast<std::ptrdiff_t>(size));
+                }
+                std::free(data);
+            }
+            return cells;
+        }
+
         int32_t num_traces_;
         int32_t num_bools_;
-        std::vector<int32_t> vars_;
-        std::vector<int32_t> values_;
+        pyudbm::binding::RawBuffer vars_;
+        pyudbm::binding::TensorBuffer<int8_t> values_;
     };
 
     class NativeCDDRuntime
@@ -135,10 +231,30 @@ namespace
     public:
         static void init(int32_t maxsize, int32_t cache_size, std::size_t stack_size)
         {
-            const auto code = cdd_init(maxsize, cache_size, stack_size);
-            if (code != 0) {
-                throw std::runtime_error("cdd_init failed with error code " + std::to_string(code) + ".");
+            start_runtime(maxsize, cache_size, stack_size);
+        }
+
+        static void configure(int32_t maxsize, int32_t cache_size, std::size_t stack_size)
+        {
+            if (maxsize <= 0 || cache_size <= 0 || stack_size == 0) {
+                throw std::invalid_argument("UCDD runtime sizes must be positive.");
             }
+            runtime_sizes = RuntimeSizes(maxsize, cache_size, stack_size);
+        }
+
+        static void clear_configuration()
+        {
+            runtime_sizes.reset();
+        }
+
+        static std::optional<RuntimeSizes> configured_sizes()
+        {
+            return runtime_sizes;
+        }
+
+        static std::size_t start_count()
+        {
+            return runtime_starts;
         }
 
         static void ensure_running()
@@ -211,17 +327,17 @@ namespace
     public:
         explicit NativeCDD(const cdd& value): cdd_(value)
         {
-            ++live_count_;
+            track_live();
         }
 
         NativeCDD(const NativeCDD& other): cdd_(other.cdd_)
         {
-            ++live_count_;
+            track_live();
         }
 
         NativeCDD(NativeCDD&& other) noexcept: cdd_(other.cdd_)
         {
-            ++live_count_;
+            track_live();
         }
 
         ~NativeCDD()
@@ -246,6 +362,11 @@ namespace
             return live_count_;
         }
 
+        static std::size_t peak_live_count()
+        {
+            return peak_live_count_;
+        }
+
         static NativeCDD true_value()
         {
             ensure_runtime_running();
@@ -292,7 +413,43 @@ namespace
         {
             ensure_runtime_running();
             const auto raw_dbm = normalize_dbm(dbm, dim);
-            return NativeCDD(cdd(raw_dbm.data(), dim));
+            const auto full = runtime_dimension(dim);
+            auto wide = widen_dbm(raw_dbm.data(), dim, full);
+            return NativeCDD(cdd(wide.data(), full));
+        }
+
+        // Union of every dim * dim matrix in a C-contiguous int32 buffer. The
+        // per-DBM CDDs are merged pairwise, so operands stay balanced instead
+        // of growing one DBM at a time, and the result is reduced only once.
+        static NativeCDD from_dbm_buffer(const py::buffer& dbms, cindex_t dim, bool reduce = true)
+        {
+            const auto info = pyudbm::binding::request_int32_buffer(dbms, "DBM buffer");
+            const auto cells = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            const auto size = static_cast<std::size_t>(info.size);
+            if (cells == 0 || size % cells != 0) {
+                throw std::invalid_argument("DBM buffer size does not match the supplied dimension. "
+                                            "Expected a multiple of dim * dim raw cells.");
+            }
+
+            ensure_runtime_running();
+            const auto full = runtime_dimension(dim);
+            const auto* matrices = static_cast<const raw_t*>(info.ptr);
+            auto parts = std::vector<cdd>{};
+            parts.reserve(size / cells);
+            for (std::size_t offset = 0; offset < size; offset += cells) {
+                auto wide = widen_dbm(matrices + offset, dim, full);
+                parts.emplace_back(wide.data(), full);
+            }
+            if (parts.empty()) {
+                return NativeCDD(cdd_false());
+            }
+
+            for (std::size_t width = 1; width < parts.size(); width *= 2) {
+                for (std::size_t index = 0; index + width < parts.size(); index += 2 * width) {
+                    parts[index] = parts[index] | parts[index + width];
+                }
+            }
+            return NativeCDD(reduce ? cdd_reduce(parts.front()) : parts.front());
         }
 
         NativeCDD copy() const { return NativeCDD(cdd_); }
@@ -377,6 +534,35 @@ namespace
             return cdd_.handle() == cddfalse;
         }
 
+        // Runtime-wide operations (remove_negative, delay, past, predt and the
+        // transition family) treat every runtime clock alike and may bound the
+        // clocks a narrower context never declared, e.g. with x_k >= 0. Project
+        // those clocks away again: every closed DBM fragment is cut to the
+        // context's dim * dim block and widened back with the extra clocks
+        // unconstrained, so the result only constrains the context's clocks.
+        NativeCDD forget_runtime_clocks(cindex_t dim) const
+        {
+            const auto full = runtime_dimension(dim);
+            if (dim == 0 || dim == full) {
+                return NativeCDD(cdd_);
+            }
+
+            auto result = cdd_false();
+            auto pending = cdd_reduce(cdd_);
+            while (pending.handle() != cddfalse) {
+                auto extraction = cdd_extract_bdd_and_dbm(pending);
+                const auto dbm = std::unique_ptr<raw_t, void (*)(void*)>(extraction.dbm, std::free);
+                if (dbm == nullptr) {
+                    throw std::runtime_error("UCDD did not return a DBM for an extracted CDD fragment.");
+                }
+                const auto narrow = narrow_dbm(dbm.get(), full, dim);
+                auto wide = widen_dbm(narrow.data(), dim, full);
+                result = result | (extraction.BDD_part & cdd(wide.data(), full));
+                pending = extraction.CDD_part;
+            }
+            return NativeCDD(cdd_reduce(result));
+        }
+
         NativeCDD remove_negative() const
         {
             return NativeCDD(cdd_remove_negative(cdd_));
@@ -500,27 +686,70 @@ namespace
 
         bool contains_dbm(const std::vector<int32_t>& dbm, cindex_t dim) const
         {
-            auto raw_dbm = normalize_dbm(dbm, dim);
-            return cdd_contains(cdd_, raw_dbm.data(), dim);
+            const auto raw_dbm = normalize_dbm(dbm, dim);
+            const auto full = runtime_dimension(dim);
+            auto wide = widen_dbm(raw_dbm.data(), dim, full);
+            return cdd_contains(cdd_, wide.data(), full);
         }
 
         py::tuple extract_dbm(cindex_t dim) const
         {
-            auto dbm = std::vector<raw_t>(static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim));
-            const auto remainder = cdd_extract_dbm(cdd_, dbm.data(), dim);
-
-            auto raw = std::vector<int32_t>{};
-            raw.reserve(dbm.size());
-            for (const auto value : dbm) {
-                raw.push_back(static_cast<int32_t>(value));
-            }
-
-            return py::make_tuple(NativeCDD(remainder), raw);
+            const auto full = runtime_dimension(dim);
+            auto dbm = std::vector<raw_t>(static_cast<std::size_t>(full) * static_cast<std::size_t>(full));
+            const auto remainder = cdd_extract_dbm(cdd_, dbm.data(), full);
+            return py::make_tuple(NativeCDD(remainder), narrow_dbm(dbm.data(), full, dim));
         }
 
         NativeCDD extract_bdd(cindex_t dim) const
         {
-            return NativeCDD(cdd_extract_bdd(cdd_, dim));
+            return NativeCDD(cdd_extract_bdd(cdd_, runtime_dimension(dim)));
+        }
+
+        using GuardedZone = std::pair<NativeCDD, pyudbm::binding::RawBuffer>;
+
+        // Drain the reduced CDD with cdd_extract_bdd_and_dbm and group the
+        // extracted DBMs by boolean guard, in first-seen order. Guards are
+        // reduced BDDs, so equal guards share one node handle.
+        std::vector<GuardedZone> extract_guarded_zones(bool require_pure, cindex_t dim = 0) const
+        {
+            const auto full = runtime_dimension(dim);
+            dim = dim == 0 ? full : dim;
+            const auto cells = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            auto guards = std::vector<cdd>{};
+            auto zones = std::vector<std::vector<int32_t>>{};
+            auto pending = cdd_reduce(cdd_);
+            while (pending.handle() != cddfalse) {
+                auto extraction = cdd_extract_bdd_and_dbm(pending);
+                const auto dbm = std::unique_ptr<raw_t, void (*)(void*)>(extraction.dbm, std::free);
+                if (dbm == nullptr) {
+                    throw std::runtime_error("UCDD did not return a DBM for an extracted CDD fragment.");
+                }
+                if (require_pure && extraction.BDD_part.handle() != cddtrue) {
+                    throw std::invalid_argument("Cannot convert a mixed bool/clock CDD to Federation.");
+                }
+
+                auto group = std::size_t{0};
+                while (group < guards.size() && guards[group].handle() != extraction.BDD_part.handle()) {
+                    ++group;
+                }
+                if (group == guards.size()) {
+                    guards.push_back(extraction.BDD_part);
+                    zones.emplace_back();
+                }
+                const auto narrow = narrow_dbm(dbm.get(), full, dim);
+                zones[group].insert(zones[group].end(), narrow.begin(), narrow.end());
+                pending = extraction.CDD_part;
+            }
+
+            auto result = std::vector<GuardedZone>{};
+            result.reserve(guards.size());
+            for (std::size_t group = 0; group < guards.size(); ++group) {
+                const auto count = static_cast<py::ssize_t>(zones[group].size() / cells);
+                const auto side = static_cast<py::ssize_t>(dim);
+                result.emplace_back(NativeCDD(guards[group]),
+                                    pyudbm::binding::RawBuffer(std::move(zones[group]), {count, side, side}));
+            }
+            return result;
         }
 
         NativeBDDTraceSet bdd_to_array() const
@@ -534,11 +763,21 @@ namespace
         }
 
     private:
+        void track_live()
+        {
+            const auto live = ++live_count_;
+            auto peak = peak_live_count_.load();
+            while (peak < live && !peak_live_count_.compare_exchange_weak(peak, live)) {
+            }
+        }
+
         cdd cdd_;
-        static std::size_t live_count_;
+        static std::atomic<std::size_t> live_count_;
+        static std::atomic<std::size_t> peak_live_count_;
     };
 
-    std::size_t NativeCDD::live_count_ = 0;
+    std::atomic<std::size_t> NativeCDD::live_count_{0};
+    std::atomic<std::size_t> NativeCDD::peak_live_count_{0};
 
     void NativeCDDRuntime::done()
     {
@@ -556,16 +795,13 @@ namespace
     class NativeCDDExtraction
     {
     public:
-        explicit NativeCDDExtraction(const extraction_result& extraction):
+        NativeCDDExtraction(const extraction_result& extraction, cindex_t dim):
             cdd_part_(extraction.CDD_part),
             bdd_part_(extraction.BDD_part)
         {
             if (extraction.dbm != nullptr) {
-                const auto size = static_cast<std::size_t>(cdd_clocknum) * static_cast<std::size_t>(cdd_clocknum);
-                dbm_.reserve(size);
-                for (std::size_t index = 0; index < size; ++index) {
-                    dbm_.push_back(static_cast<int32_t>(extraction.dbm[index]));
-                }
+                const auto full = static_cast<cindex_t>(cdd_clocknum);
+                dbm_ = narrow_dbm(extraction.dbm, full, dim == 0 ? full : dim);
                 std::free(extraction.dbm);
             }
         }
@@ -585,6 +821,9 @@ PYBIND11_MODULE(_ucdd, m)
 {
     m.doc() = "Thin pybind11 bindings for the native UCDD runtime and CDD objects.";
 
+    pyudbm::binding::bind_raw_buffer(m);
+    pyudbm::binding::bind_tensor_buffer<int8_t>(m, "_NativeInt8Buffer");
+
     m.attr("TYPE_CDD") = py::int_(TYPE_CDD);
     m.attr("TYPE_BDD") = py::int_(TYPE_BDD);
     m.attr("OP_AND") = py::int_(cddop_and);
@@ -606,10 +845,17 @@ PYBIND11_MODULE(_ucdd, m)
         .def_property_readonly("num_traces", &NativeBDDTraceSet::num_traces)
         .def_property_readonly("num_bools", &NativeBDDTraceSet::num_bools)
         .def("vars_matrix", &NativeBDDTraceSet::vars_matrix)
-        .def("values_matrix", &NativeBDDTraceSet::values_matrix);
+        .def("values_matrix", &NativeBDDTraceSet::values_matrix)
+        .def("vars_buffer", &NativeBDDTraceSet::vars_buffer, py::return_value_policy::reference_internal)
+        .def("values_buffer", &NativeBDDTraceSet::values_buffer, py::return_value_policy::reference_internal);
 
     py::class_<NativeCDDRuntime>(m, "_NativeCDDRuntime")
         .def_static("init", &NativeCDDRuntime::init, py::arg("maxsize"), py::arg("cache_size"), py::arg("stack_size"))
+        .def_static("configure", &NativeCDDRuntime::configure, py::arg("maxsize"), py::arg("cache_size"),
+                    py::arg("stack_size"))
+        .def_static("clear_configuration", &NativeCDDRuntime::clear_configuration)
+        .def_static("configured_sizes", &NativeCDDRuntime::configured_sizes)
+        .def_static("start_count", &NativeCDDRuntime::start_count)
         .def_static("ensure_running", &NativeCDDRuntime::ensure_running)
         .def_static("done", &NativeCDDRuntime::done)
         .def_static("is_running", &NativeCDDRuntime::is_running)
@@ -631,7 +877,10 @@ PYBIND11_MODULE(_ucdd, m)
         .def_static("bddvar", &NativeCDD::bddvar, py::arg("level"))
         .def_static("bddnvar", &NativeCDD::bddnvar, py::arg("level"))
         .def_static("from_dbm", &NativeCDD::from_dbm, py::arg("dbm"), py::arg("dim"))
+        .def_static("from_dbm_buffer", &NativeCDD::from_dbm_buffer, py::arg("dbms"), py::arg("dim"),
+                    py::arg("reduce") = true)
         .def_static("live_count", &NativeCDD::live_count)
+        .def_static("peak_live_count", &NativeCDD::peak_live_count)
         .def("copy", &NativeCDD::copy)
         .def("and_op", &NativeCDD::and_op, py::arg("other"))
         .def("or_op", &NativeCDD::or_op, py::arg("other"))
@@ -649,6 +898,7 @@ PYBIND11_MODULE(_ucdd, m)
         .def("is_bdd", &NativeCDD::is_bdd)
         .def("is_true", &NativeCDD::is_true)
         .def("is_false", &NativeCDD::is_false)
+        .def("forget_runtime_clocks", &NativeCDD::forget_runtime_clocks, py::arg("dim"))
         .def("remove_negative", &NativeCDD::remove_negative)
         .def("delay", &NativeCDD::delay)
         .def("past", &NativeCDD::past)
@@ -665,9 +915,11 @@ PYBIND11_MODULE(_ucdd, m)
         .def("contains_dbm", &NativeCDD::contains_dbm, py::arg("dbm"), py::arg("dim"))
         .def("extract_dbm", &NativeCDD::extract_dbm, py::arg("dim"))
         .def("extract_bdd", &NativeCDD::extract_bdd, py::arg("dim"))
-        .def("extract_bdd_and_dbm", [](const NativeCDD& self) {
-            return NativeCDDExtraction(cdd_extract_bdd_and_dbm(self.value()));
-        })
+        .def("extract_bdd_and_dbm", [](const NativeCDD& self, cindex_t dim) {
+            runtime_dimension(dim);
+            return NativeCDDExtraction(cdd_extract_bdd_and_dbm(self.value()), dim);
+        }, py::arg("dim") = 0)
+        .def("extract_guarded_zones", &NativeCDD::extract_guarded_zones, py::arg("require_pure"), py::arg("dim") = 0)
         .def("bdd_to_array", &NativeCDD::bdd_to_array)
         .def("__and__", &NativeCDD::and_op, py::arg("other"))
         .def("__or__", &NativeCDD::or_op, py::arg("other"))
@@ -5,18 +5,92 @@
 #include <dbm/ClockAccessor.h>
 #include <dbm/constraints.h>
 #include <dbm/fed.h>
+#include <dbm/mingraph.h>
 
+#include "pyudbm/binding/_raw_buffer.hpp"
+
+#include <algorithm>
+#include <atomic>
+#include <cmath>
 #include <cstddef>
 #include <cstdint>
+#include <cstring>
+#include <exception>
+#include <limits>
+#include <mutex>
+#include <optional>
+#include <random>
 #include <stdexcept>
 #include <string>
+#include <thread>
+#include <tuple>
+#include <type_traits>
+#include <unordered_map>
 #include <utility>
 #include <vector>
 
 namespace py = pybind11;
 
+using pyudbm::binding::RawBuffer;
+using pyudbm::binding::RealBuffer;
+
 namespace
 {
+    // UDBM keeps its DBM allocator pools, the intern table and the copy-on-write
+    // reference counts in unsynchronized process-global state, so every call
+    // into the kernel (including copies and destruction of dbm_t / fed_t
+    // handles) goes through this one recursive lock. Heavy operations drop the
+    // GIL before taking it, which lets other Python threads keep running, but
+    // kernel work from several threads is still serialized here and does not
+    // scale across cores.
+    std::recursive_mutex& kernel_mutex()
+    {
+        static std::recursive_mutex mutex;
+        return mutex;
+    }
+
+    class KernelLock
+    {
+    public:
+        KernelLock(): lock_(kernel_mutex(), std::try_to_lock)
+        {
+            if (lock_.owns_lock()) {
+                return;
+            }
+            if (PyGILState_Check()) {
+                // Never block on the kernel while holding the GIL.
+                py::gil_scoped_release release;
+                lock_.lock();
+            } else {
+                lock_.lock();
+            }
+        }
+
+        KernelLock(const KernelLock&) = delete;
+        KernelLock& operator=(const KernelLock&) = delete;
+
+    private:
+        std::unique_lock<std::recursive_mutex> lock_;
+    };
+
+    // Declared before the UDBM member of a wrapper, this slot is destroyed after
+    // it, so a lock acquired in the wrapper destructor covers the member release.
+    class KernelLockSlot
+    {
+    public:
+        KernelLockSlot() = default;
+        KernelLockSlot(const KernelLockSlot&) {}
+        KernelLockSlot& operator=(const KernelLockSlot&) { return *this; }
+
+        void acquire() { lock_.emplace(); }
+
+    private:
+        std::optional<KernelLock> lock_;
+    };
+
+    using kernel_guard = py::call_guard<KernelLock>;
+    using released_kernel_guard = py::call_guard<py::gil_scoped_release, KernelLock>;
+
     std::vector<raw_t> normalize_raw_matrix(const std::vector<int32_t>& raw_matrix, cindex_t dim)
     {
         const auto expected_size = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
@@ -37,6 +111,233 @@ namespace
         return result;
     }
 
+    // Decode one minimal-graph encoding produced by writeToMinDBMWithOffset
+    // into ``matrix``, which must hold dim * dim cells.
+    void read_min_dbm(const std::vector<int32_t>& graph, cindex_t dim, raw_t* matrix)
+    {
+        if (graph.empty() || dbm_getSizeOfMinDBM(graph.data()) != graph.size()) {
+            throw std::invalid_argument("Supplied minimal DBM encoding is truncated or corrupt.");
+        }
+        if (dbm_getDimOfMinDBM(graph.data()) != dim) {
+            throw std::invalid_argument("Minimal DBM dimension does not match the supplied dimension.");
+        }
+        dbm_readFromMinDBM(matrix, graph.data());
+    }
+
+    // Uniform sampler over the union of DBM matrices. A DBM is picked with
+    // probability proportional to its box (clipped by optional upper bounds),
+    // a point is drawn in that box, and it is kept only when the picked DBM is
+    // the first one containing it, so overlapping DBMs are not oversampled.
+    // Works on plain matrix copies and needs no kernel lock.
+    class ZoneSampler
+    {
+    public:
+        ZoneSampler(std::vector<raw_t> cells, cindex_t dim, const std::vector<int32_t>& upper_bounds, bool integer):
+            cells_(std::move(cells)), dim_(dim), integer_(integer)
+        {
+            const auto size = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            const auto count = cells_.size() / size;
+            lower_.resize(count * dim);
+            upper_.resize(count * dim);
+            weights_.resize(count, 1.0);
+            for (std::size_t index = 0; index < count; ++index) {
+                const raw_t* matrix = cells_.data() + index * size;
+                for (cindex_t clock = 1; clock < dim; ++clock) {
+                    const auto lower = -dbm_raw2bound(matrix[clock]);
+                    const auto upper = std::min(dbm_raw2bound(matrix[clock * dim]), upper_bounds[clock]);
+                    if (upper >= dbm_INFINITY) {
+                        throw std::invalid_argument(
+                            "Bounds are required for clocks that are unbounded in the federation."
+                        );
+                    }
+                    lower_[index * dim + clock] = lower;
+                    upper_[index * dim + clock] = upper;
+                    const auto extent = integer ? upper - lower + 1 : upper - lower;
+                    weights_[index] *= extent > 0 ? static_cast<double>(extent) : 0.0;
+                }
+                total_weight_ += weights_[index];
+            }
+        }
+
+        template <typename Value>
+        std::vector<Value> draw(std::size_t n, std::optional<uint64_t> seed,
+                                bool (*included)(const Value*, const raw_t*, cindex_t)) const
+        {
+            constexpr std::size_t max_misses = 100000;
+            if (weights_.empty()) {
+                throw std::invalid_argument("Cannot sample from an empty federation.");
+            }
+            if (total_weight_ <= 0.0) {
+                throw std::invalid_argument(
+                    integer_ ? "Federation has no integer points inside the sampling bounds."
+                             : "Federation has no volume inside the sampling bounds."
+                );
+            }
+
+            auto rng = std::mt19937_64(seed ? *seed : std::random_device{}());
+            auto pick = std::discrete_distribution<std::size_t>(weights_.begin(), weights_.end());
+            auto point = std::vector<Value>(dim_, Value{});
+            auto result = std::vector<Value>{};
+            result.reserve(n * (dim_ - 1));
+            std::size_t misses = 0;
+            while (result.size() < n * (dim_ - 1)) {
+                if (!propose(rng, pick, point, included)) {
+                    if (++misses > max_misses) {
+                        throw std::invalid_argument(
+                            "Sampling rejected too many points; the federation may have no volume inside the "
+                            "sampling bounds."
+                        );
+                    }
+                    continue;
+                }
+                misses = 0;
+                result.insert(result.end(), point.begin() + 1, point.end());
+            }
+            return result;
+        }
+
+        // Hit-or-miss estimate of the measure of the clipped union: the total
+        // box measure times the share of accepted proposals.
+        double estimate_volume(std::size_t samples, std::optional<uint64_t> seed) const
+        {
+            if (total_weight_ <= 0.0 || samples == 0) {
+                return 0.0;
+            }
+            auto rng = std::mt19937_64(seed ? *seed : std::random_device{}());
+            auto pick = std::discrete_distribution<std::size_t>(weights_.begin(), weights_.end());
+            auto point = std::vector<double>(dim_, 0.0);
+            std::size_t hits = 0;
+            for (std::size_t sample = 0; sample < samples; ++sample) {
+                hits += propose<double>(rng, pick, point, dbm_isRealPointIncluded) ? 1 : 0;
+            }
+            return total_weight_ * static_cast<double>(hits) / static_cast<double>(samples);
+        }
+
+    private:
+        template <typename Value>
+        bool propose(std::mt19937_64& rng, std::discrete_distribution<std::size_t>& pick, std::vector<Value>& point,
+                     bool (*included)(const Value*, const raw_t*, cindex_t)) const
+        {
+            const auto size = static_cast<std::size_t>(dim_) * static_cast<std::size_t>(dim_);
+            const auto index = pick(rng);
+            for (cindex_t clock = 1; clock < dim_; ++clock) {
+                const auto lower = lower_[index * dim_ + clock];
+                const auto upper = upper_[index * dim_ + clock];
+                if constexpr (std::is_integral_v<Value>) {
+                    point[clock] = std::uniform_int_distribution<Value>(lower, upper)(rng);
+                } else {
+                    point[clock] = std::uniform_real_distribution<Value>(lower, upper)(rng);
+                }
+            }
+
+            if (!included(point.data(), cells_.data() + index * size, dim_)) {
+                return false;
+            }
+            for (std::size_t other = 0; other < index; ++other) {
+                if (included(point.data(), cells_.data() + other * size, dim_)) {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        std::vector<raw_t> cells_;
+        cindex_t dim_;
+        bool integer_;
+        std::vector<int32_t> lower_;
+        std::vector<int32_t> upper_;
+        std::vector<double> weights_;
+        double total_weight_ = 0.0;
+    };
+
+    // Area of one DBM over two clocks clipped to its box: the box rectangle
+    // is cut by the two diagonal half-planes and measured with the shoelace
+    // formula.
+    double dbm_area(const raw_t* matrix, const std::vector<int32_t>& upper_bounds)
+    {
+        constexpr cindex_t dim = 3;
+        const auto lower_x = static_cast<double>(-dbm_raw2bound(matrix[1]));
+        const auto lower_y = static_cast<double>(-dbm_raw2bound(matrix[2]));
+        const auto upper_x = static_cast<double>(std::min(dbm_raw2bound(matrix[dim]), upper_bounds[1]));
+        const auto upper_y = static_cast<double>(std::min(dbm_raw2bound(matrix[2 * dim]), upper_bounds[2]));
+        if (upper_x <= lower_x || upper_y <= lower_y) {
+            return 0.0;
+        }
+        auto polygon = std::vector<std::pair<double, double>>{
+            {lower_x, lower_y}, {upper_x, lower_y}, {upper_x, upper_y}, {lower_x, upper_y}
+        };
+
+        // Keep the part where sign * (x - y) <= bound.
+        const auto clip = [&polygon](double sign, raw_t raw) {
+            if (raw == dbm_LS_INFINITY) {
+                return;
+            }
+            const auto bound = static_cast<double>(dbm_raw2bound(raw));
+            const auto excess = [sign, bound](const std::pair<double, double>& point) {
+                return sign * (point.first - point.second) - bound;
+            };
+            auto clipped = std::vector<std::pair<double, double>>{};
+            for (std::size_t index = 0; index < polygon.size(); ++index) {
+                const auto& current = polygon[index];
+                const auto& next = polygon[(index + 1) % polygon.size()];
+                const auto current_excess = excess(current);
+                const auto next_excess = excess(next);
+                if (current_excess <= 0.0) {
+                    clipped.push_back(current);
+                }
+                if ((current_excess < 0.0 && next_excess > 0.0) || (current_excess > 0.0 && next_excess < 0.0)) {
+                    const auto t = current_excess / (current_excess - next_excess);
+                    clipped.emplace_back(current.first + t * (next.first - current.first),
+                                         current.second + t * (next.second - current.second));
+                }
+            }
+            polygon = std::move(clipped);
+        };
+        clip(1.0, matrix[1 * dim + 2]);
+        clip(-1.0, matrix[2 * dim + 1]);
+
+        auto twice_area = 0.0;
+        for (std::size_t index = 0; index < polygon.size(); ++index) {
+            const auto& current = polygon[index];
+            const auto& next = polygon[(index + 1) % polygon.size()];
+            twice_area += current.first * next.second - next.first * current.second;
+        }
+        return std::abs(twice_area) / 2.0;
+    }
+
+    // Measure of the union of pairwise disjoint DBMs clipped to the box given by
+    // ``upper_bounds``: exact for up to two clocks, a hit-or-miss estimate with
+    // ``samples`` draws otherwise.
+    double disjoint_volume(std::vector<raw_t> cells, cindex_t dim, const std::vector<int32_t>& upper_bounds,
+                           std::size_t samples, std::optional<uint64_t> seed)
+    {
+        const auto size = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+        const auto count = cells.size() / size;
+        if (dim > 3) {
+            return ZoneSampler(std::move(cells), dim, upper_bounds, false).estimate_volume(samples, seed);
+        }
+
+        auto volume = 0.0;
+        for (std::size_t index = 0; index < count; ++index) {
+            const raw_t* matrix = cells.data() + index * size;
+            if (dim == 1) {
+                volume += 1.0;
+                continue;
+            }
+            const auto upper_x = std::min(dbm_raw2bound(matrix[dim]), upper_bounds[1]);
+            const auto upper_y = dim == 3 ? std::min(dbm_raw2bound(matrix[2 * dim]), upper_bounds[2]) : 0;
+            if (upper_x >= dbm_INFINITY || upper_y >= dbm_INFINITY) {
+                throw std::invalid_argument("Bounds are required for clocks that are unbounded in the federation.");
+            }
+            if (dim == 2) {
+                volume += std::max(0.0, static_cast<double>(upper_x + dbm_raw2bound(matrix[1])));
+            } else {
+                volume += dbm_area(matrix, upper_bounds);
+            }
+        }
+        return volume;
+    }
+
     class IndexedClockAccessor final : public dbm::ClockAccessor
     {
     public:
@@ -74,7 +375,20 @@ namespace
     class NativeDBM
     {
     public:
-        explicit NativeDBM(const dbm::dbm_t& dbm): dbm_(dbm) {}
+        explicit NativeDBM(const dbm::dbm_t& dbm): NativeDBM(dbm, KernelLock()) {}
+        NativeDBM(const NativeDBM& other): NativeDBM(other.dbm_, KernelLock()) {}
+        ~NativeDBM()
+        {
+            --live_count_;
+            release_lock_.acquire();
+        }
+
+        NativeDBM& operator=(const NativeDBM& other)
+        {
+            const KernelLock lock;
+            dbm_ = other.dbm_;
+            return *this;
+        }
 
         static NativeDBM from_raw_matrix(const std::vector<int32_t>& raw_matrix, cindex_t dim)
         {
@@ -82,8 +396,17 @@ namespace
             return NativeDBM(dbm::dbm_t(normalized.data(), dim));
         }
 
+        static NativeDBM from_min_dbm(const std::vector<int32_t>& graph, cindex_t dim)
+        {
+            auto matrix = std::vector<raw_t>(static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim));
+            read_min_dbm(graph, dim, matrix.data());
+            return NativeDBM(dbm::dbm_t(matrix.data(), dim));
+        }
+
         NativeDBM copy() const { return NativeDBM(dbm_); }
 
+        static std::size_t live_count() { return live_count_; }
+
         cindex_t get_dimension() const { return dbm_.getDimension(); }
 
         std::string to_string(const std::vector<std::string>& names, bool full = false) const
@@ -103,6 +426,35 @@ namespace
             return std::vector<int32_t>(matrix, matrix + (dim * dim));
         }
 
+        double volume(const std::vector<int32_t>& upper_bounds, std::size_t samples, std::optional<uint64_t> seed) const
+        {
+            const auto dim = dbm_.getDimension();
+            if (upper_bounds.size() != static_cast<std::size_t>(dim)) {
+                throw std::invalid_argument("Bound count does not match DBM dimension.");
+            }
+            auto cells = std::vector<raw_t>{};
+            {
+                const KernelLock lock;
+                cells = raw_matrix();
+            }
+            py::gil_scoped_release release;
+            return disjoint_volume(std::move(cells), dim, upper_bounds, samples, seed);
+        }
+
+        py::buffer_info buffer() const
+        {
+            // The snapshot never mutates its handle and copy-on-write keeps
+            // the shared matrix intact, so the view stays valid for the
+            // lifetime of this object.
+            const auto dim = static_cast<py::ssize_t>(dbm_.isEmpty() ? 0 : dbm_.getDimension());
+            const raw_t* matrix = dim == 0 ? nullptr : dbm_();
+            return py::buffer_info(const_cast<raw_t*>(matrix), static_cast<py::ssize_t>(sizeof(raw_t)),
+                                   py::format_descriptor<raw_t>::format(), 2, {dim, dim},
+                                   {static_cast<py::ssize_t>(sizeof(raw_t)) * dim,
+                                    static_cast<py::ssize_t>(sizeof(raw_t))},
+                                   true);
+        }
+
         std::vector<int32_t> to_min_dbm(bool minimize_graph = true, bool try_constraints_16 = true) const
         {
             if (dbm_.isEmpty()) {
@@ -121,6 +473,8 @@ namespace
         }
 
     private:
+        NativeDBM(const dbm::dbm_t& dbm, const KernelLock&): dbm_(dbm) { ++live_count_; }
+
         void ensure_name_count(std::size_t count) const
         {
             if (count != static_cast<std::size_t>(dbm_.getDimension())) {
@@ -128,13 +482,17 @@ namespace
             }
         }
 
+        KernelLockSlot release_lock_;
         dbm::dbm_t dbm_;
+        static std::atomic<std::size_t> live_count_;
     };
 
+    std::atomic<std::size_t> NativeDBM::live_count_{0};
+
     class NativeFederation
     {
     public:
-        explicit NativeFederation(cindex_t dim): fed_(dim) {}
+        explicit NativeFederation(cindex_t dim): NativeFederation(dim, KernelLock()) {}
 
         static NativeFederation from_dbm_list(const std::vector<std::vector<int32_t>>& dbms, cindex_t dim)
         {
@@ -146,17 +504,319 @@ namespace
             return NativeFederation(fed);
         }
 
-        NativeFederation(cindex_t dim, const NativeConstraint& constraint): fed_(dim)
+        static NativeFederation from_raw_buffer(const py::buffer& dbms, cindex_t dim, bool validate = true)
         {
+            const auto info = pyudbm::binding::request_int32_buffer(dbms, "DBM tensor");
+            const auto cells = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            const auto size = static_cast<std::size_t>(info.size);
+            if (cells == 0 || size % cells != 0) {
+                throw std::invalid_argument(
+                    "DBM tensor size does not match the supplied dimension. Expected n * dim * dim raw cells."
+                );
+            }
+
+            const auto* matrices = static_cast<const raw_t*>(info.ptr);
+            py::gil_scoped_release release;
+            const KernelLock lock;
+            auto fed = dbm::fed_t(dim);
+            for (std::size_t offset = 0; offset < size; offset += cells) {
+                if (validate && !dbm_isValid(matrices + offset, dim)) {
+                    throw std::invalid_argument(
+                        "Supplied raw DBM matrix at index " + std::to_string(offset / cells) + " is not valid."
+                    );
+                }
+                fed.add(matrices + offset, dim);
+            }
+            return NativeFederation(fed);
+        }
+
+        static NativeFederation from_min_dbm_bytes(const std::string& payload, cindex_t dim)
+        {
+            py::gil_scoped_release release;
+            const KernelLock lock;
+            auto fed = dbm::fed_t(dim);
+            auto matrix = std::vector<raw_t>(static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim));
+            auto graph = std::vector<int32_t>{};
+            std::size_t offset = 0;
+            while (offset < payload.size()) {
+                uint32_t words = 0;
+                if (payload.size() - offset < sizeof(words)) {
+                    throw std::invalid_argument("Supplied minimal DBM payload is truncated.");
+                }
+                std::memcpy(&words, payload.data() + offset, sizeof(words));
+                offset += sizeof(words);
+                const auto size = static_cast<std::size_t>(words) * sizeof(int32_t);
+                if (payload.size() - offset < size) {
+                    throw std::invalid_argument("Supplied minimal DBM payload is truncated.");
+                }
+                graph.resize(words);
+                std::memcpy(graph.data(), payload.data() + offset, size);
+                offset += size;
+                read_min_dbm(graph, dim, matrix.data());
+                fed.add(matrix.data(), dim);
+            }
+            return NativeFederation(fed);
+        }
+
+        // Build one DBM from a flat (n, 4) table of (i, j, bound, is_strict)
+        // rows, tightening every constraint and closing the matrix only once.
+        static NativeFederation from_constraints(const py::buffer& constraints, cindex_t dim)
+        {
+            const auto info = pyudbm::binding::request_int32_buffer(constraints, "Constraint table");
+            const auto size = static_cast<std::size_t>(info.size);
+            if (size % 4 != 0) {
+                throw std::invalid_argument("Constraint table must hold (i, j, bound, is_strict) rows of 4 values.");
+            }
+
+            const auto* rows = static_cast<const int32_t*>(info.ptr);
+            auto parsed = std::vector<constraint_t>{};
+            parsed.reserve(size / 4);
+            for (std::size_t offset = 0; offset < size; offset += 4) {
+                const auto i = rows[offset];
+                const auto j = rows[offset + 1];
+                const auto bound = rows[offset + 2];
+                const auto row = std::to_string(offset / 4);
+                if (i < 0 || j < 0 || static_cast<cindex_t>(i) >= dim || static_cast<cindex_t>(j) >= dim || i == j) {
+                    throw std::invalid_argument("Constraint row " + row + " uses invalid DBM indices.");
+                }
+                if (bound <= -dbm_INFINITY || bound >= dbm_INFINITY) {
+                    throw std::invalid_argument("Constraint row " + row + " has an out-of-range bound.");
+                }
+                parsed.push_back(dbm_constraint2(static_cast<cindex_t>(i), static_cast<cindex_t>(j), bound,
+                                                 rows[offset + 3] != 0));
+            }
+
+            py::gil_scoped_release release;
+            auto matrix = std::vector<raw_t>(static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim));
+            dbm_init(matrix.data(), dim);
+            const auto non_empty = parsed.empty() || dbm_constrainN(matrix.data(), dim, parsed.data(), parsed.size());
+
+            const KernelLock lock;
+            auto fed = dbm::fed_t(dim);
+            if (non_empty) {
+                fed.add(matrix.data(), dim);
+            }
+            return NativeFederation(fed);
+        }
+
+        NativeFederation(cindex_t dim, const NativeConstraint& constraint): NativeFederation(dim, KernelLock())
+        {
+            const KernelLock lock;
             fed_.setInit();
             fed_ &= constraint.get();
         }
 
-        NativeFederation(const NativeFederation&) = default;
-        NativeFederation& operator=(const NativeFederation&) = default;
+        NativeFederation(const NativeFederation& other): NativeFederation(other.fed_, KernelLock()) {}
+        ~NativeFederation()
+        {
+            --live_count_;
+            release_lock_.acquire();
+        }
+
+        NativeFederation& operator=(const NativeFederation& other)
+        {
+            const KernelLock lock;
+            fed_ = other.fed_;
+            return *this;
+        }
 
+        // fed_t copies share the reference-counted federation and DBM storage;
+        // UDBM duplicates it on the first mutation of either handle.
         NativeFederation copy() const { return NativeFederation(fed_); }
 
+        // Copy every DBM matrix into freshly allocated storage, so the result
+        // shares nothing with this federation even before it is written.
+        NativeFederation deep_copy() const
+        {
+            const auto dim = fed_.getDimension();
+            auto fed = dbm::fed_t(dim);
+            for (const auto& dbm : fed_) {
+                fed.add(dbm(), dim);
+            }
+            return NativeFederation(fed);
+        }
+
+        bool shares_storage_with(const NativeFederation& other) const { return fed_.sameAs(other.fed_); }
+
+        static std::size_t live_count() { return live_count_; }
+
+        // (DBM count, dimension, matrix bytes, minimal-graph edges per DBM,
+        // DBMs that mergeReduce(0, 0) would remove).
+        std::tuple<std::size_t, cindex_t, std::size_t, std::vector<std::size_t>, std::size_t> stats() const
+        {
+            const auto dim = fed_.getDimension();
+            const auto cells = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            auto bits = std::vector<uint32_t>((cells + 31) / 32);
+            auto edges = std::vector<std::size_t>{};
+            edges.reserve(fed_.size());
+            for (const auto& dbm : fed_) {
+                std::fill(bits.begin(), bits.end(), 0U);
+                edges.push_back(dbm_analyzeForMinDBM(dbm(), dim, bits.data()));
+            }
+
+            auto reduced = fed_;
+            reduced.mergeReduce(0, 0);
+            return std::make_tuple(fed_.size(), dim, fed_.size() * cells * sizeof(raw_t), std::move(edges),
+                                   fed_.size() - reduced.size());
+        }
+
+        // Pairwise relation codes (row i against column j) of federations that
+        // share one dimension. Matrices are copied under the lock once; the
+        // hash / envelope pre-filters and the DBM-wise inclusion checks then
+        // run on worker threads. With ``exact`` the pairs that check leaves
+        // undecided are settled by fed_t::le, which needs the kernel lock.
+        static RawBuffer relation_matrix(const std::vector<const NativeFederation*>& feds, bool exact,
+                                         std::size_t threads)
+        {
+            const auto count = feds.size();
+            auto codes = std::vector<int32_t>(count * count, base_DIFFERENT);
+            if (count == 0) {
+                return RawBuffer(std::move(codes), {0, 0});
+            }
+            const auto dim = feds.front()->fed_.getDimension();
+            for (const auto* fed : feds) {
+                if (fed->fed_.getDimension() != dim) {
+                    throw std::invalid_argument("Federation dimensions do not match.");
+                }
+            }
+
+            py::gil_scoped_release release;
+            const auto cells = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            auto matrices = std::vector<std::vector<raw_t>>(count);
+            auto hashes = std::vector<std::uint32_t>(count);
+            {
+                const KernelLock lock;
+                for (std::size_t index = 0; index < count; ++index) {
+                    matrices[index] = feds[index]->raw_cells();
+                    hashes[index] = feds[index]->fed_.hash();
+                }
+            }
+
+            // Cell-wise maximum over the closed DBMs, i.e. the convex hull. A
+            // subset's hull never exceeds its superset's, so a larger cell
+            // rules the inclusion out; an empty federation keeps the minimum.
+            auto envelopes = std::vector<std::vector<raw_t>>(count);
+            for (std::size_t index = 0; index < count; ++index) {
+                auto& envelope = envelopes[index];
+                envelope.assign(cells, std::numeric_limits<raw_t>::min());
+                for (std::size_t offset = 0; offset < matrices[index].size(); offset += cells) {
+                    for (std::size_t cell = 0; cell < cells; ++cell) {
+                        envelope[cell] = std::max(envelope[cell], matrices[index][offset + cell]);
+                    }
+                }
+            }
+
+            const auto hull_within = [&](std::size_t left, std::size_t right) {
+                const auto& inner = envelopes[left];
+                const auto& outer = envelopes[right];
+                return std::equal(inner.begin(), inner.end(), outer.begin(),
+                                  [](raw_t a, raw_t b) { return a <= b; });
+            };
+            const auto covered_by = [&](std::size_t left, std::size_t right) {
+                const auto& inner = matrices[left];
+                const auto& outer = matrices[right];
+                for (std::size_t a = 0; a < inner.size(); a += cells) {
+                    auto found = false;
+                    for (std::size_t b = 0; b < outer.size() && !found; b += cells) {
+                        found = dbm_isSubsetEq(inner.data() + a, outer.data() + b, dim);
+                    }
+                    if (!found) {
+                        return false;
+                    }
+                }
+                return true;
+            };
+
+            // 0 = ruled out, 1 = proven, 2 = left for the exact pass.
+            auto inclusion = std::vector<unsigned char>(count * count, 0);
+            const auto relate_row = [&](std::size_t row) {
+                inclusion[row * count + row] = 1;
+                for (std::size_t column = row + 1; column < count; ++column) {
+                    if (hashes[row] == hashes[column] && matrices[row] == matrices[column]) {
+                        inclusion[row * count + column] = 1;
+                        inclusion[column * count + row] = 1;
+                        continue;
+                    }
+                    if (hull_within(row, column)) {
+                        inclusion[row * count + column] = covered_by(row, column) ? 1 : 2;
+                    }
+                    if (hull_within(column, row)) {
+                        inclusion[column * count + row] = covered_by(column, row) ? 1 : 2;
+                    }
+                }
+            };
+
+            if (threads == 0) {
+                threads = std::max(1U, std::thread::hardware_concurrency());
+            }
+            threads = std::min(threads, count);
+            if (threads <= 1) {
+                for (std::size_t row = 0; row < count; ++row) {
+                    relate_row(row);
+                }
+            } else {
+                // An exception escaping a std::thread body would call
+                // std::terminate, so workers park it and the caller rethrows
+                // the first one after every thread has been joined.
+                auto next_row = std::atomic<std::size_t>{0};
+                auto failures = std::vector<std::exception_ptr>(threads);
+                auto workers = std::vector<std::thread>{};
+                workers.reserve(threads);
+                const auto join_all = [&]() {
+                    for (auto& worker : workers) {
+                        worker.join();
+                    }
+                };
+                try {
+                    for (std::size_t worker = 0; worker < threads; ++worker) {
+                        workers.emplace_back([&, worker]() {
+                            try {
+                                for (auto row = next_row++; row < count; row = next_row++) {
+                                    relate_row(row);
+                                }
+                            } catch (...) {
+                                failures[worker] = std::current_exception();
+                                next_row = count;
+                            }
+                        });
+                    }
+                } catch (...) {
+                    next_row = count;
+                    join_all();
+                    throw;
+                }
+                join_all();
+                for (const auto& failure : failures) {
+                    if (failure) {
+                        std::rethrow_exception(failure);
+                    }
+                }
+            }
+
+            if (exact && std::find(inclusion.begin(), inclusion.end(), 2) != inclusion.end()) {
+                const KernelLock lock;
+                for (std::size_t pair = 0; pair < inclusion.size(); ++pair) {
+                    if (inclusion[pair] == 2) {
+                        inclusion[pair] = feds[pair / count]->fed_.le(feds[pair % count]->fed_) ? 1 : 0;
+                    }
+                }
+            }
+
+            for (std::size_t row = 0; row < count; ++row) {
+                for (std::size_t column = 0; column < count; ++column) {
+                    auto code = static_cast<int32_t>(base_DIFFERENT);
+                    if (inclusion[row * count + column] == 1) {
+                        code |= base_SUBSET;
+                    }
+                    if (inclusion[column * count + row] == 1) {
+                        code |= base_SUPERSET;
+                    }
+                    codes[row * count + column] = code;
+                }
+            }
+            return RawBuffer(std::move(codes), {static_cast<py::ssize_t>(count), static_cast<py::ssize_t>(count)});
+        }
+
         cindex_t get_dimension() const { return fed_.getDimension(); }
         std::size_t size() const { return fed_.size(); }
         bool is_empty() const { return fed_.isEmpty(); }
@@ -179,6 +839,147 @@ namespace
             return result;
         }
 
+        // Row-major copy of every DBM matrix, in federation order.
+        std::vector<raw_t> raw_cells() const
+        {
+            const KernelLock lock;
+            const auto dim = static_cast<std::size_t>(fed_.getDimension());
+            auto cells = std::vector<raw_t>{};
+            cells.reserve(fed_.size() * dim * dim);
+            for (const auto& dbm : fed_) {
+                const raw_t* matrix = dbm();
+                cells.insert(cells.end(), matrix, matrix + (dim * dim));
+            }
+            return cells;
+        }
+
+        using ConstraintRow = std::tuple<cindex_t, cindex_t, int32_t, bool>;
+
+        // Minimal-graph constraints of every DBM as (i, j, bound, is_strict)
+        // rows, read from the dbm_analyzeForMinDBM bit matrix.
+        std::vector<std::vector<ConstraintRow>> to_constraints() const
+        {
+            const auto dim = fed_.getDimension();
+            const auto cells = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            auto bits = std::vector<uint32_t>((cells + 31) / 32);
+            auto result = std::vector<std::vector<ConstraintRow>>{};
+            result.reserve(fed_.size());
+            for (const auto& dbm : fed_) {
+                const raw_t* matrix = dbm();
+                std::fill(bits.begin(), bits.end(), 0U);
+                auto rows = std::vector<ConstraintRow>{};
+                rows.reserve(dbm_analyzeForMinDBM(matrix, dim, bits.data()));
+                for (std::size_t cell = 0; cell < cells; ++cell) {
+                    if (bits[cell / 32] & (1U << (cell % 32))) {
+                        const auto value = matrix[cell];
+                        rows.emplace_back(static_cast<cindex_t>(cell / dim), static_cast<cindex_t>(cell % dim),
+                                          dbm_raw2bound(value), dbm_rawIsStrict(value));
+                    }
+                }
+                result.push_back(std::move(rows));
+            }
+            return result;
+        }
+
+        // Rebuild every DBM over ``sources.size()`` clocks, where new clock k is
+        // old clock sources[k] or, when that is negative, a fresh unconstrained
+        // clock. Dropping rows and columns of a closed DBM is exact existential
+        // elimination, so only fresh clocks need the final close.
+        NativeFederation remap(const std::vector<int32_t>& sources) const
+        {
+            const auto old_dim = fed_.getDimension();
+            const auto new_dim = static_cast<cindex_t>(sources.size());
+            if (new_dim == 0 || sources[0] != 0) {
+                throw std::invalid_argument("Clock remapping must keep the reference clock at index 0.");
+            }
+            for (const auto source : sources) {
+                if (source >= static_cast<int32_t>(old_dim)) {
+                    throw std::invalid_argument("Clock remapping refers to a clock outside the federation.");
+                }
+            }
+            const auto has_fresh =
+                std::any_of(sources.begin(), sources.end(), [](int32_t source) { return source < 0; });
+
+            py::gil_scoped_release release;
+            const auto old_cells = raw_cells();
+            const auto old_size = static_cast<std::size_t>(old_dim) * static_cast<std::size_t>(old_dim);
+            const auto new_size = static_cast<std::size_t>(new_dim) * static_cast<std::size_t>(new_dim);
+            auto new_cells = std::vector<raw_t>(old_cells.size() / old_size * new_size);
+            for (std::size_t index = 0; index < old_cells.size() / old_size; ++index) {
+                const raw_t* source = old_cells.data() + index * old_size;
+                raw_t* target = new_cells.data() + index * new_size;
+                for (cindex_t i = 0; i < new_dim; ++i) {
+                    for (cindex_t j = 0; j < new_dim; ++j) {
+                        auto& cell = target[i * new_dim + j];
+                        if (sources[i] >= 0 && sources[j] >= 0) {
+                            cell = source[static_cast<std::size_t>(sources[i]) * old_dim + sources[j]];
+                        } else if (i == j || i == 0) {
+                            cell = dbm_LE_ZERO;
+                        } else {
+                            cell = dbm_LS_INFINITY;
+                        }
+                    }
+                }
+                if (has_fresh) {
+                    dbm_close(target, new_dim);
+                }
+            }
+
+            const KernelLock lock;
+            auto fed = dbm::fed_t(new_dim);
+            for (std::size_t offset = 0; offset < new_cells.size(); offset += new_size) {
+                fed.add(new_cells.data() + offset, new_dim);
+            }
+            return NativeFederation(fed);
+        }
+
+        // Row-major matrices of pairwise disjoint DBMs covering the federation:
+        // each DBM minus the union of the DBMs before it.
+        std::vector<raw_t> disjoint_cells() const
+        {
+            const KernelLock lock;
+            const auto dim = fed_.getDimension();
+            const auto size = static_cast<std::size_t>(dim) * static_cast<std::size_t>(dim);
+            auto seen = dbm::fed_t(dim);
+            auto cells = std::vector<raw_t>{};
+            for (const auto& dbm : fed_) {
+                auto piece = dbm::fed_t(dim);
+                piece.add(dbm);
+                piece -= seen;
+                for (const auto& part : piece) {
+                    const raw_t* matrix = part();
+                    cells.insert(cells.end(), matrix, matrix + size);
+                }
+                seen.add(dbm);
+            }
+            return cells;
+        }
+
+        RawBuffer to_raw_buffer() const
+        {
+            const auto dim = static_cast<py::ssize_t>(fed_.getDimension());
+            return RawBuffer(raw_cells(), {static_cast<py::ssize_t>(fed_.size()), dim, dim});
+        }
+
+        std::string to_min_dbm_bytes(bool minimize_graph = true, bool try_constraints_16 = true) const
+        {
+            // Every DBM becomes a uint32 word count followed by its minimal
+            // graph words, all in native byte order.
+            auto payload = std::string{};
+            for (const auto& dbm : fed_) {
+                int32_t* memory = dbm.writeToMinDBMWithOffset(minimize_graph, try_constraints_16, base_mallocator, 0);
+                if (memory == nullptr) {
+                    continue;
+                }
+                const auto size = dbm_getSizeOfMinDBM(memory);
+                const auto words = static_cast<uint32_t>(size);
+                payload.append(reinterpret_cast<const char*>(&words), sizeof(words));
+                payload.append(reinterpret_cast<const char*>(memory), size * sizeof(int32_t));
+                base_mallocator.deallocFunction(memory, size, base_mallocator.allocData);
+            }
+            return payload;
+        }
+
         NativeFederation and_op(const NativeFederation& other) const
         {
             ensure_same_dimension(other);
@@ -238,6 +1039,18 @@ namespace
         void up() { fed_.up(); }
         void down() { fed_.down(); }
         void merge_reduce(std::size_t skip, int expensive_try) { fed_.mergeReduce(skip, expensive_try); }
+
+        // Merge-reduce only once the federation holds more than ``threshold``
+        // DBMs; return how many DBMs that removed, or nothing if it did not run.
+        std::optional<std::size_t> merge_reduce_above(std::size_t threshold, int expensive_try)
+        {
+            const auto before = fed_.size();
+            if (before <= threshold) {
+                return std::nullopt;
+            }
+            fed_.mergeReduce(0, expensive_try);
+            return before - fed_.size();
+        }
         void free_clock(cindex_t clock) { fed_.freeClock(clock); }
         void set_zero() { fed_.setZero(); }
         void set_init() { fed_.setInit(); }
@@ -292,14 +1105,184 @@ namespace
             return fed_.contains(point);
         }
 
-        void extrapolate_max_bounds(const std::vector<int32_t>& max_bounds)
+        RawBuffer contains_int_points(const py::buffer& points) const
+        {
+            return contains_points<int32_t>(
+                pyudbm::binding::request_int32_buffer(points, "Point array"),
+                [](const int32_t* point, const raw_t* matrix, cindex_t dim) {
+                    return dbm_isPointIncluded(point, matrix, dim);
+                }
+            );
+        }
+
+        RawBuffer contains_float_points(const py::buffer& points) const
+        {
+            return contains_points<double>(
+                pyudbm::binding::request_contiguous_buffer<double>(points, "Point array", "float64"),
+                [](const double* point, const raw_t* matrix, cindex_t dim) {
+                    return dbm_isRealPointIncluded(point, matrix, dim);
+                }
+            );
+        }
+
+        RealBuffer sample_real(std::size_t n, const std::vector<int32_t>& upper_bounds,
+                               std::optional<uint64_t> seed) const
+        {
+            ensure_point_count(upper_bounds.size());
+            const auto dim = fed_.getDimension();
+            auto cells = raw_cells();
+            py::gil_scoped_release release;
+            const auto sampler = ZoneSampler(std::move(cells), dim, upper_bounds, false);
+            return RealBuffer(sampler.draw<double>(n, seed, dbm_isRealPointIncluded),
+                              {static_cast<py::ssize_t>(n), static_cast<py::ssize_t>(dim - 1)});
+        }
+
+        double volume(const std::vector<int32_t>& upper_bounds, std::size_t samples, std::optional<uint64_t> seed) const
+        {
+            ensure_point_count(upper_bounds.size());
+            const auto dim = fed_.getDimension();
+            py::gil_scoped_release release;
+            auto cells = dim > 3 ? raw_cells() : disjoint_cells();
+            return disjoint_volume(std::move(cells), dim, upper_bounds, samples, seed);
+        }
+
+        RawBuffer sample_int(std::size_t n, const std::vector<int32_t>& upper_bounds,
+                             std::optional<uint64_t> seed) const
+        {
+            ensure_point_count(upper_bounds.size());
+            const auto dim = fed_.getDimension();
+            auto cells = raw_cells();
+            py::gil_scoped_release release;
+            const auto sampler = ZoneSampler(std::move(cells), dim, upper_bounds, true);
+            return RawBuffer(sampler.draw<int32_t>(n, seed, dbm_isPointIncluded),
+                             {static_cast<py::ssize_t>(n), static_cast<py::ssize_t>(dim - 1)});
+        }
+
+        NativeFederation successor(const NativeFederation* guard,
+                                   const std::vector<std::pair<cindex_t, int32_t>>& updates,
+                                   const NativeFederation* invariant, const std::vector<int32_t>& max_bounds,
+                                   bool delay) const
+        {
+            ensure_optional_operands(guard, invariant, updates);
+            if (!max_bounds.empty()) {
+                ensure_point_count(max_bounds.size());
+            }
+
+            dbm::fed_t result(fed_);
+            if (guard != nullptr) {
+                result &= guard->fed_;
+                if (result.isEmpty()) {
+                    return NativeFederation(result);
+                }
+            }
+            for (const auto& update : updates) {
+                result.updateValue(update.first, update.second);
+            }
+            if (invariant != nullptr) {
+                result &= invariant->fed_;
+                if (result.isEmpty()) {
+                    return NativeFederation(result);
+                }
+            }
+            if (delay) {
+                result.up();
+                if (invariant != nullptr) {
+                    result &= invariant->fed_;
+                }
+            }
+            if (!max_bounds.empty()) {
+                result.extrapolateMaxBounds(max_bounds.data());
+            }
+            return NativeFederation(result);
+        }
+
+        NativeFederation predecessor(const NativeFederation* guard,
+                                     const std::vector<std::pair<cindex_t, int32_t>>& updates,
+                                     const NativeFederation* invariant, bool delay) const
+        {
+            ensure_optional_operands(guard, invariant, updates);
+
+            dbm::fed_t result(fed_);
+            for (const auto& update : updates) {
+                result &= dbm_constraint2(update.first, 0, update.second, false);
+                result &= dbm_constraint2(0, update.first, -update.second, false);
+            }
+            for (const auto& update : updates) {
+                result.freeClock(update.first);
+            }
+            if (guard != nullptr) {
+                result &= guard->fed_;
+            }
+            if (invariant != nullptr) {
+                result &= invariant->fed_;
+            }
+            if (result.isEmpty()) {
+                return NativeFederation(result);
+            }
+            if (delay) {
+                result.down();
+                if (invariant != nullptr) {
+                    result &= invariant->fed_;
+                }
+            }
+            return NativeFederation(result);
+        }
+
+        void extrapolate_max_bounds(const std::vector<int32_t>& max_bounds, bool diagonal = false)
         {
             ensure_point_count(max_bounds.size());
-            fed_.extrapolateMaxBounds(max_bounds.data());
+            if (diagonal) {
+                fed_.diagonalExtrapolateMaxBounds(max_bounds.data());
+            } else {
+                fed_.extrapolateMaxBounds(max_bounds.data());
+            }
+        }
+
+        void extrapolate_lu_bounds(const std::vector<int32_t>& lower_bounds, const std::vector<int32_t>& upper_bounds,
+                                   bool diagonal = false)
+        {
+            ensure_point_count(lower_bounds.size());
+            ensure_point_count(upper_bounds.size());
+            if (diagonal) {
+                fed_.diagonalExtrapolateLUBounds(lower_bounds.data(), upper_bounds.data());
+            } else {
+                fed_.extrapolateLUBounds(lower_bounds.data(), upper_bounds.data());
+            }
         }
 
     private:
-        explicit NativeFederation(const dbm::fed_t& fed): fed_(fed) {}
+        explicit NativeFederation(const dbm::fed_t& fed): NativeFederation(fed, KernelLock()) {}
+        NativeFederation(cindex_t dim, const KernelLock&): fed_(dim) { ++live_count_; }
+        NativeFederation(const dbm::fed_t& fed, const KernelLock&): fed_(fed) { ++live_count_; }
+
+        template <typename Value, typename Included>
+        RawBuffer contains_points(const py::buffer_info& info, Included included) const
+        {
+            const auto dim = static_cast<std::size_t>(fed_.getDimension());
+            if (info.ndim != 2 || static_cast<std::size_t>(info.shape[1]) + 1 != dim) {
+                throw std::invalid_argument(
+                    "Point array shape does not match federation dimension. Expected (n, dim - 1) clock values."
+                );
+            }
+
+            const auto count = static_cast<std::size_t>(info.shape[0]);
+            const auto* values = static_cast<const Value*>(info.ptr);
+            auto mask = std::vector<int32_t>(count, 0);
+            py::gil_scoped_release release;
+            const KernelLock lock;
+            // Row 0 of every point is the reference clock, which is always 0.
+            auto point = std::vector<Value>(dim, Value(0));
+            for (std::size_t index = 0; index < count; ++index) {
+                std::copy(values + index * (dim - 1), values + (index + 1) * (dim - 1), point.begin() + 1);
+                for (const auto& dbm : fed_) {
+                    if (included(point.data(), dbm(), static_cast<cindex_t>(dim))) {
+                        mask[index] = 1;
+                        break;
+                    }
+                }
+            }
+            return RawBuffer(std::move(mask), {static_cast<py::ssize_t>(count)});
+        }
 
         void ensure_same_dimension(const NativeFederation& other) const
         {
@@ -308,6 +1291,22 @@ namespace
             }
         }
 
+        void ensure_optional_operands(const NativeFederation* guard, const NativeFederation* invariant,
+                                      const std::vector<std::pair<cindex_t, int32_t>>& updates) const
+        {
+            if (guard != nullptr) {
+                ensure_same_dimension(*guard);
+            }
+            if (invariant != nullptr) {
+                ensure_same_dimension(*invariant);
+            }
+            for (const auto& update : updates) {
+                if (update.first == 0 || update.first >= fed_.getDimension()) {
+                    throw std::out_of_range("Clock index is out of range.");
+                }
+            }
+        }
+
         void ensure_name_count(std::size_t count) const
         {
             if (count != static_cast<std::size_t>(fed_.getDimension())) {
@@ -322,7 +1321,159 @@ namespace
             }
         }
 
+        KernelLockSlot release_lock_;
         dbm::fed_t fed_;
+        static std::atomic<std::size_t> live_count_;
+    };
+
+    std::atomic<std::size_t> NativeFederation::live_count_{0};
+
+    // Passed-list style store of DBMs, bucketed by an integer discrete key.
+    // Entries are plain matrix copies, so inclusion checks run on the C
+    // kernel functions without touching the shared UDBM allocator state.
+    class NativeSubsumptionIndex
+    {
+    public:
+        explicit NativeSubsumptionIndex(cindex_t dim): dim_(dim), cells_(static_cast<std::size_t>(dim) * dim) {}
+
+        cindex_t get_dimension() const { return dim_; }
+
+        std::size_t size() const
+        {
+            const std::lock_guard<std::mutex> guard(mutex_);
+            auto total = std::size_t{0};
+            for (const auto& bucket : buckets_) {
+                total += bucket.second.size();
+            }
+            return total;
+        }
+
+        std::size_t bucket_size(int64_t key) const
+        {
+            const std::lock_guard<std::mutex> guard(mutex_);
+            const auto found = buckets_.find(key);
+            return found == buckets_.end() ? 0 : found->second.size();
+        }
+
+        std::size_t insert(int64_t key, const NativeFederation& fed)
+        {
+            const auto entries = to_entries(fed);
+            py::gil_scoped_release release;
+            const std::lock_guard<std::mutex> guard(mutex_);
+            auto& bucket = buckets_[key];
+            auto added = std::size_t{0};
+            for (const auto& entry : entries) {
+                if (!covered(bucket, entry)) {
+                    bucket.push_back(entry);
+                    ++added;
+                }
+            }
+            if (bucket.empty()) {
+                buckets_.erase(key);
+            }
+            return added;
+        }
+
+        bool is_covered(int64_t key, const NativeFederation& fed) const
+        {
+            const auto entries = to_entries(fed);
+            py::gil_scoped_release release;
+            const std::lock_guard<std::mutex> guard(mutex_);
+            const auto found = buckets_.find(key);
+            for (const auto& entry : entries) {
+                if (found == buckets_.end() || !covered(found->second, entry)) {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        std::size_t remove_covered_by(int64_t key, const NativeFederation& fed)
+        {
+            const auto entries = to_entries(fed);
+            py::gil_scoped_release release;
+            const std::lock_guard<std::mutex> guard(mutex_);
+            const auto found = buckets_.find(key);
+            if (found == buckets_.end()) {
+                return 0;
+            }
+
+            auto& bucket = found->second;
+            const auto before = bucket.size();
+            bucket.erase(std::remove_if(bucket.begin(), bucket.end(),
+                                        [&](const Entry& stored) { return covered(entries, stored); }),
+                         bucket.end());
+            const auto removed = before - bucket.size();
+            if (bucket.empty()) {
+                buckets_.erase(found);
+            }
+            return removed;
+        }
+
+        RawBuffer bucket_cells(int64_t key) const
+        {
+            const std::lock_guard<std::mutex> guard(mutex_);
+            auto cells = std::vector<int32_t>{};
+            const auto found = buckets_.find(key);
+            const auto count = found == buckets_.end() ? std::size_t{0} : found->second.size();
+            cells.reserve(count * cells_);
+            for (std::size_t index = 0; index < count; ++index) {
+                const auto& matrix = found->second[index].matrix;
+                cells.insert(cells.end(), matrix.begin(), matrix.end());
+            }
+            return RawBuffer(std::move(cells), {static_cast<py::ssize_t>(count), static_cast<py::ssize_t>(dim_),
+                                                static_cast<py::ssize_t>(dim_)});
+        }
+
+        void clear()
+        {
+            const std::lock_guard<std::mutex> guard(mutex_);
+            buckets_.clear();
+        }
+
+    private:
+        struct Entry
+        {
+            // Raw cells grow monotonically with the zone, so a subset never
+            // has a larger cell sum; this rejects most candidates cheaply.
+            int64_t weight;
+            std::vector<raw_t> matrix;
+        };
+
+        std::vector<Entry> to_entries(const NativeFederation& fed) const
+        {
+            if (fed.get_dimension() != dim_) {
+                throw std::invalid_argument("Federation dimension does not match the subsumption index dimension.");
+            }
+
+            const auto cells = fed.raw_cells();
+            auto entries = std::vector<Entry>{};
+            entries.reserve(cells.size() / cells_);
+            for (auto offset = std::size_t{0}; offset < cells.size(); offset += cells_) {
+                auto entry = Entry{0, std::vector<raw_t>(cells.begin() + offset, cells.begin() + offset + cells_)};
+                for (const auto value : entry.matrix) {
+                    entry.weight += value;
+                }
+                entries.push_back(std::move(entry));
+            }
+            return entries;
+        }
+
+        bool covered(const std::vector<Entry>& stored, const Entry& entry) const
+        {
+            for (const auto& candidate : stored) {
+                if (candidate.weight >= entry.weight &&
+                    dbm_isSubsetEq(entry.matrix.data(), candidate.matrix.data(), dim_)) {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        cindex_t dim_;
+        std::size_t cells_;
+        mutable std::mutex mutex_;
+        std::unordered_map<int64_t, std::vector<Entry>> buckets_;
     };
 }  // namespace
 
@@ -330,6 +1481,8 @@ PYBIND11_MODULE(_udbm, m)
 {
     m.doc() = "Thin pybind11 bindings for the legacy-style pyudbm federation API.";
 
+    pyudbm::binding::bind_raw_buffer(m);
+
     py::class_<NativeConstraint>(m, "_NativeConstraint")
         .def(py::init<cindex_t, cindex_t, int32_t, bool>(), py::arg("i"), py::arg("j"), py::arg("bound"),
              py::arg("is_strict"))
@@ -341,51 +1494,118 @@ PYBIND11_MODULE(_udbm, m)
                    " value=" + std::to_string(constraint.value()) + ">";
         });
 
-    py::class_<NativeDBM>(m, "_NativeDBM")
-        .def_static("from_raw_matrix", &NativeDBM::from_raw_matrix, py::arg("raw_matrix"), py::arg("dim"))
-        .def("copy", &NativeDBM::copy)
-        .def("get_dimension", &NativeDBM::get_dimension)
-        .def("to_string", &NativeDBM::to_string, py::arg("names"), py::arg("full") = false)
-        .def("raw_matrix", &NativeDBM::raw_matrix)
-        .def("to_min_dbm", &NativeDBM::to_min_dbm, py::arg("minimize_graph") = true,
+    py::class_<NativeDBM>(m, "_NativeDBM", py::buffer_protocol())
+        .def_buffer([](const NativeDBM& dbm) {
+            const KernelLock lock;
+            return dbm.buffer();
+        })
+        .def_static("from_raw_matrix", &NativeDBM::from_raw_matrix, released_kernel_guard(), py::arg("raw_matrix"),
+                    py::arg("dim"))
+        .def_static("from_min_dbm", &NativeDBM::from_min_dbm, released_kernel_guard(), py::arg("graph"),
+                    py::arg("dim"))
+        .def("copy", &NativeDBM::copy, kernel_guard())
+        .def_static("live_count", &NativeDBM::live_count)
+        .def("get_dimension", &NativeDBM::get_dimension, kernel_guard())
+        .def("to_string", &NativeDBM::to_string, released_kernel_guard(), py::arg("names"), py::arg("full") = false)
+        .def("raw_matrix", &NativeDBM::raw_matrix, kernel_guard())
+        .def("volume", &NativeDBM::volume, py::arg("upper_bounds"), py::arg("samples"), py::arg("seed").none(true))
+        .def("to_min_dbm", &NativeDBM::to_min_dbm, released_kernel_guard(), py::arg("minimize_graph") = true,
              py::arg("try_constraints_16") = true);
 
     py::class_<NativeFederation>(m, "_NativeFederation")
         .def(py::init<cindex_t>(), py::arg("dim"))
         .def(py::init<cindex_t, const NativeConstraint&>(), py::arg("dim"), py::arg("constraint"))
-        .def_static("from_dbm_list", &NativeFederation::from_dbm_list, py::arg("dbms"), py::arg("dim"))
-        .def("copy", &NativeFederation::copy)
-        .def("get_dimension", &NativeFederation::get_dimension)
-        .def("size", &NativeFederation::size)
-        .def("is_empty", &NativeFederation::is_empty)
-        .def("has_zero", &NativeFederation::has_zero)
-        .def("hash", &NativeFederation::hash)
-        .def("to_string", &NativeFederation::to_string, py::arg("names"), py::arg("full") = false)
-        .def("to_dbm_list", &NativeFederation::to_dbm_list)
-        .def("and_op", &NativeFederation::and_op, py::arg("other"))
-        .def("or_op", &NativeFederation::or_op, py::arg("other"))
-        .def("add_op", &NativeFederation::add_op, py::arg("other"))
-        .def("minus_op", &NativeFederation::minus_op, py::arg("other"))
-        .def("iand", &NativeFederation::iand, py::arg("other"))
-        .def("ior", &NativeFederation::ior, py::arg("other"))
-        .def("iadd", &NativeFederation::iadd, py::arg("other"))
-        .def("isub", &NativeFederation::isub, py::arg("other"))
-        .def("up", &NativeFederation::up)
-        .def("down", &NativeFederation::down)
-        .def("merge_reduce", &NativeFederation::merge_reduce, py::arg("skip") = 0, py::arg("expensive_try") = 0)
-        .def("free_clock", &NativeFederation::free_clock, py::arg("clock"))
-        .def("set_zero", &NativeFederation::set_zero)
-        .def("set_init", &NativeFederation::set_init)
-        .def("convex_hull", &NativeFederation::convex_hull)
-        .def("predt", &NativeFederation::predt, py::arg("other"))
-        .def("intern", &NativeFederation::intern)
-        .def("update_value", &NativeFederation::update_value, py::arg("clock"), py::arg("value"))
-        .def("eq", &NativeFederation::eq, py::arg("other"))
-        .def("lt", &NativeFederation::lt, py::arg("other"))
-        .def("gt", &NativeFederation::gt, py::arg("other"))
-        .def("le", &NativeFederation::le, py::arg("other"))
-        .def("ge", &NativeFederation::ge, py::arg("other"))
-        .def("contains_int", &NativeFederation::contains_int, py::arg("point"))
-        .def("contains_float", &NativeFederation::contains_float, py::arg("point"))
-        .def("extrapolate_max_bounds", &NativeFederation::extrapolate_max_bounds, py::arg("max_bounds"));
+        .def_static("from_dbm_list", &NativeFederation::from_dbm_list, released_kernel_guard(), py::arg("dbms"),
+                    py::arg("dim"))
+        .def_static("from_raw_buffer", &NativeFederation::from_raw_buffer, py::arg("dbms"), py::arg("dim"),
+                    py::arg("validate") = true)
+        .def_static("from_min_dbm_bytes", &NativeFederation::from_min_dbm_bytes, py::arg("payload"), py::arg("dim"))
+        .def_static("from_constraints", &NativeFederation::from_constraints, py::arg("constraints"), py::arg("dim"))
+        .def("copy", &NativeFederation::copy, kernel_guard())
+        .def("deep_copy", &NativeFederation::deep_copy, released_kernel_guard())
+        .def("shares_storage_with", &NativeFederation::shares_storage_with, kernel_guard(), py::arg("other"))
+        .def_static("live_count", &NativeFederation::live_count)
+        .def("stats", &NativeFederation::stats, released_kernel_guard())
+        .def_static("relation_matrix", &NativeFederation::relation_matrix, py::arg("feds"), py::arg("exact"),
+                    py::arg("threads"))
+        .def("get_dimension", &NativeFederation::get_dimension, kernel_guard())
+        .def("size", &NativeFederation::size, kernel_guard())
+        .def("is_empty", &NativeFederation::is_empty, kernel_guard())
+        .def("has_zero", &NativeFederation::has_zero, kernel_guard())
+        .def("hash", &NativeFederation::hash, kernel_guard())
+        .def("to_string", &NativeFederation::to_string, released_kernel_guard(), py::arg("names"),
+             py::arg("full") = false)
+        .def("to_dbm_list", &NativeFederation::to_dbm_list, kernel_guard())
+        .def("to_raw_buffer", &NativeFederation::to_raw_buffer, released_kernel_guard())
+        .def("to_constraints", &NativeFederation::to_constraints, released_kernel_guard())
+        .def("remap", &NativeFederation::remap, py::arg("sources"))
+        .def(
+            "to_min_dbm_bytes",
+            [](const NativeFederation& fed, bool minimize_graph, bool try_constraints_16) {
+                auto payload = std::string{};
+                {
+                    py::gil_scoped_release release;
+                    const KernelLock lock;
+                    payload = fed.to_min_dbm_bytes(minimize_graph, try_constraints_16);
+                }
+                return py::bytes(payload);
+            },
+            py::arg("minimize_graph") = true, py::arg("try_constraints_16") = true
+        )
+        .def("and_op", &NativeFederation::and_op, released_kernel_guard(), py::arg("other"))
+        .def("or_op", &NativeFederation::or_op, released_kernel_guard(), py::arg("other"))
+        .def("add_op", &NativeFederation::add_op, released_kernel_guard(), py::arg("other"))
+        .def("minus_op", &NativeFederation::minus_op, released_kernel_guard(), py::arg("other"))
+        .def("iand", &NativeFederation::iand, released_kernel_guard(), py::arg("other"))
+        .def("ior", &NativeFederation::ior, released_kernel_guard(), py::arg("other"))
+        .def("iadd", &NativeFederation::iadd, released_kernel_guard(), py::arg("other"))
+        .def("isub", &NativeFederation::isub, released_kernel_guard(), py::arg("other"))
+        .def("up", &NativeFederation::up, released_kernel_guard())
+        .def("down", &NativeFederation::down, released_kernel_guard())
+        .def("merge_reduce", &NativeFederation::merge_reduce, released_kernel_guard(), py::arg("skip") = 0,
+             py::arg("expensive_try") = 0)
+        .def("merge_reduce_above", &NativeFederation::merge_reduce_above, released_kernel_guard(),
+             py::arg("threshold"), py::arg("expensive_try") = 0)
+        .def("free_clock", &NativeFederation::free_clock, released_kernel_guard(), py::arg("clock"))
+        .def("set_zero", &NativeFederation::set_zero, kernel_guard())
+        .def("set_init", &NativeFederation::set_init, kernel_guard())
+        .def("convex_hull", &NativeFederation::convex_hull, released_kernel_guard())
+        .def("predt", &NativeFederation::predt, released_kernel_guard(), py::arg("other"))
+        .def("intern", &NativeFederation::intern, kernel_guard())
+        .def("update_value", &NativeFederation::update_value, released_kernel_guard(), py::arg("clock"),
+             py::arg("value"))
+        .def("eq", &NativeFederation::eq, released_kernel_guard(), py::arg("other"))
+        .def("lt", &NativeFederation::lt, released_kernel_guard(), py::arg("other"))
+        .def("gt", &NativeFederation::gt, released_kernel_guard(), py::arg("other"))
+        .def("le", &NativeFederation::le, released_kernel_guard(), py::arg("other"))
+        .def("ge", &NativeFederation::ge, released_kernel_guard(), py::arg("other"))
+        .def("contains_int", &NativeFederation::contains_int, released_kernel_guard(), py::arg("point"))
+        .def("contains_float", &NativeFederation::contains_float, released_kernel_guard(), py::arg("point"))
+        .def("contains_int_points", &NativeFederation::contains_int_points, py::arg("points"))
+        .def("contains_float_points", &NativeFederation::contains_float_points, py::arg("points"))
+        .def("sample_real", &NativeFederation::sample_real, py::arg("n"), py::arg("upper_bounds"),
+             py::arg("seed").none(true))
+        .def("sample_int", &NativeFederation::sample_int, py::arg("n"), py::arg("upper_bounds"),
+             py::arg("seed").none(true))
+        .def("volume", &NativeFederation::volume, py::arg("upper_bounds"), py::arg("samples"),
+             py::arg("seed").none(true))
+        .def("successor", &NativeFederation::successor, released_kernel_guard(), py::arg("guard").none(true),
+             py::arg("updates"), py::arg("invariant").none(true), py::arg("max_bounds"), py::arg("delay") = true)
+        .def("predecessor", &NativeFederation::predecessor, released_kernel_guard(), py::arg("guard").none(true),
+             py::arg("updates"), py::arg("invariant").none(true), py::arg("delay") = true)
+        .def("extrapolate_max_bounds", &NativeFederation::extrapolate_max_bounds, released_kernel_guard(),
+             py::arg("max_bounds"), py::arg("diagonal") = false)
+        .def("extrapolate_lu_bounds", &NativeFederation::extrapolate_lu_bounds, released_kernel_guard(),
+             py::arg("lower_bounds"), py::arg("upper_bounds"), py::arg("diagonal") = false);
+
+    py::class_<NativeSubsumptionIndex>(m, "_NativeSubsumptionIndex")
+        .def(py::init<cindex_t>(), py::arg("dim"))
+        .def("get_dimension", &NativeSubsumptionIndex::get_dimension)
+        .def("size", &NativeSubsumptionIndex::size)
+        .def("bucket_size", &NativeSubsumptionIndex::bucket_size, py::arg("key"))
+        .def("insert", &NativeSubsumptionIndex::insert, py::arg("key"), py::arg("fed"))
+        .def("is_covered", &NativeSubsumptionIndex::is_covered, py::arg("key"), py::arg("fed"))
+        .def("remove_covered_by", &NativeSubsumptionIndex::remove_covered_by, py::arg("key"), py::arg("fed"))
+        .def("bucket_cells", &NativeSubsumptionIndex::bucket_cells, py::arg("key"))
+        .def("clear", &NativeSubsumptionIndex::clear);
 }
@@ -12,10 +12,14 @@ compatibility layer:
 * extracted DBM fragments are wrapped back into the existing :class:`DBM`
   class rather than introducing a second DBM wrapper hierarchy.
 
-The UCDD runtime is global, so this module keeps one process-level runtime
-layout. Reusing the same clock layout and boolean prefix is supported. Trying
-to combine incompatible runtime layouts raises a descriptive error instead of
-silently corrupting level mappings.
+The UCDD runtime is global, but contexts with different layouts can be used
+side by side in one process. The runtime holds as many clocks as the widest
+context so far, and narrower contexts leave the extra clocks unconstrained;
+their DBMs are widened and narrowed at the native boundary, and clock
+operations such as :meth:`CDD.delay` drop whatever UCDD imposes on the extra
+clocks, so a CDD never depends on how wide the runtime is. Every boolean name
+owns one runtime level that all contexts declaring it share. CDDs can only be
+combined within one :class:`CDDContext`.
 
 Example::
 
@@ -42,7 +46,7 @@ from ._ucdd import (
     _NativeCDDRuntime,
 )
 from ._udbm import _NativeDBM, _NativeFederation
-from .udbm import DBM, Clock, Context, Federation, VariableDifference
+from .udbm import DBM, Clock, Context, Federation, VariableDifference, _require_numpy
 
 __all__ = [
     "BDDTraceSet",
@@ -52,10 +56,13 @@ __all__ = [
     "CDDBool",
     "CDDClock",
     "CDDLevelInfo",
+    "CDDRuntimeStats",
     "OP_AND",
     "OP_XOR",
     "TYPE_BDD",
     "TYPE_CDD",
+    "configure_runtime",
+    "runtime_stats",
 ]
 
 #: Native UCDD binary-operation code for logical conjunction / symbolic
@@ -112,6 +119,56 @@ class CDDLevelInfo:
     diff: int
 
 
+@dataclass(frozen=True)
+class CDDRuntimeStats:
+    """
+    Immutable snapshot of the global UCDD runtime, see :func:`runtime_stats`.
+
+    Every field is measured by the binding itself. UCDD does not publish its
+    node-table occupancy, garbage-collection count, operation-cache hit rates
+    or memory use, so the snapshot carries none of them; handle counts are the
+    closest available proxy for node-table pressure.
+
+    :param running: Whether the runtime is currently initialized.
+    :type running: bool
+    :param maxsize: Configured node table size, or ``None`` for UCDD's
+        built-in default.
+    :type maxsize: int or None
+    :param cache_size: Configured operation cache size, or ``None`` for the
+        default.
+    :type cache_size: int or None
+    :param stack_size: Configured reference stack size, or ``None`` for the
+        default.
+    :type stack_size: int or None
+    :param starts: Number of runtime initializations in this process.
+    :type starts: int
+    :param live_cdds: Native CDD handles currently alive. Several handles
+        may share one root node, so this is not a node count.
+    :type live_cdds: int
+    :param peak_live_cdds: Largest number of simultaneously alive handles
+        since the process started.
+    :type peak_live_cdds: int
+    :param clock_count: Runtime clock count including the reference clock,
+        ``0`` when the runtime is stopped.
+    :type clock_count: int
+    :param bool_count: Boolean level count.
+    :type bool_count: int
+    :param level_count: Total level count over clock pairs and booleans.
+    :type level_count: int
+    """
+
+    running: bool
+    maxsize: Optional[int]
+    cache_size: Optional[int]
+    stack_size: Optional[int]
+    starts: int
+    live_cdds: int
+    peak_live_cdds: int
+    clock_count: int
+    bool_count: int
+    level_count: int
+
+
 @dataclass(frozen=True)
 class _RuntimeLayout:
     clock_count: int
@@ -119,7 +176,10 @@ class _RuntimeLayout:
     bool_levels: Tuple[int, ...]
 
 
-_RUNTIME_LAYOUT: Optional[_RuntimeLayout] = None
+# Runtime boolean level of every name some CDDContext declared, shared by all
+# layouts, together with the runtime start those levels belong to.
+_BOOL_LEVELS: Dict[str, int] = {}
+_BOOL_LEVELS_START: Optional[int] = None
 
 
 def _clock_name_tuple(context: Context) -> Tuple[str, ...]:
@@ -143,101 +203,157 @@ def _restart_runtime_if_idle() -> bool:
     Restart the UCDD runtime when it is still running but no live CDD handles
     remain.
 
-    This keeps the Python layer usable across independent test cases and
-    sequential workflows that intentionally switch to a different global UCDD
-    layout after all previous symbolic objects are gone.
+    The next :class:`CDDContext` then starts a fresh runtime, for example with
+    the sizes set by :func:`configure_runtime`.
     """
 
-    global _RUNTIME_LAYOUT
-
     if not _NativeCDDRuntime.is_running():  # pragma: no cover
         return False
     if _NativeCDD.live_count() != 0:
         return False
 
     _NativeCDDRuntime.done()
-    _RUNTIME_LAYOUT = None
+    _BOOL_LEVELS.clear()
     return True
 
 
 def _ensure_runtime_layout(clock_count: int, bool_names: Sequence[str]) -> _RuntimeLayout:
     """
-    Ensure that the global UCDD runtime matches the requested symbolic layout.
-
-    The runtime can only grow monotonically, so this helper permits repeated
-    requests for the same clock count and for boolean-name prefixes. Any other
-    shape mismatch is rejected with a clear error message.
+    Ensure that the global UCDD runtime can host the requested symbolic layout.
+
+    Layouts do not have to agree with each other. The runtime keeps as many
+    clocks as the widest layout so far, and a context with fewer clocks leaves
+    the remaining ones unconstrained. Boolean names map to runtime levels that
+    are created on first use and shared by every context declaring the name.
+    Both only grow, so contexts created earlier keep valid levels and CDDs
+    from different layouts can stay alive side by side.
     """
 
-    global _RUNTIME_LAYOUT
+    global _BOOL_LEVELS_START
 
     requested_bool_names = tuple(bool_names)
     _NativeCDDRuntime.ensure_running()
+    start = _NativeCDDRuntime.start_count()
+    if _BOOL_LEVELS_START != start:
+        _BOOL_LEVELS.clear()
+        _BOOL_LEVELS_START = start
 
     current_clock_count = _NativeCDDRuntime.getclocks()
-    current_bool_count = _NativeCDDRuntime.get_bdd_level_count()
-    if _RUNTIME_LAYOUT is not None and current_clock_count == 0 and current_bool_count == 0:  # pragma: no cover
-        _RUNTIME_LAYOUT = None
-
-    if current_clock_count == 0:
-        _NativeCDDRuntime.add_clocks(clock_count)
-        current_clock_count = _NativeCDDRuntime.getclocks()
-    if current_clock_count != clock_count:
-        if _restart_runtime_if_idle():
-            return _ensure_runtime_layout(clock_count, requested_bool_names)
-        raise RuntimeError(
-            "UCDD runtime already uses {0} clocks, but this CDDContext requires {1}.".format(
-                current_clock_count, clock_count
-            )
-        )
-
-    if _RUNTIME_LAYOUT is None:
-        if current_bool_count < len(requested_bool_names):
-            _NativeCDDRuntime.add_bddvars(len(requested_bool_names) - current_bool_count)
-            current_bool_count = _NativeCDDRuntime.get_bdd_level_count()
-        if current_bool_count != len(requested_bool_names):
-            if _restart_runtime_if_idle():
-                return _ensure_runtime_layout(clock_count, requested_bool_names)
-            raise RuntimeError(
-                "UCDD runtime already uses {0} boolean levels, but this CDDContext requires {1}. "
-                "Restart the process or reuse the same boolean layout.".format(
-                    current_bool_count, len(requested_bool_names)
-                )
-            )
-
-        levels = _get_bdd_levels()
-        if len(levels) != len(requested_bool_names):  # pragma: no cover
+    if current_clock_count < clock_count:
+        _NativeCDDRuntime.add_clocks(clock_count - current_clock_count)
+
+    missing = [name for name in requested_bool_names if name not in _BOOL_LEVELS]
+    if missing:
+        known = set(_get_bdd_levels())
+        _NativeCDDRuntime.add_bddvars(len(missing))
+        fresh = [level for level in _get_bdd_levels() if level not in known]
+        if len(fresh) != len(missing):  # pragma: no cover
             raise RuntimeError("Failed to resolve the expected boolean levels from the UCDD runtime.")
+        _BOOL_LEVELS.update(zip(missing, fresh))
 
-        _RUNTIME_LAYOUT = _RuntimeLayout(clock_count, requested_bool_names, levels)
-        return _RUNTIME_LAYOUT
+    levels = tuple(_BOOL_LEVELS[name] for name in requested_bool_names)
+    return _RuntimeLayout(clock_count, requested_bool_names, levels)
 
-    if _RUNTIME_LAYOUT.clock_count != clock_count:  # pragma: no cover
-        if _restart_runtime_if_idle():
-            return _ensure_runtime_layout(clock_count, requested_bool_names)
-        raise RuntimeError(
-            "UCDD runtime already uses {0} clocks, but this CDDContext requires {1}.".format(
-                _RUNTIME_LAYOUT.clock_count, clock_count
-            )
-        )
 
-    existing_names = _RUNTIME_LAYOUT.bool_names
-    if existing_names[: len(requested_bool_names)] == requested_bool_names:
-        return _RUNTIME_LAYOUT
+def configure_runtime(
+    maxsize: Optional[int], cache_size: Optional[int] = None, stack_size: Optional[int] = None
+) -> None:
+    """
+    Set the sizes used whenever the global UCDD runtime is started.
+
+    ``maxsize`` is the initial node table size, ``cache_size`` the size of the
+    operation caches and ``stack_size`` the size of the reference stack. Large
+    mixed clock/boolean models benefit from a larger node table, which saves
+    repeated garbage collection and table growth. A runtime that is already
+    running without live CDD handles is shut down, so the next
+    :class:`CDDContext` starts it with the new sizes; configure the runtime
+    before creating the contexts that will be used.
+
+    The configuration is process-wide. Call ``configure_runtime(None)`` to
+    drop it again, so later starts use UCDD's built-in defaults.
+
+    :param maxsize: Node table size, or ``None`` to restore the defaults.
+    :type maxsize: int or None
+    :param cache_size: Operation cache size, required with ``maxsize``.
+    :type cache_size: int or None
+    :param stack_size: Reference stack size, required with ``maxsize``.
+    :type stack_size: int or None
+    :return: ``None``.
+    :rtype: None
+    :raises TypeError: If a size is not an integer, or only some sizes are
+        ``None``.
+    :raises ValueError: If a size is not positive.
+    :raises RuntimeError: If CDD objects are still alive in a running runtime.
 
-    if requested_bool_names[: len(existing_names)] == existing_names:
-        _NativeCDDRuntime.add_bddvars(len(requested_bool_names) - len(existing_names))
-        levels = _get_bdd_levels()
-        _RUNTIME_LAYOUT = _RuntimeLayout(clock_count, requested_bool_names, levels)
-        return _RUNTIME_LAYOUT
+    Example::
 
-    if _restart_runtime_if_idle():
-        return _ensure_runtime_layout(clock_count, requested_bool_names)
+        >>> from pyudbm.binding.ucdd import configure_runtime, runtime_stats
+        >>> configure_runtime(200000, 50000, 10000)
+        >>> runtime_stats().maxsize
+        200000
+        >>> configure_runtime(None)
+        >>> runtime_stats().maxsize is None
+        True
+    """
 
-    raise RuntimeError(
-        "UCDD runtime already uses boolean names {0}, which are incompatible with requested names {1}.".format(
-            list(existing_names), list(requested_bool_names)
-        )
+    sizes = (maxsize, cache_size, stack_size)
+    reset = all(value is None for value in sizes)
+    if not reset:
+        for value in sizes:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError("UCDD runtime sizes must be integers, or all None to restore the defaults.")
+            if value <= 0:
+                raise ValueError("UCDD runtime sizes must be positive.")
+    if _NativeCDDRuntime.is_running() and _NativeCDD.live_count() != 0:
+        raise RuntimeError("Cannot resize the UCDD runtime while CDD objects are still alive.")
+
+    if reset:
+        _NativeCDDRuntime.clear_configuration()
+    else:
+        _NativeCDDRuntime.configure(maxsize, cache_size, stack_size)
+    _restart_runtime_if_idle()
+
+
+def runtime_stats() -> CDDRuntimeStats:
+    """
+    Return a snapshot of the global UCDD runtime.
+
+    The snapshot reports the configured sizes, how often the runtime was
+    started, the current and peak number of live CDD handles and the level
+    layout. It does not start a stopped runtime. Kernel-internal counters such
+    as node-table occupancy, garbage collections and cache hit rates are not
+    available through UCDD and are therefore not reported.
+
+    :return: Runtime snapshot.
+    :rtype: CDDRuntimeStats
+
+    Example::
+
+        >>> from pyudbm import Context
+        >>> from pyudbm.binding.ucdd import runtime_stats
+        >>> ctx = Context(["x"]).to_cdd_context(bools=["flag"])
+        >>> state = ctx.flag & (ctx.x <= 1)
+        >>> stats = runtime_stats()
+        >>> stats.running, stats.clock_count, stats.bool_count
+        (True, 2, 1)
+        >>> stats.live_cdds >= 1
+        True
+    """
+
+    running = _NativeCDDRuntime.is_running()
+    sizes = _NativeCDDRuntime.configured_sizes()
+    maxsize, cache_size, stack_size = sizes if sizes is not None else (None, None, None)
+    return CDDRuntimeStats(
+        running=running,
+        maxsize=maxsize,
+        cache_size=cache_size,
+        stack_size=stack_size,
+        starts=_NativeCDDRuntime.start_count(),
+        live_cdds=_NativeCDD.live_count(),
+        peak_live_cdds=_NativeCDD.peak_live_count(),
+        clock_count=_NativeCDDRuntime.getclocks() if running else 0,
+        bool_count=_NativeCDDRuntime.get_bdd_level_count() if running else 0,
+        level_count=_NativeCDDRuntime.get_level_count() if running else 0,
     )
 
 
@@ -1247,7 +1363,10 @@ class BDDTraceSet:
 
     Iteration yields sparse dictionaries mapping boolean names to truth values.
     This is useful when a CDD is logically a pure BDD, or when only the
-    boolean portion of a mixed symbolic state is relevant.
+    boolean portion of a mixed symbolic state is relevant. Rows are decoded
+    one at a time from the native arrays, which are stored once and read in
+    place, and :meth:`to_arrays` exports them to NumPy without building
+    Python rows at all.
 
     :param context: Owning symbolic context whose boolean names label the
         extracted traces.
@@ -1256,6 +1375,8 @@ class BDDTraceSet:
         binding.
     :type native: Any
     :ivar context: Owning symbolic context.
+    :ivar level_names: Boolean name of every runtime level declared by
+        :attr:`context`.
 
     Example::
 
@@ -1289,6 +1410,7 @@ class BDDTraceSet:
         """
         self.context = context
         self._native = native
+        self.level_names = {var.level: var.name for var in context.bools}  # type: Dict[int, str]
 
     def __len__(self) -> int:
         """
@@ -1307,14 +1429,51 @@ class BDDTraceSet:
         return self._native.num_traces
 
     def _iter_rows(self) -> Iterator[Tuple[Tuple[str, bool], ...]]:
-        for vars_row, values_row in zip(self._native.vars_matrix(), self._native.values_matrix()):
+        width = self._native.num_bools
+        if width <= 0:
+            return
+        levels = memoryview(self._native.vars_buffer()).cast("B").cast("i")
+        values = memoryview(self._native.values_buffer()).cast("B").cast("b")
+        names = self.level_names
+        for offset in range(0, len(levels), width):
             row = []
-            for level, value in zip(vars_row, values_row):
+            for level, value in zip(levels[offset:offset + width].tolist(), values[offset:offset + width].tolist()):
                 if level < 0 or value < 0:
                     continue
-                row.append((self.context.bool_name_for_level(level), bool(value)))
+                row.append((names[level], bool(value)))
             yield tuple(row)
 
+    def to_arrays(self) -> Tuple[Any, Any]:
+        """
+        Export the traces as ``(levels, values)`` NumPy arrays.
+
+        Both arrays have shape ``(len(self), num_bools)`` where ``num_bools``
+        counts the boolean levels of the whole runtime. ``levels`` is
+        ``int32`` and holds the runtime level of each cell, ``values`` is
+        ``int8`` with ``1`` / ``0`` for a fixed value and ``-1`` for unused
+        cells. Map levels to names with :attr:`level_names`.
+
+        The arrays are read-only views of tensors built once by the native
+        trace set; repeated calls return views of the same memory, without
+        copying it.
+
+        :return: Level and value arrays.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        :raises ImportError: If numpy is not installed.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> ctx = Context(["x"]).to_cdd_context(bools=["flag"])
+            >>> traces = ctx.flag.bdd_traces()
+            >>> levels, values = traces.to_arrays()
+            >>> [traces.level_names[level] for level, value in zip(levels[0], values[0]) if value >= 0]
+            ['flag']
+        """
+
+        numpy = _require_numpy()
+        return numpy.asarray(self._native.vars_buffer()), numpy.asarray(self._native.values_buffer())
+
     def __iter__(self) -> Iterator[Dict[str, bool]]:
         """
         Iterate over sparse boolean assignments.
@@ -1368,15 +1527,36 @@ class BDDTraceSet:
             True
         """
 
-        rows = []
+        return list(self.iter_dicts(sparse))
+
+    def iter_dicts(self, sparse: bool = True) -> Iterator[Dict[str, Optional[bool]]]:
+        """
+        Lazily yield traces as dictionaries keyed by boolean name.
+
+        Unlike :meth:`to_dicts`, only the current row is decoded, which keeps
+        memory flat for CDDs with very many traces.
+
+        :param sparse: When ``True``, omit unspecified booleans. When
+            ``False``, include every boolean name and use ``None`` for
+            unspecified values.
+        :type sparse: bool
+        :return: Iterator over boolean assignments.
+        :rtype: Iterator[Dict[str, Optional[bool]]]
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> ctx = Context(["x"]).to_cdd_context(bools=["flag", "other"])
+            >>> next(ctx.flag.bdd_traces().iter_dicts(sparse=False))
+            {'flag': True, 'other': None}
+        """
+
         for row in self._iter_rows():
             mapping = dict(row)
-            if not sparse:
-                complete = {name: mapping.get(name) for name in self.context.bool_names}
-                rows.append(complete)
+            if sparse:
+                yield mapping
             else:
-                rows.append(mapping)
-        return rows
+                yield {name: mapping.get(name) for name in self.context.bool_names}
 
 
 class CDDExtraction:
@@ -1432,28 +1612,22 @@ class CDDExtraction:
 
     def to_federation(self, require_pure: bool = True) -> Federation:
         """
-        Convert the extracted DBM to a one-zone federation when its boolean
-        guard is trivial.
+        Convert the extracted DBM to a one-zone federation.
 
         :param require_pure: Whether to reject non-trivial boolean guards with
-            :class:`ValueError`. When ``False``, mixed guarded conversion still
-            raises :class:`NotImplementedError` because this wrapper does not
-            yet materialize guarded federation fragments.
+            :class:`ValueError`. When ``False``, the guard is dropped and the
+            zone is returned as is; :attr:`bdd_part` still holds it.
         :type require_pure: bool
         :return: One-zone federation equivalent to :attr:`dbm`.
         :rtype: Federation
         :raises ValueError: If the extraction still carries a boolean guard and
             ``require_pure`` is ``True``.
-        :raises NotImplementedError: If guarded federation conversion is
-            requested with ``require_pure=False``.
         """
 
-        if not self.bdd_part.is_true():
-            if require_pure:
-                raise ValueError("Cannot convert an extracted DBM with a non-trivial boolean guard to Federation.")
-            raise NotImplementedError("Splitting mixed CDD fragments into guarded federations is not implemented.")
+        if require_pure and not self.bdd_part.is_true():
+            raise ValueError("Cannot convert an extracted DBM with a non-trivial boolean guard to Federation.")
 
-        native = _NativeFederation.from_dbm_list([list(self.dbm._raw_matrix())], self.context.dimension)
+        native = _NativeFederation.from_raw_buffer(self.dbm._dbm, self.context.dimension, False)
         return Federation._from_native(self.context.base_context, native)
 
     def has_bdd_part(self) -> bool:
@@ -1712,7 +1886,7 @@ class CDD:
         if not _compatible_clock_layout(context.base_context, dbm.context):
             raise ValueError("CDDContext clock layout is incompatible with the DBM context.")
 
-        native = _NativeCDD.from_dbm(list(dbm._raw_matrix()), dbm.dimension)
+        native = _NativeCDD.from_dbm_buffer(dbm._dbm, dbm.dimension, reduce=False)
         return cls._from_native(context, native)
 
     @classmethod
@@ -1720,6 +1894,10 @@ class CDD:
         """
         Build a pure clock CDD from a :class:`Federation`.
 
+        All DBM matrices are handed to UCDD in one contiguous buffer; the
+        per-DBM CDDs are combined by a balanced union and reduced once, so
+        large federations convert without per-DBM Python round trips.
+
         :param federation: Source federation.
         :type federation: Federation
         :param cdd_context: Optional target mixed context. When omitted, a
@@ -1740,10 +1918,8 @@ class CDD:
         if not _compatible_clock_layout(context.base_context, federation.context):
             raise ValueError("CDDContext clock layout is incompatible with the Federation context.")
 
-        result = cls.false(context)
-        for dbm in federation.to_dbm_list():
-            result |= cls.from_dbm(dbm, cdd_context=context)
-        return result.reduce()
+        native = _NativeCDD.from_dbm_buffer(federation._fed.to_raw_buffer(), context.dimension)
+        return cls._from_native(context, native)
 
     def copy(self) -> "CDD":
         """
@@ -2104,6 +2280,11 @@ class CDD:
         """
         return self._cdd.is_false()
 
+    def _clock_result(self, native: _NativeCDD) -> "CDD":
+        # Clock operations run over every runtime clock; drop whatever they
+        # imposed on clocks this context does not declare.
+        return CDD._from_native(self.context, native.forget_runtime_clocks(self.context.dimension))
+
     def remove_negative(self) -> "CDD":
         """
         Remove negative constraints through the native UCDD helper.
@@ -2111,7 +2292,7 @@ class CDD:
         :return: Transformed symbolic set.
         :rtype: CDD
         """
-        return CDD._from_native(self.context, self._cdd.remove_negative())
+        return self._clock_result(self._cdd.remove_negative())
 
     def delay(self) -> "CDD":
         """
@@ -2123,7 +2304,7 @@ class CDD:
         :return: Time-successor symbolic set.
         :rtype: CDD
         """
-        return CDD._from_native(self.context, self._cdd.delay())
+        return self._clock_result(self._cdd.delay())
 
     def past(self) -> "CDD":
         """
@@ -2132,7 +2313,7 @@ class CDD:
         :return: Past-closed symbolic set.
         :rtype: CDD
         """
-        return CDD._from_native(self.context, self._cdd.past())
+        return self._clock_result(self._cdd.past())
 
     def delay_invariant(self, invariant: Any) -> "CDD":
         """
@@ -2145,7 +2326,7 @@ class CDD:
         :rtype: CDD
         """
         invariant_cdd = self._coerce_symbolic(invariant, self.context)
-        return CDD._from_native(self.context, self._cdd.delay_invariant(invariant_cdd._cdd))
+        return self._clock_result(self._cdd.delay_invariant(invariant_cdd._cdd))
 
     def predt(self, safe: Any) -> "CDD":
         """
@@ -2158,7 +2339,7 @@ class CDD:
         :rtype: CDD
         """
         safe_cdd = self._coerce_symbolic(safe, self.context)
-        return CDD._from_native(self.context, self._cdd.predt(safe_cdd._cdd))
+        return self._clock_result(self._cdd.predt(safe_cdd._cdd))
 
     def contains_dbm(self, dbm: DBM) -> bool:
         """
@@ -2216,7 +2397,7 @@ class CDD:
         :rtype: CDDExtraction
         """
 
-        return CDDExtraction(self.context, self.reduce()._cdd.extract_bdd_and_dbm())
+        return CDDExtraction(self.context, self.reduce()._cdd.extract_bdd_and_dbm(self.context.dimension))
 
     def bdd_traces(self) -> BDDTraceSet:
         """
@@ -2350,8 +2531,8 @@ class CDD:
 
         clock_indices, clock_values = self._normalize_clock_reset_mapping(self.context, clock_resets)
         bool_levels, bool_values = self._normalize_bool_reset_mapping(self.context, bool_resets)
-        return CDD._from_native(
-            self.context, self._cdd.apply_reset(clock_indices, clock_values, bool_levels, bool_values)
+        return self._clock_result(
+            self._cdd.apply_reset(clock_indices, clock_values, bool_levels, bool_values)
         )
 
     def transition(
@@ -2379,8 +2560,8 @@ class CDD:
         guard_cdd = self._coerce_symbolic(guard, self.context)
         clock_indices, clock_values = self._normalize_clock_reset_mapping(self.context, clock_resets)
         bool_levels, bool_values = self._normalize_bool_reset_mapping(self.context, bool_resets)
-        return CDD._from_native(
-            self.context, self._cdd.transition(guard_cdd._cdd, clock_indices, clock_values, bool_levels, bool_values)
+        return self._clock_result(
+            self._cdd.transition(guard_cdd._cdd, clock_indices, clock_values, bool_levels, bool_values)
         )
 
     def transition_back(
@@ -2412,8 +2593,8 @@ class CDD:
         update_cdd = self._coerce_symbolic(update, self.context)
         clock_indices = self._normalize_reset_list(self.context, clock_resets, bools=False)
         bool_levels = self._normalize_reset_list(self.context, bool_resets, bools=True)
-        return CDD._from_native(
-            self.context, self._cdd.transition_back(guard_cdd._cdd, update_cdd._cdd, clock_indices, bool_levels)
+        return self._clock_result(
+            self._cdd.transition_back(guard_cdd._cdd, update_cdd._cdd, clock_indices, bool_levels)
         )
 
     def transition_back_past(
@@ -2442,28 +2623,36 @@ class CDD:
         update_cdd = self._coerce_symbolic(update, self.context)
         clock_indices = self._normalize_reset_list(self.context, clock_resets, bools=False)
         bool_levels = self._normalize_reset_list(self.context, bool_resets, bools=True)
-        return CDD._from_native(
-            self.context, self._cdd.transition_back_past(guard_cdd._cdd, update_cdd._cdd, clock_indices, bool_levels)
+        return self._clock_result(
+            self._cdd.transition_back_past(guard_cdd._cdd, update_cdd._cdd, clock_indices, bool_levels)
         )
 
+    def _guarded_zones(self, require_pure: bool) -> List[Tuple["CDD", Federation]]:
+        zones = []
+        for guard, dbms in self._cdd.extract_guarded_zones(require_pure, self.context.dimension):
+            native = _NativeFederation.from_raw_buffer(dbms, self.context.dimension, False)
+            federation = Federation._from_native(self.context.base_context, native)
+            zones.append((CDD._from_native(self.context, guard), federation))
+        return zones
+
     def to_federation(self, require_pure: bool = True) -> Federation:
         """
         Convert a pure clock CDD back into a :class:`Federation`.
 
         A non-trivial boolean guard cannot be represented as a plain
-        federation, so mixed CDDs raise by default.
+        federation, so mixed CDDs raise by default. With
+        ``require_pure=False`` the booleans are projected away and the result
+        is the union of the zones under every guard; use
+        :meth:`to_guarded_federations` to keep the guards. The extraction
+        loop runs natively in one call.
 
         :param require_pure: Whether to reject mixed CDDs with
-            :class:`ValueError`. When ``False``, mixed conversion still raises
-            :class:`NotImplementedError` because guarded federation output is
-            not materialized by this wrapper.
+            :class:`ValueError`, defaults to ``True``.
         :type require_pure: bool
         :return: Equivalent pure-clock federation.
         :rtype: Federation
         :raises ValueError: If this CDD contains non-trivial boolean guards and
             ``require_pure`` is ``True``.
-        :raises NotImplementedError: If guarded federation conversion is
-            requested with ``require_pure=False``.
 
         Example::
 
@@ -2472,18 +2661,36 @@ class CDD:
             >>> pure = (base.x <= 3).to_cdd()
             >>> pure.to_federation() == (base.x <= 3)
             True
+            >>> ctx = base.to_cdd_context(bools=["flag"])
+            >>> mixed = (ctx.flag & (ctx.x <= 2)) | (~ctx.flag & (ctx.x >= 5))
+            >>> mixed.to_federation(require_pure=False) == ((base.x <= 2) | (base.x >= 5))
+            True
         """
 
-        pending = self.reduce()
-        dbms = []
-        while not pending.is_false():
-            extracted = pending.extract_bdd_and_dbm()
-            if not extracted.bdd_part.is_true():
-                if require_pure:
-                    raise ValueError("Cannot convert a mixed bool/clock CDD to Federation.")
-                raise NotImplementedError("Splitting mixed CDDs into guarded federations is not implemented.")
-            dbms.append(list(extracted.dbm._raw_matrix()))
-            pending = extracted.remainder
+        result = Federation._from_native(self.context.base_context, _NativeFederation(self.context.dimension))
+        for _, federation in self._guarded_zones(require_pure):
+            result |= federation
+        return result
 
-        native = _NativeFederation.from_dbm_list(dbms, self.context.dimension)
-        return Federation._from_native(self.context.base_context, native)
+    def to_guarded_federations(self) -> List[Tuple["CDD", Federation]]:
+        """
+        Split this CDD into ``(guard, federation)`` pairs.
+
+        Every guard is a pure boolean :class:`CDD` and appears once; the paired
+        federation holds all zones extracted under it. The union of
+        ``guard & federation.to_cdd(context)`` over all pairs equals this CDD.
+        A pure clock CDD yields at most one pair with a tautological guard.
+
+        :return: Guarded federations in extraction order.
+        :rtype: List[Tuple[CDD, Federation]]
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> ctx = Context(["x"]).to_cdd_context(bools=["flag"])
+            >>> mixed = (ctx.flag & (ctx.x <= 2)) | (~ctx.flag & (ctx.x >= 5))
+            >>> sorted(guard.equiv(ctx.flag.as_cdd()) for guard, _ in mixed.to_guarded_federations())
+            [False, True]
+        """
+
+        return self._guarded_zones(False)
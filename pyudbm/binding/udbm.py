@@ -23,6 +23,17 @@ The Python layer intentionally stays thin: methods like :meth:`Federation.up`,
 the corresponding UDBM operations. The documentation below therefore explains
 both the Python API and the underlying DBM semantics.
 
+Native calls release the GIL while UDBM works, so federation code running in a
+:class:`concurrent.futures.ThreadPoolExecutor` does not stall other Python
+threads. UDBM itself keeps its allocator pools, intern table and copy-on-write
+reference counts in process-global state, so the binding serializes the kernel
+calls behind one native lock. Threads therefore overlap Python-side work with
+UDBM work, but at most one UDBM call runs at a time: federation operations do
+not speed up with more threads, and CPU-bound exploration that must use several
+cores should be split across processes instead, for example with
+:class:`concurrent.futures.ProcessPoolExecutor`. See :class:`Federation` for
+which objects may be shared between threads.
+
 Example::
 
     >>> from pyudbm import Context, IntValuation
@@ -40,25 +51,57 @@ Example::
 
 from __future__ import annotations
 
+import array
+import importlib
 import logging
-from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
-from ._udbm import _NativeConstraint, _NativeDBM, _NativeFederation
+from ._udbm import _NativeConstraint, _NativeDBM, _NativeFederation, _NativeSubsumptionIndex
 
 __all__ = [
+    "AutoReduceInfo",
     "DBM",
     "Clock",
     "Constraint",
+    "ConstraintCacheInfo",
     "Context",
     "Federation",
+    "FederationStats",
+    "FederationStore",
     "FloatValuation",
     "IntValuation",
+    "RELATION_DIFFERENT",
+    "RELATION_EQUAL",
+    "RELATION_SUBSET",
+    "RELATION_SUPERSET",
+    "SubsumptionIndex",
     "Valuation",
     "VariableDifference",
+    "relation_matrix",
 ]
 
 LOGGER = logging.getLogger("pyudbm")
-_DBM_INFINITY_RAW = ((2 ** 31 - 1) >> 1) << 1
+_INT32_MIN = -(2 ** 31)
+_INT32_MAX = 2 ** 31 - 1
+_DBM_INFINITY = _INT32_MAX >> 1
+_DBM_INFINITY_RAW = _DBM_INFINITY << 1
+# magic, format version, byte order of the DBM words (0 little, 1 big), dimension, DBM count
+_FEDERATION_BYTES_HEADER = struct.Struct("<4sBBII")
+_FEDERATION_BYTES_MAGIC = b"UDBF"
+_FEDERATION_BYTES_VERSION = 1
+_NATIVE_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+# Relation codes of :func:`relation_matrix`; they match UDBM's ``relation_t``
+# and form a bit mask, so ``code & RELATION_SUBSET`` tests for inclusion.
+RELATION_DIFFERENT = 0
+RELATION_SUPERSET = 1
+RELATION_SUBSET = 2
+RELATION_EQUAL = 3
 
 
 def _is_exact_int(value: Any) -> bool:
@@ -82,6 +125,64 @@ def _format_dbm_raw(raw_value: int) -> str:
     return "{0}{1}".format("<" if (raw_value & 1) == 0 else "<=", raw_value >> 1)
 
 
+def _require_numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as err:
+        raise ImportError("numpy is required for array support. Install pyudbm[numpy].") from err
+
+
+def _check_array_range(values: Any, low: int, high: int, message: str) -> None:
+    """Raise :class:`ValueError` unless every entry of ``values`` lies in ``[low, high]``."""
+
+    if values.size and (int(values.min()) < low or int(values.max()) > high):
+        raise ValueError(message)
+
+
+def _resolve_context_clock(context: "Context", key: Union[str, "Clock"], role: str) -> "Clock":
+    """Resolve a clock name or :class:`Clock` key and check its context."""
+
+    if isinstance(key, str):
+        clock = context[key]
+    elif isinstance(key, Clock):
+        clock = key
+    else:
+        raise TypeError("{0} keys must be clock names or Clock objects.".format(role))
+    if clock.context is not context:
+        raise ValueError("{0} clocks must belong to the same context.".format(role))
+    return clock
+
+
+def _box_vector(context: "Context", bounds: Optional[Mapping[Union[str, "Clock"], int]]) -> List[int]:
+    """Return per-DBM-index box upper bounds, with the DBM infinity where none is given."""
+
+    vector = [_DBM_INFINITY] * (len(context.clocks) + 1)
+    seen = set()
+    for key, value in (bounds or {}).items():
+        clock = _resolve_context_clock(context, key, "Bounds")
+        if clock in seen:
+            raise ValueError("Duplicate bounds provided for clock: {0}".format(clock.name))
+        seen.add(clock)
+        if not _is_exact_int(value):
+            raise TypeError("Bounds must be integers.")
+        if not 0 <= value < _DBM_INFINITY:
+            raise ValueError("Bound {0} for clock {1} is out of range.".format(value, clock.name))
+        vector[clock.dbm_index] = value
+    return vector
+
+
+def _volume_options(samples: int, seed: Optional[int]) -> Optional[int]:
+    """Validate Monte Carlo volume options and return the native seed."""
+
+    if not _is_exact_int(samples):
+        raise TypeError("Volume sample count must be an integer.")
+    if samples < 1:
+        raise ValueError("Volume sample count must be positive.")
+    if seed is not None and not _is_exact_int(seed):
+        raise TypeError("Volume seed must be an integer or None.")
+    return None if seed is None else seed & ((1 << 64) - 1)
+
+
 def _tuple_from_dbm_raw(raw_value: int) -> Tuple[str, Union[int, float]]:
     """Return one decoded DBM cell as ``(operator, bound)``."""
 
@@ -140,6 +241,7 @@ class DBM:
         """
         self.context = context
         self._dbm = native
+        self._cells = None  # type: Optional[memoryview]
 
     @classmethod
     def _from_raw_matrix(cls, context: "Context", raw_matrix: Iterable[int]) -> "DBM":
@@ -164,8 +266,13 @@ class DBM:
     def _clock_names(self) -> List[str]:
         return ["0"] + [clock.get_full_name() for clock in self.context.clocks]
 
+    def _raw_view(self) -> memoryview:
+        if self._cells is None:
+            self._cells = memoryview(self._dbm)
+        return self._cells
+
     def _raw_matrix(self) -> tuple:
-        return tuple(int(value) for value in self._dbm.raw_matrix())
+        return tuple(value for row in self._raw_view().tolist() for value in row)
 
     def to_cdd(self, cdd_context: Optional[Any] = None) -> Any:
         """
@@ -302,6 +409,29 @@ class DBM:
 
         return tuple(self._clock_names())
 
+    @staticmethod
+    def live_count() -> int:
+        """
+        Return the number of native DBM snapshots alive in this process.
+
+        The counter covers every :class:`DBM` object, for example those
+        returned by :meth:`Federation.to_dbm_list`. See
+        :meth:`Federation.live_count` for the federation counter.
+
+        :return: Number of live native DBMs.
+        :rtype: int
+
+        Example::
+
+            >>> from pyudbm import DBM, Context
+            >>> before = DBM.live_count()
+            >>> dbms = (Context(["x"]).x <= 1).to_dbm_list()
+            >>> DBM.live_count() - before
+            1
+        """
+
+        return _NativeDBM.live_count()
+
     def to_string(self, full: bool = False) -> str:
         """
         Return a textual representation of the DBM.
@@ -362,8 +492,7 @@ class DBM:
         """
 
         i, j = self._normalize_indices(i, j)
-        values = self._raw_matrix()
-        return values[i * self.dimension + j]
+        return self._raw_view()[i, j]
 
     def bound(self, i: Union[int, str], j: Union[int, str]) -> int:
         """
@@ -470,21 +599,104 @@ class DBM:
         if mode not in {"raw", "string", "tuple"}:
             raise ValueError("Unsupported matrix export mode: {0!r}.".format(mode))
 
-        rows = []  # type: List[List[Union[int, str, Tuple[str, Union[int, float]]]]]
-        for i in range(self.dimension):
-            row = []
-            for j in range(self.dimension):
-                raw_value = self.raw(i, j)
-                if mode == "raw":
-                    cell = raw_value
-                elif mode == "string":
-                    cell = _format_dbm_raw(raw_value)
-                else:
-                    cell = _tuple_from_dbm_raw(raw_value)
-                row.append(cell)
-            rows.append(row)
+        rows = self._raw_view().tolist()  # type: List[List[Union[int, str, Tuple[str, Union[int, float]]]]]
+        if mode == "string":
+            return [[_format_dbm_raw(raw_value) for raw_value in row] for row in rows]
+        if mode == "tuple":
+            return [[_tuple_from_dbm_raw(raw_value) for raw_value in row] for row in rows]
         return rows
 
+    def to_array(self, mode: str = "raw") -> Any:
+        """
+        Export the DBM matrix as a NumPy array.
+
+        ``mode="raw"`` returns a read-only ``int32`` view of shape
+        ``(dimension, dimension)`` that shares memory with the native DBM, so
+        no cell is copied. The other modes decode the whole matrix with
+        vectorized operations: ``"bound"`` yields the integer bounds as
+        :meth:`bound` does, ``"strict"`` yields the strictness flags of
+        :meth:`is_strict`, and ``"infinity"`` marks the ``< inf`` cells.
+
+        This method requires NumPy, available through ``pyudbm[numpy]``.
+
+        :param mode: Output mode. Supported values are ``"raw"``,
+            ``"bound"``, ``"strict"``, and ``"infinity"``.
+        :type mode: str
+        :return: Array of shape ``(dimension, dimension)``.
+        :rtype: numpy.ndarray
+        :raises TypeError: If ``mode`` is not a string.
+        :raises ValueError: If ``mode`` is not one of the supported modes.
+        :raises ImportError: If NumPy is not installed.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> dbm = (Context(["x"]).x <= 1).to_dbm_list()[0]
+            >>> dbm.to_array().tolist()
+            [[1, 1], [3, 1]]
+            >>> dbm.to_array(mode="bound").tolist()
+            [[0, 0], [1, 0]]
+            >>> dbm.to_array().flags.writeable
+            False
+        """
+
+        if not isinstance(mode, str):
+            raise TypeError("Array export mode must be a string.")
+        if mode not in {"raw", "bound", "strict", "infinity"}:
+            raise ValueError("Unsupported array export mode: {0!r}.".format(mode))
+
+        numpy = _require_numpy()
+        raw = numpy.asarray(self._raw_view())
+        if mode == "bound":
+            return raw >> 1
+        if mode == "strict":
+            return (raw & 1) == 0
+        if mode == "infinity":
+            return raw == _DBM_INFINITY_RAW
+        return raw
+
+    def volume(
+        self,
+        bounds: Optional[Mapping[Union[str, "Clock"], int]] = None,
+        samples: int = 10000,
+        seed: Optional[int] = None,
+    ) -> float:
+        """
+        Return the Lebesgue measure of this zone clipped to a box.
+
+        This is the single-DBM counterpart of :meth:`Federation.volume` and
+        follows the same rules: exact for at most two clocks, a native
+        hit-or-miss estimate with ``samples`` draws otherwise.
+
+        :param bounds: Upper bounds of the clipping box, keyed by clock or
+            clock name.
+        :type bounds: Mapping[str or Clock, int] or None
+        :param samples: Number of draws for the estimate with three or more
+            clocks.
+        :type samples: int
+        :param seed: Optional seed for a reproducible estimate.
+        :type seed: int or None
+        :return: Measure of the clipped zone.
+        :rtype: float
+        :raises TypeError: If a bound, ``samples`` or ``seed`` is not an
+            integer.
+        :raises ValueError: If a needed bound is missing or ``samples`` is not
+            positive.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"])
+            >>> dbm = ((context.x <= 2) & (context.y <= 3)).to_dbm_list()[0]
+            >>> dbm.volume()
+            6.0
+            >>> dbm.volume(bounds={"y": 1})
+            2.0
+        """
+
+        seed = _volume_options(samples, seed)
+        return self._dbm.volume(_box_vector(self.context, bounds), samples, seed)
+
     def format_matrix(self) -> str:
         """
         Return a human-readable table view of the DBM matrix.
@@ -578,6 +790,24 @@ class DBM:
         """
         return "DBM(clock_names={0})".format(self.clock_names)
 
+    def __reduce__(self) -> tuple:
+        """
+        Support pickling through the packed minimal-DBM encoding.
+
+        :return: Reconstruction recipe for :mod:`pickle`.
+        :rtype: tuple
+
+        Example::
+
+            >>> import pickle
+            >>> from pyudbm import Context
+            >>> dbm = (Context(["x"], name="c").x <= 1).to_dbm_list()[0]
+            >>> str(pickle.loads(pickle.dumps(dbm)))
+            '(c.x<=1)'
+        """
+
+        return _restore_dbm, (self.context, self.to_min_dbm())
+
     def plot(self, ax: Any = None, **kwargs: Any) -> Any:
         """
         Plot this DBM through :mod:`pyudbm.binding.visual`.
@@ -746,7 +976,7 @@ class Clock:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(self, None, bound, False))
+        return self.context._constraint_federation(self, None, bound, False)
 
     def __ge__(self, bound: Any) -> Any:
         """
@@ -766,7 +996,7 @@ class Clock:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(None, self, -bound, False))
+        return self.context._constraint_federation(None, self, -bound, False)
 
     def __lt__(self, bound: Any) -> Any:
         """
@@ -786,7 +1016,7 @@ class Clock:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(self, None, bound, True))
+        return self.context._constraint_federation(self, None, bound, True)
 
     def __gt__(self, bound: Any) -> Any:
         """
@@ -806,7 +1036,7 @@ class Clock:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(None, self, -bound, True))
+        return self.context._constraint_federation(None, self, -bound, True)
 
     def __eq__(self, bound: Any) -> Any:
         """
@@ -830,7 +1060,8 @@ class Clock:
             True
         """
         if _is_exact_int(bound):
-            return Federation(Constraint(self, None, bound, False)) & Federation(Constraint(None, self, -bound, False))
+            upper = self.context._constraint_federation(self, None, bound, False)
+            return upper & self.context._constraint_federation(None, self, -bound, False)
         return self is bound
 
     def __ne__(self, bound: Any) -> Any:
@@ -856,7 +1087,8 @@ class Clock:
             False
         """
         if _is_exact_int(bound):
-            return Federation(Constraint(self, None, bound, True)) | Federation(Constraint(None, self, -bound, True))
+            upper = self.context._constraint_federation(self, None, bound, True)
+            return upper | self.context._constraint_federation(None, self, -bound, True)
         return not self.__eq__(bound)
 
     def __hash__(self) -> int:
@@ -875,6 +1107,25 @@ class Clock:
         """
         return hash(self.get_full_name())
 
+    def __reduce__(self) -> tuple:
+        """
+        Support pickling as a reference into the pickled owning context.
+
+        :return: Reconstruction recipe for :mod:`pickle`.
+        :rtype: tuple
+
+        Example::
+
+            >>> import pickle
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"], name="c")
+            >>> restored_context, restored_y = pickle.loads(pickle.dumps((context, context.y)))
+            >>> restored_y is restored_context.y
+            True
+        """
+
+        return _restore_clock, (self.context, self.index)
+
     def get_full_name(self) -> str:
         """
         Return the fully-qualified clock name.
@@ -1186,7 +1437,7 @@ class VariableDifference:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(self.vars[0], self.vars[1], bound, False))
+        return self.context._constraint_federation(self.vars[0], self.vars[1], bound, False)
 
     def __ge__(self, bound: Any) -> Any:
         """
@@ -1206,7 +1457,7 @@ class VariableDifference:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(self.vars[1], self.vars[0], -bound, False))
+        return self.context._constraint_federation(self.vars[1], self.vars[0], -bound, False)
 
     def __lt__(self, bound: Any) -> Any:
         """
@@ -1226,7 +1477,7 @@ class VariableDifference:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(self.vars[0], self.vars[1], bound, True))
+        return self.context._constraint_federation(self.vars[0], self.vars[1], bound, True)
 
     def __gt__(self, bound: Any) -> Any:
         """
@@ -1246,7 +1497,7 @@ class VariableDifference:
         """
         if not _is_exact_int(bound):
             return NotImplemented
-        return Federation(Constraint(self.vars[1], self.vars[0], -bound, True))
+        return self.context._constraint_federation(self.vars[1], self.vars[0], -bound, True)
 
     def __eq__(self, bound: Any) -> Any:
         """
@@ -1267,9 +1518,8 @@ class VariableDifference:
         """
         if not _is_exact_int(bound):
             return False
-        return Federation(Constraint(self.vars[0], self.vars[1], bound, False)) & Federation(
-            Constraint(self.vars[1], self.vars[0], -bound, False)
-        )
+        upper = self.context._constraint_federation(self.vars[0], self.vars[1], bound, False)
+        return upper & self.context._constraint_federation(self.vars[1], self.vars[0], -bound, False)
 
     def __ne__(self, bound: Any) -> Any:
         """
@@ -1290,9 +1540,8 @@ class VariableDifference:
         """
         if not _is_exact_int(bound):
             return True
-        return Federation(Constraint(self.vars[0], self.vars[1], bound, True)) | Federation(
-            Constraint(self.vars[1], self.vars[0], -bound, True)
-        )
+        upper = self.context._constraint_federation(self.vars[0], self.vars[1], bound, True)
+        return upper | self.context._constraint_federation(self.vars[1], self.vars[0], -bound, True)
 
 
 class Constraint:
@@ -1376,6 +1625,48 @@ class Constraint:
         self._constraint = _NativeConstraint(i, j, val, is_strict)
 
 
+@dataclass(frozen=True)
+class FederationStats:
+    """
+    Snapshot of the structure and memory use of one :class:`Federation`.
+
+    :param dbm_count: Number of DBMs in the federation.
+    :type dbm_count: int
+    :param dimension: DBM dimension, including the reference clock.
+    :type dimension: int
+    :param allocated_bytes: Bytes held by the DBM matrices.
+    :type allocated_bytes: int
+    :param edge_counts: Minimal-graph edge count of every DBM.
+    :type edge_counts: tuple[int, ...]
+    :param reduce_gain: Number of DBMs a level-0 merge-reduce would remove.
+    :type reduce_gain: int
+
+    Example::
+
+        >>> from pyudbm import Context
+        >>> context = Context(["x"])
+        >>> (context.x <= 1).stats().edge_counts
+        (2,)
+    """
+
+    dbm_count: int
+    dimension: int
+    allocated_bytes: int
+    edge_counts: Tuple[int, ...]
+    reduce_gain: int
+
+    @property
+    def edge_count(self) -> int:
+        """
+        Return the total number of minimal-graph edges.
+
+        :return: Sum of :attr:`edge_counts`.
+        :rtype: int
+        """
+
+        return sum(self.edge_counts)
+
+
 class Federation:
     """
     Union of DBMs within a single :class:`Context`.
@@ -1401,13 +1692,37 @@ class Federation:
     * methods such as :meth:`up`, :meth:`down`, :meth:`free_clock`,
       :meth:`convex_hull`, :meth:`predt`, :meth:`update_value`,
       :meth:`reset_value`, and :meth:`extrapolate_max_bounds` return a modified
-      copy and leave the original federation untouched.
+      copy and leave the original federation untouched, unless they are called
+      with ``inplace=True``, in which case they transform the federation
+      directly and return ``self``. Chaining in-place steps such as
+      ``zone.reset_value(c.x, inplace=True).up(inplace=True)`` avoids one
+      federation clone per step.
+
+    Federations are copy-on-write handles around UDBM's reference-counted
+    storage: :meth:`copy` and the copy-returning methods share the DBMs of the
+    original until one side is written, so copies that are only read cost no
+    DBM allocation.
 
     The constructor mirrors the historical binding: creating from a
     :class:`Context` yields the zero federation, while creating from a
     :class:`Constraint` yields the initial federation constrained by that
     symbolic expression.
 
+    Thread safety follows the same split between shared and mutable state:
+
+    * :class:`Context`, :class:`Clock`, :class:`Constraint`, and :class:`DBM`
+      objects are immutable after construction and may be shared freely;
+    * federations may be read from several threads at once, and every
+      non-mutating operation returns a new federation, so independent workers
+      can start from one shared federation;
+    * in-place operators such as ``&=`` and mutating methods such as
+      :meth:`reduce` or :meth:`intern` must not race with other use of the
+      same federation object. Give each worker its own :meth:`copy` instead.
+
+    Sharing is about correctness, not speed: the UDBM calls of all threads are
+    serialized behind one native lock, so only the Python-side work between
+    them runs concurrently.
+
     :param arg: Context or symbolic constraint source.
     :type arg: Context or Constraint
     :ivar context: Context shared by every DBM in the federation.
@@ -1474,9 +1789,65 @@ class Federation:
         if other.context is not self.context:
             raise ValueError("Federation operations require the same context.")
 
+    def _apply_auto_reduce(self) -> None:
+        policy = self.context._auto_reduce
+        if policy is not None:
+            removed = self._fed.merge_reduce_above(policy[0], policy[1])
+            if removed is not None:
+                self.context._record_auto_reduce(removed)
+
     def _clock_names(self) -> List[str]:
         return ["0"] + [clock.get_full_name() for clock in self.context.clocks]
 
+    def _transform_target(self, inplace: bool) -> "Federation":
+        return self if inplace else self.copy()
+
+    def _require_optional_compatible(self, other: Optional["Federation"]) -> None:
+        if other is not None:
+            self._require_compatible(other)
+
+    def _resolve_clock(self, key: Union[str, Clock], role: str) -> Clock:
+        return _resolve_context_clock(self.context, key, role)
+
+    def _bounds_vector(self, bounds: Mapping[Union[str, Clock], Optional[int]], operation: str) -> List[int]:
+        normalized_bounds = {}
+        for key, value in bounds.items():
+            clock = self._resolve_clock(key, "Bounds")
+            if clock in normalized_bounds:
+                raise ValueError("Duplicate bounds provided for clock: {0}".format(clock.name))
+            normalized_bounds[clock] = -_DBM_INFINITY if value is None else int(value)
+
+        missing_clocks = [clock for clock in self.context.clocks if clock not in normalized_bounds]
+        if missing_clocks:
+            raise ValueError("{0} requires bounds for every clock.".format(operation))
+
+        vector = [0] * (len(self.context.clocks) + 1)
+        for clock in self.context.clocks:
+            vector[clock.dbm_index] = normalized_bounds[clock]
+        return vector
+
+    def _update_pairs(
+        self, resets: Union[Mapping[Union[str, Clock], int], Iterable[Union[str, Clock]]]
+    ) -> List[Tuple[int, int]]:
+        if isinstance(resets, Mapping):
+            items = list(resets.items())
+        elif isinstance(resets, (str, Clock)):
+            raise TypeError("Resets must be a mapping or an iterable of clocks.")
+        else:
+            items = [(key, 0) for key in resets]
+
+        updates = {}  # type: Dict[int, int]
+        for key, value in items:
+            clock = self._resolve_clock(key, "Reset")
+            if not _is_exact_int(value):
+                raise TypeError("Reset values must be integers.")
+            if not 0 <= value < _DBM_INFINITY:
+                raise ValueError("Reset value {0} for clock {1} is out of range.".format(value, clock.name))
+            if clock.dbm_index in updates:
+                raise ValueError("Duplicate reset provided for clock: {0}".format(clock.name))
+            updates[clock.dbm_index] = value
+        return list(updates.items())
+
     def _valuation_vector(self, valuation: Valuation) -> List[Union[int, float]]:
         values = [0]
         for clock in self.context.clocks:
@@ -1503,8 +1874,13 @@ class Federation:
         """
         Return a copy of the federation.
 
-        The copy shares the same :class:`Context` but owns an independent
-        native federation value.
+        The copy shares the same :class:`Context` and behaves as an independent
+        value. Copying is cheap: UDBM federations are copy-on-write handles,
+        so the copy shares the reference-counted DBM storage of the original
+        and the storage is only duplicated when either side is first
+        modified. Defensive copies that are never written therefore cost one
+        reference-count update. Use :func:`copy.deepcopy` to force fresh
+        storage up front.
 
         :return: A copy sharing the same context.
         :rtype: Federation
@@ -1524,6 +1900,84 @@ class Federation:
 
         return Federation._from_native(self.context, self._fed.copy())
 
+    def __copy__(self) -> "Federation":
+        """
+        Support :func:`copy.copy` through the copy-on-write :meth:`copy`.
+
+        :return: A copy sharing the same context.
+        :rtype: Federation
+
+        Example::
+
+            >>> import copy
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> zone = context.x <= 1
+            >>> copy.copy(zone).shares_storage_with(zone)
+            True
+        """
+
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Federation":
+        """
+        Support :func:`copy.deepcopy` with freshly allocated DBM storage.
+
+        Every DBM matrix is copied immediately instead of on first write. The
+        context is still shared, because contexts are compared by identity and
+        a copied context would make the result incompatible with the
+        original.
+
+        :param memo: Memo dictionary maintained by :func:`copy.deepcopy`.
+        :type memo: dict
+        :return: Deep copy sharing the same context.
+        :rtype: Federation
+
+        Example::
+
+            >>> import copy
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> zone = context.x <= 1
+            >>> copied = copy.deepcopy(zone)
+            >>> copied == zone, copied.shares_storage_with(zone), copied.context is context
+            (True, False, True)
+        """
+
+        result = Federation._from_native(self.context, self._fed.deep_copy())
+        memo[id(self)] = result
+        return result
+
+    def shares_storage_with(self, other: "Federation") -> bool:
+        """
+        Return whether both federations share one native storage block.
+
+        This is true for copies made with :meth:`copy` until either federation
+        is modified, and false once UDBM has detached them.
+
+        :param other: Federation to compare with.
+        :type other: Federation
+        :return: Whether the native storage is shared.
+        :rtype: bool
+        :raises TypeError: If ``other`` is not a federation.
+        :raises ValueError: If ``other`` belongs to another context.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"])
+            >>> zone = context.x <= 1
+            >>> copied = zone.copy()
+            >>> copied.shares_storage_with(zone)
+            True
+            >>> copied &= context.y <= 2
+            >>> copied.shares_storage_with(zone)
+            False
+        """
+
+        self._require_compatible(other)
+        return self._fed.shares_storage_with(other._fed)
+
     def plot(self, ax: Any = None, **kwargs: Any) -> Any:
         """
         Plot this federation through :mod:`pyudbm.binding.visual`.
@@ -1574,111 +2028,535 @@ class Federation:
 
         return [DBM(self.context, native) for native in self._fed.to_dbm_list()]
 
-    def to_cdd(self, cdd_context: Optional[Any] = None) -> Any:
-        """
-        Lift this federation into a :class:`pyudbm.binding.ucdd.CDD`.
-
-        :param cdd_context: Optional target CDD context.
-        :type cdd_context: Any
-        :return: Equivalent pure-clock CDD.
-        :rtype: Any
+    @classmethod
+    def from_array(cls, context: "Context", array: Any, validate: bool = True) -> "Federation":
         """
+        Build a federation from a stacked tensor of raw DBM matrices.
 
-        from .ucdd import CDD
+        ``array`` must have shape ``(n, dimension, dimension)`` where
+        ``dimension`` is the number of context clocks plus one, and must hold
+        UDBM ``raw_t`` encoded cells as produced by :meth:`to_array` or
+        :meth:`DBM.to_array`. The whole tensor is handed to UDBM in one native
+        call. Integer arrays of another dtype are converted to ``int32`` first;
+        values outside the ``int32`` range are rejected rather than wrapped.
 
-        return CDD.from_federation(self, cdd_context=cdd_context)
+        With ``validate=True`` every matrix is checked to be a closed,
+        non-empty DBM. Pass ``validate=False`` only for trusted input such as
+        a previous :meth:`to_array` export; invalid matrices then lead to
+        undefined federation contents.
 
-    def __and__(self, other: "Federation") -> "Federation":
-        """
-        Return the exact intersection of two federations.
+        This method requires NumPy, available through ``pyudbm[numpy]``.
 
-        :param other: Other federation in the same context.
-        :type other: Federation
-        :return: Intersection result.
+        :param context: Context whose clocks label the DBM matrices.
+        :type context: Context
+        :param array: Raw DBM tensor of shape ``(n, dimension, dimension)``.
+        :type array: numpy.ndarray
+        :param validate: Whether to validate every DBM matrix.
+        :type validate: bool
+        :return: Federation containing the ``n`` DBMs.
         :rtype: Federation
+        :raises TypeError: If ``context`` is not a :class:`Context` or the
+            array does not hold integers.
+        :raises ValueError: If the array shape does not match the context, a
+            value does not fit in ``int32``, or a matrix is not a valid DBM.
+        :raises ImportError: If NumPy is not installed.
 
         Example::
 
-            >>> from pyudbm import Context
-            >>> context = Context(["x"])
-            >>> left = context.x >= 1
-            >>> right = context.x <= 3
-            >>> (left & right) == ((context.x >= 1) & (context.x <= 3))
+            >>> from pyudbm import Context, Federation
+            >>> context = Context(["x"], name="c")
+            >>> federation = (context.x <= 1) | (context.x >= 3)
+            >>> Federation.from_array(context, federation.to_array()) == federation
             True
         """
-        self._require_compatible(other)
-        return Federation._from_native(self.context, self._fed.and_op(other._fed))
 
-    def __iand__(self, other: "Federation") -> "Federation":
-        """
-        Intersect this federation with another one in place.
+        if not isinstance(context, Context):
+            raise TypeError("Federation.from_array expects a Context.")
 
-        :param other: Other federation in the same context.
-        :type other: Federation
-        :return: ``self`` after intersection.
+        numpy = _require_numpy()
+        dimension = len(context.clocks) + 1
+        dbms = numpy.asarray(array)
+        if dbms.dtype.kind not in {"i", "u"}:
+            raise TypeError("Raw DBM tensors must hold integer values.")
+        if dbms.ndim != 3 or dbms.shape[1:] != (dimension, dimension):
+            raise ValueError(
+                "Raw DBM tensor shape {0!r} does not match the context, expected (n, {1}, {1}).".format(
+                    dbms.shape, dimension
+                )
+            )
+        _check_array_range(dbms, _INT32_MIN, _INT32_MAX, "Raw DBM tensor values must fit in int32.")
+        dbms = numpy.ascontiguousarray(dbms, dtype=numpy.int32)
+        return cls._from_native(context, _NativeFederation.from_raw_buffer(dbms, dimension, bool(validate)))
+
+    @classmethod
+    def from_constraints(cls, context: "Context", constraints: Any) -> "Federation":
+        """
+        Build the zone defined by a conjunction of difference constraints.
+
+        Combining many constraints with ``&`` closes one intermediate DBM per
+        operator. This constructor instead tightens one DBM with all
+        constraints and closes it once, which matters for zones loaded from
+        invariant tables or generated guards with hundreds of conjuncts.
+
+        ``constraints`` is either an iterable whose items are
+        :class:`Constraint` objects or ``(left, right, bound, is_strict)``
+        tuples meaning ``left - right < bound`` (strict) or
+        ``left - right <= bound``, or a NumPy integer array of shape
+        ``(n, 4)``. In tuples, ``left`` and ``right`` are :class:`Clock`
+        objects, clock names, or ``None`` for the reference clock. Array rows
+        hold DBM indices instead, with ``0`` for the reference clock and a
+        non-zero last column for strict bounds. The tuples returned by
+        :meth:`to_constraints` are accepted as-is.
+
+        :param context: Context of the participating clocks.
+        :type context: Context
+        :param constraints: Constraint sequence or ``(n, 4)`` integer array.
+        :type constraints: Iterable[Constraint or tuple] or numpy.ndarray
+        :return: One-DBM federation, or an empty federation when the
+            constraints are contradictory. No constraints yield the initial
+            zone where every clock is non-negative.
         :rtype: Federation
+        :raises TypeError: If ``context`` is not a :class:`Context` or a
+            constraint has invalid operand or bound types.
+        :raises ValueError: If a constraint refers to another context, uses
+            the same clock on both sides, or has an out-of-range bound.
 
         Example::
 
-            >>> from pyudbm import Context
-            >>> context = Context(["x"])
-            >>> zone = context.x >= 1
-            >>> zone &= (context.x <= 3)
-            >>> zone == ((context.x >= 1) & (context.x <= 3))
+            >>> from pyudbm import Context, Federation
+            >>> context = Context(["x", "y"])
+            >>> zone = Federation.from_constraints(context, [("x", None, 5, False), (context.y, "x", 2, True)])
+            >>> zone == (context.x <= 5) & (context.y - context.x < 2)
+            True
+            >>> Federation.from_constraints(context, [("x", None, 1, False), (None, "x", -2, False)]).is_empty()
             True
         """
-        self._require_compatible(other)
-        self._fed.iand(other._fed)
-        return self
 
-    def __or__(self, other: "Federation") -> "Federation":
+        if not isinstance(context, Context):
+            raise TypeError("Federation.from_constraints expects a Context.")
+
+        dimension = len(context.clocks) + 1
+        if hasattr(constraints, "dtype") and hasattr(constraints, "shape"):
+            numpy = _require_numpy()
+            table = numpy.asarray(constraints)
+            if table.dtype.kind not in {"i", "u", "b"}:
+                raise TypeError("Constraint arrays must hold integer values.")
+            if table.ndim != 2 or table.shape[1] != 4:
+                raise ValueError("Constraint array shape {0!r} is invalid, expected (n, 4).".format(table.shape))
+            # Check the untruncated values: an int32 cast would wrap them.
+            _check_array_range(table[:, :2], 0, dimension - 1, "Constraint array uses invalid DBM indices.")
+            _check_array_range(
+                table[:, 2], 1 - _DBM_INFINITY, _DBM_INFINITY - 1, "Constraint array bound is out of range."
+            )
+            rows = numpy.empty(table.shape, dtype=numpy.int32)
+            rows[:, :3] = table[:, :3]
+            rows[:, 3] = table[:, 3] != 0
+            table = rows
+        else:
+            values = array.array("i")
+            for item in constraints:
+                if isinstance(item, Constraint):
+                    if item.context is not context:
+                        raise ValueError("Constraints must belong to the same context.")
+                    raw = item._constraint.value()
+                    values.extend((item._constraint.i(), item._constraint.j(), raw >> 1, int(raw & 1 == 0)))
+                    continue
+
+                left, right, bound, is_strict = item
+                if not _is_exact_int(bound):
+                    raise TypeError("Constraint bounds must be integers.")
+                if not -_DBM_INFINITY < bound < _DBM_INFINITY:
+                    raise ValueError("Constraint bound {0} is out of range.".format(bound))
+                values.extend(
+                    (
+                        cls._constraint_index(context, left),
+                        cls._constraint_index(context, right),
+                        bound,
+                        int(bool(is_strict)),
+                    )
+                )
+            table = values
+
+        return cls._from_native(context, _NativeFederation.from_constraints(table, dimension))
+
+    @staticmethod
+    def _constraint_index(context: "Context", operand: Union[None, str, Clock]) -> int:
+        if operand is None:
+            return 0
+        if isinstance(operand, str):
+            operand = context[operand]
+        elif not isinstance(operand, Clock):
+            raise TypeError("Constraint operands must be clock names, Clock objects or None.")
+        if operand.context is not context:
+            raise ValueError("Constraint operands must belong to the same context.")
+        return operand.dbm_index
+
+    def to_constraints(self) -> List[List[Tuple[Optional[Clock], Optional[Clock], int, bool]]]:
         """
-        Return the set-theoretic union of two federations.
+        Return the minimal constraint system of every DBM.
 
-        :param other: Other federation in the same context.
-        :type other: Federation
-        :return: Union result.
-        :rtype: Federation
+        For each DBM, UDBM's minimal-graph analysis selects the constraints
+        that are not implied by the others; exactly those are returned, in
+        row-major DBM order, as ``(left, right, bound, is_strict)`` tuples
+        meaning ``left - right < bound`` or ``left - right <= bound``. ``None``
+        stands for the reference clock, so ``(x, None, 5, False)`` is
+        ``x <= 5`` and ``(None, x, -1, True)`` is ``x > 1``.
+
+        The extraction runs natively and does not go through string
+        rendering. Feeding one list back into :meth:`from_constraints`
+        rebuilds the corresponding DBM.
+
+        :return: One constraint list per DBM, in federation order.
+        :rtype: List[List[Tuple[Clock or None, Clock or None, int, bool]]]
 
         Example::
 
-            >>> from pyudbm import Context
+            >>> from pyudbm import Context, Federation
             >>> context = Context(["x"])
-            >>> union = (context.x == 0) | (context.x == 1)
-            >>> union.get_size()
-            2
+            >>> zone = (context.x > 1) & (context.x <= 5)
+            >>> [[(left and left.name, right and right.name, bound, strict) for left, right, bound, strict in dbm]
+            ...  for dbm in zone.to_constraints()]
+            [[(None, 'x', -1, True), ('x', None, 5, False)]]
+            >>> Federation.from_constraints(context, zone.to_constraints()[0]) == zone
+            True
         """
-        self._require_compatible(other)
-        return Federation._from_native(self.context, self._fed.or_op(other._fed))
 
-    def __ior__(self, other: "Federation") -> "Federation":
+        clocks = [None] + self.context.clocks  # type: List[Optional[Clock]]
+        return [
+            [(clocks[i], clocks[j], bound, is_strict) for i, j, bound, is_strict in rows]
+            for rows in self._fed.to_constraints()
+        ]
+
+    def to_array(self) -> Any:
         """
-        Union this federation with another one in place.
+        Export every DBM of the federation as one contiguous tensor.
 
-        :param other: Other federation in the same context.
-        :type other: Federation
-        :return: ``self`` after union.
-        :rtype: Federation
+        The result has shape ``(n, dimension, dimension)`` and ``int32``
+        dtype, with DBMs in native federation order and cells in UDBM's
+        ``raw_t`` encoding. It is filled in one native call and can be fed
+        back to :meth:`from_array`.
+
+        This method requires NumPy, available through ``pyudbm[numpy]``.
+
+        :return: Raw DBM tensor.
+        :rtype: numpy.ndarray
+        :raises ImportError: If NumPy is not installed.
 
         Example::
 
             >>> from pyudbm import Context
-            >>> context = Context(["x"])
-            >>> zone = context.x == 0
-            >>> zone |= (context.x == 1)
-            >>> zone.get_size()
-            2
+            >>> context = Context(["x"], name="c")
+            >>> ((context.x <= 1) | (context.x >= 3)).to_array().shape
+            (2, 2, 2)
         """
-        self._require_compatible(other)
-        self._fed.ior(other._fed)
-        return self
 
-    def __add__(self, other: "Federation") -> "Federation":
+        numpy = _require_numpy()
+        return numpy.asarray(self._fed.to_raw_buffer())
+
+    def to_bytes(self) -> bytes:
         """
-        Return the convex union of two federations.
+        Serialize the federation into a compact binary payload.
 
-        Unlike :meth:`__or__`, this computes UDBM's convex-hull style addition
-        and may introduce new valuations between the operands.
+        Every DBM is stored in UDBM's packed minimal-graph encoding, the same
+        one returned by :meth:`DBM.to_min_dbm`, behind a small header with the
+        dimension and DBM count. The payload does not carry clock names; it is
+        restored against a context of matching dimension with
+        :meth:`from_bytes`. DBM words use the native byte order of the writing
+        machine, which :meth:`from_bytes` checks.
+
+        :return: Binary federation payload.
+        :rtype: bytes
+
+        Example::
+
+            >>> from pyudbm import Context, Federation
+            >>> context = Context(["x", "y"], name="c")
+            >>> federation = (context.x - context.y <= 2) | (context.y > 5)
+            >>> Federation.from_bytes(context, federation.to_bytes()) == federation
+            True
+        """
+
+        header = _FEDERATION_BYTES_HEADER.pack(
+            _FEDERATION_BYTES_MAGIC,
+            _FEDERATION_BYTES_VERSION,
+            _NATIVE_BYTE_ORDER,
+            self._fed.get_dimension(),
+            self._fed.size(),
+        )
+        return header + self._fed.to_min_dbm_bytes()
+
+    @classmethod
+    def from_bytes(cls, context: "Context", data: bytes) -> "Federation":
+        """
+        Restore a federation serialized by :meth:`to_bytes`.
+
+        The payload is attached to ``context``, which only needs the same
+        number of clocks as the serialized federation. This makes
+        :meth:`to_bytes` / :meth:`from_bytes` the natural way to move zones
+        between processes that each own their own :class:`Context`.
+
+        Payloads are trusted input in the same sense as :mod:`pickle` data:
+        the header and the framing are checked, but the minimal-graph words
+        themselves are decoded as they are.
+
+        :param context: Context to attach the restored federation to.
+        :type context: Context
+        :param data: Payload produced by :meth:`to_bytes`.
+        :type data: bytes
+        :return: Restored federation.
+        :rtype: Federation
+        :raises TypeError: If ``context`` is not a :class:`Context`.
+        :raises ValueError: If the payload is malformed, was written with a
+            different byte order, or does not match the context dimension.
+
+        Example::
+
+            >>> from pyudbm import Context, Federation
+            >>> source = Context(["x"], name="a")
+            >>> target = Context(["t"], name="b")
+            >>> str(Federation.from_bytes(target, (source.x < 3).to_bytes()))
+            '(b.t<3)'
+        """
+
+        if not isinstance(context, Context):
+            raise TypeError("Federation.from_bytes expects a Context.")
+
+        data = bytes(data)
+        if len(data) < _FEDERATION_BYTES_HEADER.size:
+            raise ValueError("Federation payload is truncated.")
+        magic, version, byte_order, dimension, count = _FEDERATION_BYTES_HEADER.unpack_from(data)
+        if magic != _FEDERATION_BYTES_MAGIC or version != _FEDERATION_BYTES_VERSION:
+            raise ValueError("Data is not a supported federation payload.")
+        if byte_order != _NATIVE_BYTE_ORDER:
+            raise ValueError("Federation payload was written with a different byte order.")
+        if dimension != len(context.clocks) + 1:
+            raise ValueError(
+                "Federation payload dimension {0} does not match the context dimension {1}.".format(
+                    dimension, len(context.clocks) + 1
+                )
+            )
+
+        native = _NativeFederation.from_min_dbm_bytes(data[_FEDERATION_BYTES_HEADER.size:], dimension)
+        if native.size() != count:
+            raise ValueError("Federation payload DBM count does not match its header.")
+        return cls._from_native(context, native)
+
+    def remap(
+        self, target_context: "Context", mapping: Optional[Mapping[Union[str, Clock], Union[str, Clock]]] = None
+    ) -> "Federation":
+        """
+        Move the federation into another context.
+
+        ``mapping`` sends clocks of this federation's context to clocks of
+        ``target_context``; keys and values may be :class:`Clock` objects or
+        clock names. Without a mapping, clocks are matched by name. The
+        result is computed natively in one pass over the DBM matrices:
+
+        * mapped clocks keep all their constraints, in any new order;
+        * source clocks that are not mapped are existentially eliminated, as
+          with :meth:`free_clock` followed by dropping the clock;
+        * target clocks that nothing maps to are unconstrained apart from
+          being non-negative.
+
+        This makes zones built for different process compositions
+        combinable without rebuilding them from constraints.
+
+        :param target_context: Context of the result.
+        :type target_context: Context
+        :param mapping: Source-to-target clock mapping; clocks are matched by
+            name when omitted.
+        :type mapping: Mapping[str or Clock, str or Clock] or None
+        :return: Equivalent federation over ``target_context``.
+        :rtype: Federation
+        :raises TypeError: If ``target_context`` is not a :class:`Context` or
+            a mapping key or value is neither a clock name nor a clock.
+        :raises ValueError: If a clock belongs to the wrong context or two
+            source clocks map to the same target clock.
+        :raises KeyError: If a clock name is unknown or ambiguous.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> source = Context(["x", "y", "z"])
+            >>> target = Context(["z", "w", "x"])
+            >>> zone = (source.x - source.y <= 1) & (source.y <= 3) & (source.z == 2)
+            >>> zone.remap(target) == (target.z == 2) & (target.x <= 4)
+            True
+            >>> zone.remap(target, {"y": "w"}) == (target.w <= 3)
+            True
+        """
+
+        if not isinstance(target_context, Context):
+            raise TypeError("Federation.remap expects a target Context.")
+
+        if mapping is None:
+            mapping = {
+                clock.name: clock.name
+                for clock in self.context.clocks
+                if target_context._clock_index.get(clock.name) is not None
+            }
+        sources = [0] + [-1] * len(target_context.clocks)
+        for key, value in mapping.items():
+            source = _resolve_context_clock(self.context, key, "Remap source")
+            target = _resolve_context_clock(target_context, value, "Remap target")
+            if sources[target.dbm_index] >= 0:
+                raise ValueError("Several clocks are mapped to target clock: {0}".format(target.name))
+            sources[target.dbm_index] = source.dbm_index
+        return Federation._from_native(target_context, self._fed.remap(sources))
+
+    def project(self, clocks: Iterable[Union[str, Clock]], context: Optional["Context"] = None) -> "Federation":
+        """
+        Existentially eliminate every clock except ``clocks``.
+
+        The kept clocks become, in the given order, the clocks of the result
+        context. Without ``context`` a new context with the same clock names
+        and display name is created; a given ``context`` must have exactly as
+        many clocks, which receive the kept clocks positionally.
+
+        :param clocks: Clocks to keep, as :class:`Clock` objects or names.
+        :type clocks: Iterable[str or Clock]
+        :param context: Optional context of the result.
+        :type context: Context or None
+        :return: Projected federation.
+        :rtype: Federation
+        :raises TypeError: If a clock is neither a name nor a :class:`Clock`,
+            or ``context`` is not a :class:`Context`.
+        :raises ValueError: If a clock belongs to another context, is listed
+            twice, or ``context`` has the wrong number of clocks.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y", "z"], name="c")
+            >>> zone = (context.x - context.y <= 1) & (context.y <= 3) & (context.z == 2)
+            >>> projected = zone.project(["x"])
+            >>> [clock.get_full_name() for clock in projected.context.clocks]
+            ['c.x']
+            >>> projected == (projected.context.x <= 4)
+            True
+        """
+
+        kept = [_resolve_context_clock(self.context, clock, "Projection") for clock in clocks]
+        if len(set(kept)) != len(kept):
+            raise ValueError("Projection clocks must be distinct.")
+        if context is None:
+            context = Context([clock.name for clock in kept], name=self.context.name)
+        elif not isinstance(context, Context):
+            raise TypeError("Federation.project expects a Context or None.")
+        elif len(context.clocks) != len(kept):
+            raise ValueError("Projection context must have exactly one clock per kept clock.")
+        return self.remap(context, {clock: target for clock, target in zip(kept, context.clocks)})
+
+    def to_cdd(self, cdd_context: Optional[Any] = None) -> Any:
+        """
+        Lift this federation into a :class:`pyudbm.binding.ucdd.CDD`.
+
+        :param cdd_context: Optional target CDD context.
+        :type cdd_context: Any
+        :return: Equivalent pure-clock CDD.
+        :rtype: Any
+        """
+
+        from .ucdd import CDD
+
+        return CDD.from_federation(self, cdd_context=cdd_context)
+
+    def __and__(self, other: "Federation") -> "Federation":
+        """
+        Return the exact intersection of two federations.
+
+        :param other: Other federation in the same context.
+        :type other: Federation
+        :return: Intersection result.
+        :rtype: Federation
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> left = context.x >= 1
+            >>> right = context.x <= 3
+            >>> (left & right) == ((context.x >= 1) & (context.x <= 3))
+            True
+        """
+        self._require_compatible(other)
+        return Federation._from_native(self.context, self._fed.and_op(other._fed))
+
+    def __iand__(self, other: "Federation") -> "Federation":
+        """
+        Intersect this federation with another one in place.
+
+        :param other: Other federation in the same context.
+        :type other: Federation
+        :return: ``self`` after intersection.
+        :rtype: Federation
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> zone = context.x >= 1
+            >>> zone &= (context.x <= 3)
+            >>> zone == ((context.x >= 1) & (context.x <= 3))
+            True
+        """
+        self._require_compatible(other)
+        self._fed.iand(other._fed)
+        return self
+
+    def __or__(self, other: "Federation") -> "Federation":
+        """
+        Return the set-theoretic union of two federations.
+
+        :param other: Other federation in the same context.
+        :type other: Federation
+        :return: Union result.
+        :rtype: Federation
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> union = (context.x == 0) | (context.x == 1)
+            >>> union.get_size()
+            2
+        """
+        self._require_compatible(other)
+        return Federation._from_native(self.context, self._fed.or_op(other._fed))
+
+    def __ior__(self, other: "Federation") -> "Federation":
+        """
+        Union this federation with another one in place.
+
+        When the context has an ``auto_reduce`` policy (see
+        :meth:`Context.set_auto_reduce`), the result is merge-reduced once it
+        holds more DBMs than the policy threshold.
+
+        :param other: Other federation in the same context.
+        :type other: Federation
+        :return: ``self`` after union.
+        :rtype: Federation
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> zone = context.x == 0
+            >>> zone |= (context.x == 1)
+            >>> zone.get_size()
+            2
+        """
+        self._require_compatible(other)
+        self._fed.ior(other._fed)
+        self._apply_auto_reduce()
+        return self
+
+    def __add__(self, other: "Federation") -> "Federation":
+        """
+        Return the convex union of two federations.
+
+        Unlike :meth:`__or__`, this computes UDBM's convex-hull style addition
+        and may introduce new valuations between the operands.
 
         :param other: Other federation in the same context.
         :type other: Federation
@@ -1746,6 +2624,10 @@ class Federation:
         """
         Subtract another federation from this one in place.
 
+        When the context has an ``auto_reduce`` policy (see
+        :meth:`Context.set_auto_reduce`), the result is merge-reduced once it
+        holds more DBMs than the policy threshold.
+
         :param other: Other federation in the same context.
         :type other: Federation
         :return: ``self`` after subtraction.
@@ -1762,9 +2644,10 @@ class Federation:
         """
         self._require_compatible(other)
         self._fed.isub(other._fed)
+        self._apply_auto_reduce()
         return self
 
-    def up(self) -> "Federation":
+    def up(self, inplace: bool = False) -> "Federation":
         """
         Compute the delay successor of the federation.
 
@@ -1772,7 +2655,11 @@ class Federation:
         from every DBM, which is the standard strongest post-condition for time
         elapse.
 
-        :return: A delayed copy of the federation.
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :return: A delayed copy of the federation, or ``self`` when
+            ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -1786,18 +2673,22 @@ class Federation:
             >>> zone != expected
             True
         """
-        ret = self.copy()
+        ret = self._transform_target(inplace)
         ret._fed.up()
         return ret
 
-    def down(self) -> "Federation":
+    def down(self, inplace: bool = False) -> "Federation":
         """
         Compute the inverse delay predecessor of the federation.
 
         This is the standard weakest pre-condition for time elapse: lower
         bounds are relaxed so that delaying can lead into the current zone.
 
-        :return: A predecessor copy of the federation.
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :return: A predecessor copy of the federation, or ``self`` when
+            ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -1809,7 +2700,7 @@ class Federation:
             >>> zone.down() == expected
             True
         """
-        ret = self.copy()
+        ret = self._transform_target(inplace)
         ret._fed.down()
         return ret
 
@@ -1841,7 +2732,7 @@ class Federation:
         self._fed.merge_reduce(0, level)
         return self
 
-    def free_clock(self, clock: Clock) -> "Federation":
+    def free_clock(self, clock: Clock, inplace: bool = False) -> "Federation":
         """
         Return a copy where one clock has been unconstrained.
 
@@ -1851,7 +2742,11 @@ class Federation:
 
         :param clock: Clock to unconstrain.
         :type clock: Clock
-        :return: A modified copy with the clock freed.
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :return: A modified copy with the clock freed, or ``self`` when
+            ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -1868,7 +2763,7 @@ class Federation:
             raise TypeError("free_clock expects a Clock instance.")
         if clock.context is not self.context:
             raise ValueError("free_clock requires a clock from the same context.")
-        ret = self.copy()
+        ret = self._transform_target(inplace)
         ret._fed.free_clock(clock.dbm_index)
         return ret
 
@@ -1937,14 +2832,17 @@ class Federation:
         self._fed.set_init()
         return self
 
-    def convex_hull(self) -> "Federation":
+    def convex_hull(self, inplace: bool = False) -> "Federation":
         """
         Return the convex hull of the federation.
 
         UDBM computes the convex union of all DBMs in the federation, yielding
         one convex over-approximation zone.
 
-        :return: A convex-hull copy.
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :return: A convex-hull copy, or ``self`` when ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -1958,7 +2856,7 @@ class Federation:
             >>> (d1 | d2).convex_hull() == hull
             True
         """
-        ret = self.copy()
+        ret = self._transform_target(inplace)
         ret._fed.convex_hull()
         return ret
 
@@ -2101,7 +2999,7 @@ class Federation:
         """
         self._fed.intern()
 
-    def predt(self, other: "Federation") -> "Federation":
+    def predt(self, other: "Federation", inplace: bool = False) -> "Federation":
         """
         Compute the temporal predecessor of ``self`` while avoiding ``other``.
 
@@ -2112,7 +3010,10 @@ class Federation:
 
         :param other: Forbidden region to avoid during delay.
         :type other: Federation
-        :return: A predecessor copy.
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :return: A predecessor copy, or ``self`` when ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -2125,7 +3026,7 @@ class Federation:
             True
         """
         self._require_compatible(other)
-        ret = self.copy()
+        ret = self._transform_target(inplace)
         ret._fed.predt(other._fed)
         return ret
 
@@ -2161,7 +3062,180 @@ class Federation:
             return self._fed.contains_float(values)
         raise TypeError("Unknown valuation type.")
 
-    def update_value(self, clock: Clock, value: int) -> "Federation":
+    def contains_many(self, points: Any) -> Any:
+        """
+        Test many concrete clock points against the federation at once.
+
+        ``points`` is a two-dimensional array of shape ``(n, clocks)`` whose
+        columns follow the order of :attr:`Context.clocks`; the reference clock
+        is implicit. Integer arrays use the same check as an
+        :class:`IntValuation`, floating-point arrays the same check as a
+        :class:`FloatValuation`. All points are tested in one native call that
+        does not hold the GIL. Integer clock values must lie in
+        ``[0, 2**31 - 1]``; they are checked before the conversion to
+        ``int32``, so out-of-range values are rejected instead of wrapped.
+
+        This method requires NumPy, available through ``pyudbm[numpy]``.
+
+        :param points: Clock values, one row per point.
+        :type points: numpy.ndarray
+        :return: Boolean mask of shape ``(n,)``.
+        :rtype: numpy.ndarray
+        :raises TypeError: If the array is neither integer nor floating-point.
+        :raises ValueError: If the array shape does not match the context, or
+            an integer clock value is negative or does not fit in ``int32``.
+        :raises ImportError: If NumPy is not installed.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"])
+            >>> zone = (context.x <= 2) & (context.y - context.x < 1)
+            >>> zone.contains_many([[0, 0], [2, 3], [3, 0]]).tolist()
+            [True, False, False]
+            >>> zone.contains_many([[1.5, 2.25]]).tolist()
+            [True]
+        """
+
+        numpy = _require_numpy()
+        values = numpy.asarray(points)
+        if values.ndim != 2 or values.shape[1] != len(self.context.clocks):
+            raise ValueError(
+                "Point array shape {0!r} does not match the context, expected (n, {1}).".format(
+                    values.shape, len(self.context.clocks)
+                )
+            )
+        if values.dtype.kind in {"i", "u"}:
+            _check_array_range(values, 0, _INT32_MAX, "Integer clock values must lie in [0, 2**31 - 1].")
+            mask = self._fed.contains_int_points(numpy.ascontiguousarray(values, dtype=numpy.int32))
+        elif values.dtype.kind == "f":
+            mask = self._fed.contains_float_points(numpy.ascontiguousarray(values, dtype=numpy.float64))
+        else:
+            raise TypeError("Point arrays must hold integer or floating-point values.")
+        return numpy.asarray(mask) != 0
+
+    def sample(
+        self,
+        n: int,
+        seed: Optional[int] = None,
+        bounds: Optional[Mapping[Union[str, Clock], int]] = None,
+        integer: bool = False,
+    ) -> Any:
+        """
+        Draw clock valuations uniformly at random from the federation.
+
+        Points are drawn natively, without holding the GIL, from the union of
+        the DBMs clipped to the box ``0 <= clock <= bounds[clock]``. Each DBM
+        is chosen with probability proportional to its bounding box, and a
+        point drawn in that box is kept only when it lies in the chosen DBM
+        and in no earlier DBM of the federation. The result is therefore
+        uniform over the union even when DBMs overlap.
+
+        Bounds may be omitted for clocks that are bounded in every DBM; clocks
+        that are unbounded somewhere need one. With ``integer=False`` points
+        are real-valued and zones without volume, such as ``x == 1`` or
+        ``x - y == 0``, cannot be sampled. With ``integer=True`` the integer
+        points of the clipped union are sampled uniformly instead.
+
+        This method requires NumPy, available through ``pyudbm[numpy]``.
+
+        :param n: Number of points to draw.
+        :type n: int
+        :param seed: Optional seed for reproducible draws.
+        :type seed: int or None
+        :param bounds: Upper bounds of the sampling box, keyed by clock or
+            clock name.
+        :type bounds: Mapping[str or Clock, int] or None
+        :param integer: Whether to sample integer points.
+        :type integer: bool
+        :return: Array of shape ``(n, clocks)`` with columns in
+            :attr:`Context.clocks` order, ``float64`` or ``int32`` for
+            ``integer=True``.
+        :rtype: numpy.ndarray
+        :raises TypeError: If ``n``, ``seed`` or a bound is not an integer.
+        :raises ValueError: If the federation is empty, a needed bound is
+            missing, or the clipped union has no volume (or no integer
+            points).
+        :raises ImportError: If NumPy is not installed.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"])
+            >>> zone = (context.x <= 2) & (context.y - context.x < 1)
+            >>> points = zone.sample(100, seed=7, bounds={"y": 5})
+            >>> points.shape
+            (100, 2)
+            >>> bool(zone.contains_many(points).all())
+            True
+            >>> sorted({tuple(point) for point in zone.sample(200, seed=1, integer=True, bounds={"y": 5}).tolist()})
+            [(0, 0), (1, 0), (1, 1), (2, 0), (2, 1), (2, 2)]
+        """
+
+        numpy = _require_numpy()
+        if not _is_exact_int(n):
+            raise TypeError("Sample size must be an integer.")
+        if n < 0:
+            raise ValueError("Sample size must not be negative.")
+        if seed is not None and not _is_exact_int(seed):
+            raise TypeError("Sample seed must be an integer or None.")
+        if seed is not None:
+            seed &= (1 << 64) - 1
+
+        vector = _box_vector(self.context, bounds)
+        if integer:
+            return numpy.asarray(self._fed.sample_int(n, vector, seed))
+        return numpy.asarray(self._fed.sample_real(n, vector, seed))
+
+    def volume(
+        self,
+        bounds: Optional[Mapping[Union[str, Clock], int]] = None,
+        samples: int = 10000,
+        seed: Optional[int] = None,
+    ) -> float:
+        """
+        Return the Lebesgue measure of the federation clipped to a box.
+
+        The box is ``0 <= clock <= bounds[clock]``; bounds may be omitted for
+        clocks that are bounded in every DBM. Overlapping DBMs are counted
+        once. With at most two clocks the result is exact: the federation is
+        split into disjoint DBMs and every DBM is measured as an interval or a
+        clipped polygon. With more clocks the measure is estimated natively
+        by hit-or-miss sampling of ``samples`` points in the DBM bounding
+        boxes, the same proposal scheme as :meth:`sample`; the standard error
+        shrinks with the square root of ``samples``. Strictness of bounds does
+        not affect the measure.
+
+        :param bounds: Upper bounds of the clipping box, keyed by clock or
+            clock name.
+        :type bounds: Mapping[str or Clock, int] or None
+        :param samples: Number of draws for the estimate with three or more
+            clocks.
+        :type samples: int
+        :param seed: Optional seed for a reproducible estimate.
+        :type seed: int or None
+        :return: Measure of the clipped federation.
+        :rtype: float
+        :raises TypeError: If a bound, ``samples`` or ``seed`` is not an
+            integer.
+        :raises ValueError: If a needed bound is missing or ``samples`` is not
+            positive.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"])
+            >>> zone = (context.x <= 2) & (context.y - context.x < 1)
+            >>> zone.volume(bounds={"y": 5})
+            4.0
+            >>> (zone | ((context.x >= 1) & (context.x <= 3) & (context.y <= 1))).volume()
+            5.0
+        """
+
+        seed = _volume_options(samples, seed)
+        return self._fed.volume(_box_vector(self.context, bounds), samples, seed)
+
+    def update_value(self, clock: Clock, value: int, inplace: bool = False) -> "Federation":
         """
         Return a copy where one clock has been updated to a constant value.
 
@@ -2172,7 +3246,11 @@ class Federation:
         :type clock: Clock
         :param value: New integer value.
         :type value: int
-        :return: Updated copy of the federation.
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :return: Updated copy of the federation, or ``self`` when
+            ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -2185,11 +3263,11 @@ class Federation:
         """
         if clock.context is not self.context:
             raise ValueError("Clock update requires the same context.")
-        ret = self.copy()
+        ret = self._transform_target(inplace)
         ret._fed.update_value(clock.dbm_index, value)
         return ret
 
-    def reset_value(self, clock: Clock) -> "Federation":
+    def reset_value(self, clock: Clock, inplace: bool = False) -> "Federation":
         """
         Return a copy where one clock has been reset to ``0``.
 
@@ -2197,7 +3275,11 @@ class Federation:
 
         :param clock: Clock to reset.
         :type clock: Clock
-        :return: Updated copy of the federation.
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :return: Updated copy of the federation, or ``self`` when
+            ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -2208,7 +3290,7 @@ class Federation:
             >>> zone.reset_value(context.x) == ((context.x == 0) & (context.z == 2))
             True
         """
-        return self.update_value(clock, 0)
+        return self.update_value(clock, 0, inplace=inplace)
 
     def get_size(self) -> int:
         """
@@ -2230,7 +3312,69 @@ class Federation:
         """
         return self._fed.size()
 
-    def extrapolate_max_bounds(self, bounds: Mapping[Union[str, Clock], int]) -> "Federation":
+    def stats(self) -> "FederationStats":
+        """
+        Return structural and memory statistics of the federation.
+
+        Besides the DBM count and dimension, the snapshot reports the bytes
+        held by the DBM matrices, the number of minimal-graph edges of every
+        DBM (the constraints :meth:`to_constraints` would return), and how many
+        DBMs a level-0 :meth:`reduce` would remove. The last figure comes from
+        merge-reducing a copy, so it costs as much as :meth:`reduce` itself;
+        the federation is left untouched.
+
+        ``allocated_bytes`` counts each matrix once for this federation.
+        Copies that still share storage with it (see :meth:`copy`) are not
+        deducted, so summing over many federations gives an upper bound.
+
+        :return: Statistics snapshot.
+        :rtype: FederationStats
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> stats = ((context.x >= 1) | (context.x <= 1)).stats()
+            >>> stats.dbm_count, stats.dimension, stats.allocated_bytes, stats.reduce_gain
+            (2, 2, 32, 1)
+        """
+
+        dbm_count, dimension, allocated_bytes, edge_counts, reduce_gain = self._fed.stats()
+        return FederationStats(
+            dbm_count=dbm_count,
+            dimension=dimension,
+            allocated_bytes=allocated_bytes,
+            edge_counts=tuple(edge_counts),
+            reduce_gain=reduce_gain,
+        )
+
+    @staticmethod
+    def live_count() -> int:
+        """
+        Return the number of native federations alive in this process.
+
+        Every :class:`Federation` holds one native federation, and so do
+        internal caches such as the :class:`Context` constraint cache. The
+        counter is process-wide and safe to read from any thread, which makes
+        it suitable for memory budgets of long-running explorations.
+
+        :return: Number of live native federations.
+        :rtype: int
+
+        Example::
+
+            >>> from pyudbm import Context, Federation
+            >>> before = Federation.live_count()
+            >>> zone = Context(["x"]).x <= 1
+            >>> Federation.live_count() - before
+            1
+        """
+
+        return _NativeFederation.live_count()
+
+    def extrapolate_max_bounds(
+        self, bounds: Mapping[Union[str, Clock], Optional[int]], inplace: bool = False, diagonal: bool = False
+    ) -> "Federation":
         """
         Return a maximal-bound extrapolation of the federation.
 
@@ -2241,13 +3385,26 @@ class Federation:
         clock. The operation preserves closure but may over-approximate the
         original zone.
 
+        With ``diagonal=True`` UDBM's ``diagonalExtrapolateMaxBounds`` is used
+        instead. Once a clock exceeds its maximal constant it also drops the
+        difference constraints involving that clock, giving a coarser
+        abstraction with fewer symbolic states. Like the classical operator it
+        is only exact for models without clock-difference guards.
+
         The Python wrapper accepts a mapping keyed either by :class:`Clock`
         objects or by clock names. Bounds must be provided for every clock in
-        the context.
+        the context. A bound of ``None`` marks a clock that is never compared
+        with a constant; such a clock is abstracted away entirely.
 
         :param bounds: Maximal constants for every user clock.
-        :type bounds: Mapping[str or Clock, int]
-        :return: Extrapolated copy of the federation.
+        :type bounds: Mapping[str or Clock, int or None]
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :param diagonal: Whether to use the coarser diagonal variant.
+        :type diagonal: bool
+        :return: Extrapolated copy of the federation, or ``self`` when
+            ``inplace`` is true.
         :rtype: Federation
 
         Example::
@@ -2260,33 +3417,186 @@ class Federation:
             >>> federation.extrapolate_max_bounds(bounds) == ((context.x - context.y <= 1) & (context.z < 150))
             True
         """
-        normalized_bounds = {}
-        for key, value in bounds.items():
-            if isinstance(key, str):
-                clock = self.context[key]
-            elif isinstance(key, Clock):
-                clock = key
-            else:
-                raise TypeError("Bounds keys must be clock names or Clock objects.")
-
-            if clock.context is not self.context:
-                raise ValueError("Bounds clocks must belong to the same context.")
-            if clock in normalized_bounds:
-                raise ValueError("Duplicate bounds provided for clock: {0}".format(clock.name))
-            normalized_bounds[clock] = int(value)
+        vector = self._bounds_vector(bounds, "extrapolate_max_bounds")
+        ret = self._transform_target(inplace)
+        ret._fed.extrapolate_max_bounds(vector, bool(diagonal))
+        return ret
 
-        missing_clocks = [clock for clock in self.context.clocks if clock not in normalized_bounds]
-        if missing_clocks:
-            raise ValueError("extrapolate_max_bounds requires bounds for every clock.")
+    def extrapolate_lu_bounds(
+        self,
+        lower: Mapping[Union[str, Clock], Optional[int]],
+        upper: Mapping[Union[str, Clock], Optional[int]],
+        inplace: bool = False,
+        diagonal: bool = False,
+    ) -> "Federation":
+        """
+        Return a lower/upper-bound (LU) extrapolation of the federation.
+
+        UDBM's ``extrapolateLUBounds`` distinguishes, for every clock, the
+        largest constant in lower-bound comparisons such as ``x > c`` from the
+        largest constant in upper-bound comparisons such as ``x < c``. Using
+        both yields a coarser, still sound abstraction than
+        :meth:`extrapolate_max_bounds` with ``max(lower, upper)``, and usually
+        far fewer symbolic states. ``diagonal=True`` selects
+        ``diagonalExtrapolateLUBounds``.
+
+        Both mappings follow the conventions of :meth:`extrapolate_max_bounds`:
+        they must cover every clock, and ``None`` marks a clock without such
+        comparisons.
+
+        :param lower: Largest lower-bound constant of every user clock.
+        :type lower: Mapping[str or Clock, int or None]
+        :param upper: Largest upper-bound constant of every user clock.
+        :type upper: Mapping[str or Clock, int or None]
+        :param inplace: Whether to transform this federation directly and
+            return it instead of transforming a copy.
+        :type inplace: bool
+        :param diagonal: Whether to use the coarser diagonal variant.
+        :type diagonal: bool
+        :return: Extrapolated copy of the federation, or ``self`` when
+            ``inplace`` is true.
+        :rtype: Federation
 
-        ret = self.copy()
-        vector = [0] * (len(self.context.clocks) + 1)
-        for clock in self.context.clocks:
-            vector[clock.dbm_index] = normalized_bounds[clock]
+        Example::
 
-        ret._fed.extrapolate_max_bounds(vector)
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> zone = (context.x >= 5) & (context.x <= 7)
+            >>> zone.extrapolate_lu_bounds({context.x: 3}, {context.x: 10}) == (context.x >= 5)
+            True
+            >>> zone.extrapolate_max_bounds({context.x: 10}) == zone
+            True
+        """
+        lower_vector = self._bounds_vector(lower, "extrapolate_lu_bounds")
+        upper_vector = self._bounds_vector(upper, "extrapolate_lu_bounds")
+        ret = self._transform_target(inplace)
+        ret._fed.extrapolate_lu_bounds(lower_vector, upper_vector, bool(diagonal))
         return ret
 
+    def successor(
+        self,
+        guard: Optional["Federation"] = None,
+        resets: Union[Mapping[Union[str, Clock], int], Iterable[Union[str, Clock]]] = (),
+        invariant: Optional["Federation"] = None,
+        max_bounds: Optional[Mapping[Union[str, Clock], int]] = None,
+        delay: bool = True,
+    ) -> "Federation":
+        """
+        Compute the symbolic successor over one timed-automaton transition.
+
+        The result is the usual discrete-plus-delay step, computed in a single
+        native call:
+
+        1. intersect with ``guard``;
+        2. apply ``resets``;
+        3. intersect with the target ``invariant``;
+        4. let time elapse (:meth:`up`) and intersect with ``invariant`` again;
+        5. extrapolate with :meth:`extrapolate_max_bounds` when ``max_bounds``
+           is given.
+
+        The computation stops early, returning an empty federation, as soon
+        as the guard or the invariant leaves nothing. ``self`` is not
+        modified.
+
+        :param guard: Transition guard, or ``None`` for ``true``.
+        :type guard: Federation or None
+        :param resets: Clocks reset to ``0``, or a mapping from clocks to the
+            integer values they are updated to. Clocks may be given as
+            :class:`Clock` objects or names.
+        :type resets: Mapping[str or Clock, int] or Iterable[str or Clock]
+        :param invariant: Invariant of the target location, or ``None``.
+        :type invariant: Federation or None
+        :param max_bounds: Maximal constants for every clock, or ``None`` to
+            skip extrapolation.
+        :type max_bounds: Mapping[str or Clock, int] or None
+        :param delay: Whether to let time elapse in the target location.
+        :type delay: bool
+        :return: Successor federation.
+        :rtype: Federation
+        :raises TypeError: If an operand has the wrong type.
+        :raises ValueError: If an operand belongs to another context or a
+            reset value is negative.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"])
+            >>> zone = context.x - context.y == 0
+            >>> step = zone.successor(guard=context.x >= 2, resets=[context.x], invariant=context.y <= 5)
+            >>> step == (context.x - context.y <= -2) & (context.y <= 5) & (context.y - context.x <= 5)
+            True
+        """
+
+        updates = self._update_pairs(resets)
+        self._require_optional_compatible(guard)
+        self._require_optional_compatible(invariant)
+        vector = [] if max_bounds is None else self._bounds_vector(max_bounds, "successor")
+        native = self._fed.successor(
+            None if guard is None else guard._fed,
+            updates,
+            None if invariant is None else invariant._fed,
+            vector,
+            bool(delay),
+        )
+        return Federation._from_native(self.context, native)
+
+    def predecessor(
+        self,
+        guard: Optional["Federation"] = None,
+        resets: Union[Mapping[Union[str, Clock], int], Iterable[Union[str, Clock]]] = (),
+        invariant: Optional["Federation"] = None,
+        delay: bool = True,
+    ) -> "Federation":
+        """
+        Compute the symbolic predecessor over one timed-automaton transition.
+
+        This is the backward counterpart of :meth:`successor`. ``self`` is the
+        target zone, and the result contains the source states that can take
+        the transition into it:
+
+        1. keep the states consistent with the ``resets`` and free the reset
+           clocks;
+        2. intersect with ``guard`` and the source ``invariant``;
+        3. let time run backwards (:meth:`down`) and intersect with
+           ``invariant`` again.
+
+        ``self`` is not modified.
+
+        :param guard: Transition guard, or ``None`` for ``true``.
+        :type guard: Federation or None
+        :param resets: Clocks reset to ``0``, or a mapping from clocks to the
+            integer values they are updated to.
+        :type resets: Mapping[str or Clock, int] or Iterable[str or Clock]
+        :param invariant: Invariant of the source location, or ``None``.
+        :type invariant: Federation or None
+        :param delay: Whether to include time elapse in the source location.
+        :type delay: bool
+        :return: Predecessor federation.
+        :rtype: Federation
+        :raises TypeError: If an operand has the wrong type.
+        :raises ValueError: If an operand belongs to another context or a
+            reset value is negative.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"])
+            >>> target = (context.x <= 1) & (context.y <= 4)
+            >>> target.predecessor(guard=context.y >= 3, resets=[context.x]) == (context.y <= 4)
+            True
+        """
+
+        updates = self._update_pairs(resets)
+        self._require_optional_compatible(guard)
+        self._require_optional_compatible(invariant)
+        native = self._fed.predecessor(
+            None if guard is None else guard._fed,
+            updates,
+            None if invariant is None else invariant._fed,
+            bool(delay),
+        )
+        return Federation._from_native(self.context, native)
+
     def is_zero(self) -> bool:
         """
         Return whether the federation is exactly the origin zone.
@@ -2366,6 +3676,88 @@ class Federation:
         """
         return hash(self)
 
+    def __reduce__(self) -> tuple:
+        """
+        Support pickling through :meth:`to_bytes`.
+
+        The context is pickled alongside the payload, so federations pickled
+        together keep sharing one context after unpickling. Federations from
+        separate payloads get separate contexts; use :meth:`from_bytes` to
+        attach results to an existing context instead.
+
+        :return: Reconstruction recipe for :mod:`pickle`.
+        :rtype: tuple
+
+        Example::
+
+            >>> import pickle
+            >>> from pyudbm import Context
+            >>> context = Context(["x", "y"], name="c")
+            >>> left, right = pickle.loads(pickle.dumps((context.x < 1, context.y <= 2)))
+            >>> left.context is right.context
+            True
+            >>> str(left & right)
+            '(c.x<1 & c.y<=2)'
+        """
+
+        return _restore_federation, (self.context, self.to_bytes())
+
+
+@dataclass(frozen=True)
+class ConstraintCacheInfo:
+    """
+    Snapshot of the atomic constraint cache of one :class:`Context`.
+
+    :param hits: Number of constraint federations served from the cache.
+    :type hits: int
+    :param misses: Number of constraint federations built while caching.
+    :type misses: int
+    :param maxsize: Current cache capacity, ``0`` when caching is disabled.
+    :type maxsize: int
+    :param currsize: Number of cached constraint federations.
+    :type currsize: int
+
+    Example::
+
+        >>> from pyudbm import Context
+        >>> Context(["x"]).constraint_cache_info()
+        ConstraintCacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True)
+class AutoReduceInfo:
+    """
+    Automatic reduction policy of one :class:`Context` and its counters.
+
+    :param threshold: DBM count above which federations are reduced, or
+        ``None`` when the policy is disabled.
+    :type threshold: int or None
+    :param level: Expensive-try level passed to ``mergeReduce``, or ``None``
+        when the policy is disabled.
+    :type level: int or None
+    :param runs: Number of times the policy reduced a federation.
+    :type runs: int
+    :param dbms_removed: Total number of DBMs removed by those reductions.
+    :type dbms_removed: int
+
+    Example::
+
+        >>> from pyudbm import Context
+        >>> Context(["x"]).auto_reduce_info()
+        AutoReduceInfo(threshold=None, level=None, runs=0, dbms_removed=0)
+    """
+
+    threshold: Optional[int]
+    level: Optional[int]
+    runs: int
+    dbms_removed: int
+
 
 class Context:
     """
@@ -2385,10 +3777,36 @@ class Context:
     lookup keeps working even when a clock name would shadow an existing
     attribute.
 
+    Name lookup goes through a dictionary built once at construction time, so
+    ``context["x"]`` costs the same for the first and the last clock.
+
+    Every clock comparison such as ``context.x <= 5`` normally builds a fresh
+    native constraint and federation. Generated guard code evaluates the same
+    atomic constraints over and over, so a context may keep a bounded LRU
+    cache of those atomic federations. The cache is disabled by default and
+    enabled with ``constraint_cache_size`` or
+    :meth:`set_constraint_cache_size`. A hit returns a :meth:`Federation.copy`
+    of the cached federation; UDBM shares the DBM storage of such copies and
+    only duplicates it when one of them is modified, so hits are cheap and
+    callers may still mutate the result freely.
+
+    Federations built by repeated ``|=`` or ``-=`` keep growing until
+    :meth:`Federation.reduce` is called. An opt-in ``auto_reduce`` policy
+    ``(threshold, level)`` makes every in-place union or subtraction on a
+    federation of this context merge-reduce it natively, with the given
+    expensive-try level, as soon as it holds more than ``threshold`` DBMs.
+    :meth:`auto_reduce_info` reports how often the policy fired and how many
+    DBMs it removed.
+
     :param clock_names: Clock names to create.
     :type clock_names: iterable[str]
     :param name: Optional context prefix used in string rendering.
     :type name: str or None
+    :param constraint_cache_size: Maximal number of cached atomic constraint
+        federations, ``0`` to disable the cache.
+    :type constraint_cache_size: int
+    :param auto_reduce: Optional ``(threshold, level)`` reduction policy.
+    :type auto_reduce: tuple[int, int] or None
     :ivar clocks: List of clocks in declaration order.
     :ivar name: Optional display prefix used by :meth:`Clock.get_full_name`.
 
@@ -2404,7 +3822,13 @@ class Context:
         True
     """
 
-    def __init__(self, clock_names: Iterable[str], name: Optional[str] = None):
+    def __init__(
+        self,
+        clock_names: Iterable[str],
+        name: Optional[str] = None,
+        constraint_cache_size: int = 0,
+        auto_reduce: Optional[Tuple[int, int]] = None,
+    ):
         """
         Initialize a context and create all declared clocks.
 
@@ -2412,8 +3836,18 @@ class Context:
         :type clock_names: Iterable[str]
         :param name: Optional display prefix.
         :type name: str or None
+        :param constraint_cache_size: Maximal number of cached atomic
+            constraint federations, ``0`` to disable the cache.
+        :type constraint_cache_size: int
+        :param auto_reduce: Optional ``(threshold, level)`` reduction policy,
+            see :meth:`set_auto_reduce`.
+        :type auto_reduce: tuple[int, int] or None
         :return: ``None``.
         :rtype: None
+        :raises TypeError: If ``constraint_cache_size`` or ``auto_reduce``
+            has an invalid type.
+        :raises ValueError: If ``constraint_cache_size`` is negative or the
+            ``auto_reduce`` threshold is not positive.
 
         Example::
 
@@ -2426,15 +3860,30 @@ class Context:
         """
         self.clocks = []  # type: List[Clock]
         self.name = name
+        self._clock_index = {}  # type: Dict[str, Optional[Clock]]
+        self._constraint_cache = OrderedDict()  # type: OrderedDict[Tuple[int, int, int, bool], Federation]
+        self._constraint_cache_lock = threading.Lock()
+        self._constraint_cache_size = 0
+        self._constraint_cache_hits = 0
+        self._constraint_cache_misses = 0
+        self._auto_reduce = None  # type: Optional[Tuple[int, int]]
+        self._auto_reduce_lock = threading.Lock()
+        self._auto_reduce_runs = 0
+        self._auto_reduce_removed = 0
 
         for index, clock_name in enumerate(clock_names):
             clock = Clock(self, clock_name, index)
             self.clocks.append(clock)
+            # ``None`` marks a name declared more than once.
+            self._clock_index[clock_name] = None if clock_name in self._clock_index else clock
             if hasattr(self, clock_name):
                 LOGGER.warning("Class %s already has attribute %s.", self.__class__.__name__, clock_name)
             else:
                 setattr(self, clock_name, clock)
 
+        self.set_constraint_cache_size(constraint_cache_size)
+        self.set_auto_reduce(auto_reduce)
+
     def set_name(self, name: Optional[str]) -> None:
         """
         Set the context display name.
@@ -2475,12 +3924,205 @@ class Context:
             >>> context["x"] is context.x
             True
         """
-        names = [clock for clock in self.clocks if clock.name == arg]
-        if not names:
-            raise KeyError(arg)
-        if len(names) != 1:
+        try:
+            clock = self._clock_index[arg]
+        except (KeyError, TypeError):
+            raise KeyError(arg) from None
+        if clock is None:
             raise KeyError("Ambiguous clock name: {0}".format(arg))
-        return names[0]
+        return clock
+
+    def __reduce__(self) -> tuple:
+        """
+        Support pickling from the clock names and display name.
+
+        Contexts are compared by identity, so an unpickled context is a new
+        context that is only compatible with objects unpickled together with
+        it.
+
+        :return: Reconstruction recipe for :mod:`pickle`.
+        :rtype: tuple
+
+        Example::
+
+            >>> import pickle
+            >>> from pyudbm import Context
+            >>> restored = pickle.loads(pickle.dumps(Context(["x", "y"], name="c")))
+            >>> [clock.get_full_name() for clock in restored.clocks]
+            ['c.x', 'c.y']
+        """
+
+        return Context, (
+            [clock.name for clock in self.clocks],
+            self.name,
+            self._constraint_cache_size,
+            self._auto_reduce,
+        )
+
+    def _constraint_federation(
+        self, arg1: Optional[Clock], arg2: Optional[Clock], val: int, is_strict: bool
+    ) -> Federation:
+        if not self._constraint_cache_size:
+            return Federation(Constraint(arg1, arg2, val, is_strict))
+
+        key = (arg1.dbm_index if arg1 is not None else 0, arg2.dbm_index if arg2 is not None else 0, val, is_strict)
+        with self._constraint_cache_lock:
+            cached = self._constraint_cache.get(key)
+            if cached is not None:
+                self._constraint_cache.move_to_end(key)
+                self._constraint_cache_hits += 1
+                return cached.copy()
+
+        federation = Federation(Constraint(arg1, arg2, val, is_strict))
+        with self._constraint_cache_lock:
+            self._constraint_cache_misses += 1
+            if self._constraint_cache_size:
+                self._constraint_cache[key] = federation.copy()
+                while len(self._constraint_cache) > self._constraint_cache_size:
+                    self._constraint_cache.popitem(last=False)
+        return federation
+
+    def set_constraint_cache_size(self, size: int) -> None:
+        """
+        Resize the atomic constraint cache.
+
+        Shrinking the cache evicts the least recently used entries; a size of
+        ``0`` disables caching and drops every entry. Hit and miss counters
+        are kept.
+
+        :param size: New maximal number of cached constraint federations.
+        :type size: int
+        :return: ``None``.
+        :rtype: None
+        :raises TypeError: If ``size`` is not an integer.
+        :raises ValueError: If ``size`` is negative.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> context.set_constraint_cache_size(128)
+            >>> context.constraint_cache_info().maxsize
+            128
+        """
+
+        if not _is_exact_int(size):
+            raise TypeError("Constraint cache size must be an integer.")
+        if size < 0:
+            raise ValueError("Constraint cache size must not be negative.")
+        with self._constraint_cache_lock:
+            self._constraint_cache_size = size
+            while len(self._constraint_cache) > size:
+                self._constraint_cache.popitem(last=False)
+
+    def constraint_cache_info(self) -> "ConstraintCacheInfo":
+        """
+        Return statistics of the atomic constraint cache.
+
+        :return: Snapshot of the cache counters.
+        :rtype: ConstraintCacheInfo
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"], constraint_cache_size=16)
+            >>> _ = context.x <= 5
+            >>> _ = context.x <= 5
+            >>> info = context.constraint_cache_info()
+            >>> info.hits, info.misses, info.currsize
+            (1, 1, 1)
+        """
+
+        with self._constraint_cache_lock:
+            return ConstraintCacheInfo(
+                self._constraint_cache_hits,
+                self._constraint_cache_misses,
+                self._constraint_cache_size,
+                len(self._constraint_cache),
+            )
+
+    def clear_constraint_cache(self) -> None:
+        """
+        Drop every cached constraint federation and reset the counters.
+
+        :return: ``None``.
+        :rtype: None
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"], constraint_cache_size=16)
+            >>> _ = context.x <= 5
+            >>> context.clear_constraint_cache()
+            >>> context.constraint_cache_info().currsize
+            0
+        """
+
+        with self._constraint_cache_lock:
+            self._constraint_cache.clear()
+            self._constraint_cache_hits = 0
+            self._constraint_cache_misses = 0
+
+    def set_auto_reduce(self, policy: Optional[Tuple[int, int]]) -> None:
+        """
+        Set or disable the automatic reduction policy.
+
+        With a ``(threshold, level)`` policy, ``|=`` and ``-=`` on any
+        federation of this context run ``mergeReduce`` with expensive-try
+        ``level`` (see :meth:`Federation.reduce`) whenever the result holds
+        more than ``threshold`` DBMs. ``None`` disables the policy. Counters
+        reported by :meth:`auto_reduce_info` are kept.
+
+        :param policy: ``(threshold, level)`` pair, or ``None``.
+        :type policy: tuple[int, int] or None
+        :return: ``None``.
+        :rtype: None
+        :raises TypeError: If ``policy`` is not ``None`` or a pair of integers.
+        :raises ValueError: If the threshold is not positive.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"])
+            >>> context.set_auto_reduce((1, 0))
+            >>> zone = context.x <= 1
+            >>> zone |= context.x >= 1
+            >>> zone.get_size()
+            1
+        """
+
+        if policy is not None:
+            if not isinstance(policy, tuple) or len(policy) != 2 or not all(_is_exact_int(item) for item in policy):
+                raise TypeError("Auto-reduce policy must be None or a (threshold, level) pair of integers.")
+            if policy[0] < 1:
+                raise ValueError("Auto-reduce threshold must be positive.")
+        self._auto_reduce = policy
+
+    def auto_reduce_info(self) -> "AutoReduceInfo":
+        """
+        Return the automatic reduction policy and its counters.
+
+        :return: Snapshot of the policy and counters.
+        :rtype: AutoReduceInfo
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> context = Context(["x"], auto_reduce=(1, 0))
+            >>> zone = context.x <= 1
+            >>> zone |= context.x >= 1
+            >>> context.auto_reduce_info()
+            AutoReduceInfo(threshold=1, level=0, runs=1, dbms_removed=1)
+        """
+
+        threshold, level = self._auto_reduce if self._auto_reduce is not None else (None, None)
+        with self._auto_reduce_lock:
+            return AutoReduceInfo(threshold, level, self._auto_reduce_runs, self._auto_reduce_removed)
+
+    def _record_auto_reduce(self, removed: int) -> None:
+        with self._auto_reduce_lock:
+            self._auto_reduce_runs += 1
+            self._auto_reduce_removed += removed
 
     def get_zero_federation(self) -> Federation:
         """
@@ -2524,3 +4166,461 @@ class Context:
         from .ucdd import CDDContext
 
         return CDDContext.from_context(self, bools=bools, name=name)
+
+
+class FederationStore:
+    """
+    Hash-consed store of federations.
+
+    A store keeps at most one federation per distinct symbolic set and
+    context. :meth:`intern` looks a federation up by context and native hash,
+    confirms candidates with exact set equality, and returns the stored
+    instance on a hit. On a miss it stores a copy and interns its DBMs in
+    UDBM's global DBM table, so equal DBMs of different stored federations
+    share one native matrix.
+
+    This is the intended building block for passed and waiting lists that
+    see the same zones over and over again: keep the federation returned by
+    :meth:`intern` and drop the original.
+
+    Matching goes through the native hash, which depends on how a set is
+    split into DBMs. The same set in two different DBM decompositions may
+    therefore be stored twice; calling :meth:`Federation.reduce` before
+    interning makes hits more likely.
+
+    Federations returned by :meth:`intern` are shared by every caller that
+    interned an equal set. Use them read-only: operators such as ``&``
+    return new federations, while in-place operators such as ``&=`` would
+    change the stored entry for everybody.
+
+    :ivar hits: Number of :meth:`intern` calls answered by a stored
+        federation.
+    :ivar misses: Number of :meth:`intern` calls that stored a new
+        federation.
+    :ivar memory_saved: Raw DBM matrix bytes not kept alive thanks to hits,
+        counted as ``dbm_count * dimension ** 2 * 4`` per hit.
+
+    Example::
+
+        >>> from pyudbm import Context
+        >>> from pyudbm.binding import FederationStore
+        >>> context = Context(["x", "y"], name="c")
+        >>> store = FederationStore()
+        >>> first = store.intern(context.x - context.y <= 1)
+        >>> second = store.intern(context.y - context.x >= -1)
+        >>> first is second
+        True
+        >>> len(store), store.hits, store.misses
+        (1, 1, 1)
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty store.
+
+        :return: ``None``.
+        :rtype: None
+        """
+
+        self._buckets = {}  # type: Dict[Tuple[Context, int], List[Federation]]
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.memory_saved = 0
+
+    def _find(self, federation: Federation) -> Tuple[Tuple["Context", int], Optional[Federation]]:
+        if not isinstance(federation, Federation):
+            raise TypeError("FederationStore only stores Federation objects.")
+        key = (federation.context, hash(federation))
+        for candidate in self._buckets.get(key, ()):
+            if candidate == federation:
+                return key, candidate
+        return key, None
+
+    def intern(self, federation: Federation) -> Federation:
+        """
+        Return the stored federation equal to ``federation``.
+
+        When no equal federation is stored yet, an interned copy of
+        ``federation`` is stored and returned. The argument itself is never
+        stored, so later in-place changes to it do not affect the store.
+
+        :param federation: Federation to look up.
+        :type federation: Federation
+        :return: Canonical stored federation.
+        :rtype: Federation
+        :raises TypeError: If ``federation`` is not a :class:`Federation`.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> from pyudbm.binding import FederationStore
+            >>> context = Context(["x"])
+            >>> store = FederationStore()
+            >>> zone = context.x < 3
+            >>> stored = store.intern(zone)
+            >>> stored is zone, stored == zone
+            (False, True)
+        """
+
+        key, stored = self._find(federation)
+        if stored is not None:
+            self.hits += 1
+            self.memory_saved += federation.get_size() * federation._fed.get_dimension() ** 2 * 4
+            return stored
+
+        stored = federation.copy()
+        stored.intern()
+        self._buckets.setdefault(key, []).append(stored)
+        self._size += 1
+        self.misses += 1
+        return stored
+
+    def get(self, federation: Federation) -> Optional[Federation]:
+        """
+        Return the stored federation equal to ``federation`` without inserting.
+
+        Lookups through :meth:`get` do not change the hit and miss counters.
+
+        :param federation: Federation to look up.
+        :type federation: Federation
+        :return: Stored federation, or ``None`` if no equal one is stored.
+        :rtype: Federation or None
+        :raises TypeError: If ``federation`` is not a :class:`Federation`.
+        """
+
+        return self._find(federation)[1]
+
+    def __contains__(self, federation: Any) -> bool:
+        """
+        Return whether an equal federation is stored.
+
+        :param federation: Object to look up.
+        :type federation: Any
+        :return: ``True`` if an equal federation is stored.
+        :rtype: bool
+        """
+
+        return isinstance(federation, Federation) and self._find(federation)[1] is not None
+
+    def __len__(self) -> int:
+        """
+        Return the number of distinct stored federations.
+
+        :return: Store size.
+        :rtype: int
+        """
+
+        return self._size
+
+    def __iter__(self) -> Iterator[Federation]:
+        """
+        Iterate over the stored federations.
+
+        :return: Iterator over stored federations.
+        :rtype: Iterator[Federation]
+        """
+
+        for bucket in self._buckets.values():
+            yield from bucket
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the fraction of :meth:`intern` calls answered from the store.
+
+        :return: Hit rate in ``[0, 1]``, or ``0.0`` before the first call.
+        :rtype: float
+        """
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """
+        Remove every stored federation and reset the counters.
+
+        :return: ``None``.
+        :rtype: None
+        """
+
+        self._buckets.clear()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.memory_saved = 0
+
+
+class SubsumptionIndex:
+    """
+    Passed-list index answering zone subsumption queries natively.
+
+    The index stores DBMs of one :class:`Context`, grouped into buckets by an
+    optional hashable discrete key such as a location vector. It implements
+    the inclusion check used by zone-graph exploration: a federation is
+    covered when every one of its DBMs is included in some stored DBM of the
+    same bucket. This is a sufficient condition for ``federation <= stored``
+    and avoids the federation subtraction that the exact check needs.
+
+    All queries run in native code over plain matrix copies. Candidates are
+    first filtered through a monotone cell-sum bound and then confirmed with
+    UDBM's DBM inclusion test, without holding the GIL.
+
+    :param context: Context of every indexed federation.
+    :type context: Context
+    :ivar context: Context of every indexed federation.
+
+    Example::
+
+        >>> from pyudbm import Context
+        >>> from pyudbm.binding import SubsumptionIndex
+        >>> context = Context(["x", "y"], name="c")
+        >>> passed = SubsumptionIndex(context)
+        >>> passed.insert(context.x <= 5, key="l0")
+        1
+        >>> passed.is_covered((context.x <= 3) & (context.y > 1), key="l0")
+        True
+        >>> passed.is_covered(context.x <= 3, key="l1")
+        False
+    """
+
+    def __init__(self, context: "Context"):
+        """
+        Initialize an empty index for ``context``.
+
+        :param context: Context of every indexed federation.
+        :type context: Context
+        :return: ``None``.
+        :rtype: None
+        :raises TypeError: If ``context`` is not a :class:`Context`.
+        """
+
+        if not isinstance(context, Context):
+            raise TypeError("SubsumptionIndex expects a Context.")
+        self.context = context
+        self._index = _NativeSubsumptionIndex(len(context.clocks) + 1)
+        self._keys = {}  # type: Dict[Any, int]
+        self._next_bucket = 0
+
+    def _bucket(self, key: Any, create: bool) -> Optional[int]:
+        bucket = self._keys.get(key)
+        if bucket is None and create:
+            bucket = self._next_bucket
+            self._next_bucket += 1
+            self._keys[key] = bucket
+        return bucket
+
+    def _evict_if_empty(self, key: Any, bucket: int) -> None:
+        # Buckets emptied by removals are dropped natively; drop their keys
+        # too so long-running indexes do not accumulate stale entries.
+        if not self._index.bucket_size(bucket):
+            del self._keys[key]
+
+    def _require_federation(self, federation: Federation) -> None:
+        if not isinstance(federation, Federation):
+            raise TypeError("SubsumptionIndex operations require a Federation.")
+        if federation.context is not self.context:
+            raise ValueError("SubsumptionIndex operations require the index context.")
+
+    def insert(self, federation: Federation, key: Any = None) -> int:
+        """
+        Store the DBMs of ``federation`` that are not covered yet.
+
+        DBMs already included in a stored DBM of the bucket are skipped.
+        Stored DBMs covered by the new ones are kept; call
+        :meth:`remove_covered_by` first to drop them.
+
+        :param federation: Federation to store.
+        :type federation: Federation
+        :param key: Hashable discrete key selecting the bucket.
+        :type key: Any
+        :return: Number of DBMs actually added.
+        :rtype: int
+        :raises TypeError: If ``federation`` is not a :class:`Federation`.
+        :raises ValueError: If ``federation`` uses another context.
+        """
+
+        self._require_federation(federation)
+        bucket = self._bucket(key, True)
+        added = self._index.insert(bucket, federation._fed)
+        self._evict_if_empty(key, bucket)
+        return added
+
+    def is_covered(self, federation: Federation, key: Any = None) -> bool:
+        """
+        Return whether every DBM of ``federation`` is included in a stored DBM.
+
+        An empty federation is always covered.
+
+        :param federation: Federation to check.
+        :type federation: Federation
+        :param key: Hashable discrete key selecting the bucket.
+        :type key: Any
+        :return: ``True`` if the federation is subsumed by the bucket.
+        :rtype: bool
+        :raises TypeError: If ``federation`` is not a :class:`Federation`.
+        :raises ValueError: If ``federation`` uses another context.
+        """
+
+        self._require_federation(federation)
+        bucket = self._bucket(key, False)
+        if bucket is None:
+            return federation.is_empty()
+        return self._index.is_covered(bucket, federation._fed)
+
+    def remove_covered_by(self, federation: Federation, key: Any = None) -> int:
+        """
+        Remove stored DBMs included in some DBM of ``federation``.
+
+        :param federation: Federation whose DBMs may subsume stored ones.
+        :type federation: Federation
+        :param key: Hashable discrete key selecting the bucket.
+        :type key: Any
+        :return: Number of DBMs removed.
+        :rtype: int
+        :raises TypeError: If ``federation`` is not a :class:`Federation`.
+        :raises ValueError: If ``federation`` uses another context.
+
+        Example::
+
+            >>> from pyudbm import Context
+            >>> from pyudbm.binding import SubsumptionIndex
+            >>> context = Context(["x"])
+            >>> passed = SubsumptionIndex(context)
+            >>> passed.insert((context.x <= 1) | (context.x >= 5))
+            2
+            >>> passed.remove_covered_by(context.x <= 3)
+            1
+            >>> len(passed)
+            1
+        """
+
+        self._require_federation(federation)
+        bucket = self._bucket(key, False)
+        if bucket is None:
+            return 0
+        removed = self._index.remove_covered_by(bucket, federation._fed)
+        self._evict_if_empty(key, bucket)
+        return removed
+
+    def get(self, key: Any = None) -> Federation:
+        """
+        Return the union of the DBMs stored under ``key``.
+
+        :param key: Hashable discrete key selecting the bucket.
+        :type key: Any
+        :return: Federation of the stored DBMs, empty for unknown keys.
+        :rtype: Federation
+        """
+
+        dimension = len(self.context.clocks) + 1
+        bucket = self._bucket(key, False)
+        if bucket is None:
+            return Federation._from_native(self.context, _NativeFederation(dimension))
+        native = _NativeFederation.from_raw_buffer(self._index.bucket_cells(bucket), dimension, False)
+        return Federation._from_native(self.context, native)
+
+    def keys(self) -> List[Any]:
+        """
+        Return the discrete keys that currently hold stored DBMs.
+
+        :return: Keys in insertion order. A key whose bucket became empty is
+            forgotten and placed last when it is used again.
+        :rtype: List[Any]
+        """
+
+        return list(self._keys)
+
+    def __len__(self) -> int:
+        """
+        Return the total number of stored DBMs over all buckets.
+
+        :return: Stored DBM count.
+        :rtype: int
+        """
+
+        return self._index.size()
+
+    def clear(self) -> None:
+        """
+        Remove every stored DBM.
+
+        :return: ``None``.
+        :rtype: None
+        """
+
+        self._index.clear()
+        self._keys.clear()
+        self._next_bucket = 0
+
+
+def relation_matrix(federations: Iterable[Federation], exact: bool = True, threads: int = 0) -> Any:
+    """
+    Return the pairwise relation codes of many federations in one native call.
+
+    Entry ``[i, j]`` relates ``federations[i]`` to ``federations[j]``:
+    :data:`RELATION_SUBSET` when the former is included in the latter,
+    :data:`RELATION_SUPERSET` for the converse, :data:`RELATION_EQUAL` when
+    both hold and :data:`RELATION_DIFFERENT` otherwise. The matrices are copied
+    once, then a hash check, a convex-hull bound pre-filter and DBM-wise
+    inclusion tests run on ``threads`` native worker threads without the GIL.
+
+    A federation can be included in a union although none of its DBMs fits a
+    single DBM of the union. With ``exact=True`` such pairs are decided by the
+    same exact test as :meth:`Federation.__le__`, which runs serially behind
+    the kernel lock. ``exact=False`` skips that pass and reports them as not
+    included, like UDBM's approximate ``relation``.
+
+    :param federations: Federations of one context.
+    :type federations: Iterable[Federation]
+    :param exact: Whether undecided pairs get the exact inclusion test,
+        defaults to ``True``.
+    :type exact: bool, optional
+    :param threads: Worker thread count, ``0`` for the hardware concurrency,
+        defaults to ``0``.
+    :type threads: int, optional
+    :return: ``int32`` array of shape ``(n, n)``.
+    :rtype: numpy.ndarray
+    :raises ImportError: If numpy is not installed.
+    :raises TypeError: If an item is not a federation or ``threads`` is not an
+        integer.
+    :raises ValueError: If the federations use different contexts or
+        ``threads`` is negative.
+
+    Example::
+
+        >>> from pyudbm import Context, relation_matrix
+        >>> context = Context(["x", "y"])
+        >>> split = (context.x <= 2) | ((context.x >= 2) & (context.x <= 5))
+        >>> zones = [context.x <= 1, context.x <= 5, split]
+        >>> relation_matrix(zones).tolist()
+        [[3, 2, 2], [1, 3, 3], [1, 3, 3]]
+        >>> relation_matrix(zones, exact=False).tolist()
+        [[3, 2, 2], [1, 3, 1], [1, 2, 3]]
+    """
+
+    numpy = _require_numpy()
+    federations = list(federations)
+    for federation in federations:
+        if not isinstance(federation, Federation):
+            raise TypeError("relation_matrix() requires Federation items.")
+        if federation.context is not federations[0].context:
+            raise ValueError("relation_matrix() requires federations of the same context.")
+    if not _is_exact_int(threads):
+        raise TypeError("Thread count must be an integer.")
+    if threads < 0:
+        raise ValueError("Thread count must not be negative.")
+    codes = _NativeFederation.relation_matrix([federation._fed for federation in federations], bool(exact), threads)
+    return numpy.asarray(codes)
+
+
+def _restore_clock(context: Context, index: int) -> Clock:
+    return context.clocks[index]
+
+
+def _restore_dbm(context: Context, graph: Iterable[int]) -> DBM:
+    return DBM(context, _NativeDBM.from_min_dbm(list(graph), len(context.clocks) + 1))
+
+
+def _restore_federation(context: Context, data: bytes) -> Federation:
+    return Federation.from_bytes(context, data)
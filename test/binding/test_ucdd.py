@@ -1,12 +1,28 @@
 import gc
 import importlib
+import importlib.util
 
 import pytest
 
 import pyudbm.binding
 import pyudbm.binding.ucdd as ucdd_module
 from pyudbm import Context
-from pyudbm.binding import BDDTraceSet, CDD, CDDContext, CDDExtraction, CDDBool, CDDClock, DBM
+from pyudbm.binding import (
+    BDDTraceSet,
+    CDD,
+    CDDContext,
+    CDDExtraction,
+    CDDBool,
+    CDDClock,
+    CDDRuntimeStats,
+    DBM,
+    configure_runtime,
+    runtime_stats,
+)
+
+
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+numpy = importlib.import_module("numpy") if _HAS_NUMPY else None
 
 
 def _raw_matrix_signature(dbm):
@@ -66,13 +82,11 @@ class TestUcddApi:
 
         ctx_xy = Context(["x", "y"]).to_cdd_context(bools=["flag"])
         hold_xy = ctx_xy.true()
-        with pytest.raises(RuntimeError, match="already uses 3 clocks"):
-            Context(["x"]).to_cdd_context()
-        del hold_xy
-        gc.collect()
-
         ctx_x = Context(["x"]).to_cdd_context()
         assert ctx_x.dimension == 2
+        assert hold_xy.is_true()
+        del hold_xy
+        gc.collect()
 
         base = Context(["x"])
         prefix = base.to_cdd_context(bools=["a"])
@@ -82,15 +96,16 @@ class TestUcddApi:
         assert expanded.bool_names == ("a", "b")
         assert reused_prefix.bool_names == ("a",)
 
+        assert expanded.a.level == prefix.a.level
+        assert expanded.b.level != expanded.a.level
+
         conflicting = base.to_cdd_context(bools=["a"])
         hold_bool = conflicting.true()
-        with pytest.raises(RuntimeError, match="already uses boolean names"):
-            base.to_cdd_context(bools=["b"])
-        del hold_bool
-        gc.collect()
-
         restarted = base.to_cdd_context(bools=["b"])
         assert restarted.bool_names == ("b",)
+        assert restarted.b.level == expanded.b.level
+        del hold_bool
+        gc.collect()
         with pytest.raises(KeyError):
             _ = restarted["missing"]
         with pytest.raises(KeyError):
@@ -98,6 +113,41 @@ class TestUcddApi:
         with pytest.raises(KeyError):
             restarted.bool("missing")
 
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_bdd_trace_arrays_and_lazy_rows(self):
+        ctx = Context(["x"]).to_cdd_context(bools=["door_open", "alarm", "light"])
+        traces = (ctx.door_open | ~ctx.alarm).bdd_traces()
+
+        levels, values = traces.to_arrays()
+        assert levels.dtype == numpy.int32
+        assert values.dtype == numpy.int8
+        assert levels.shape == values.shape
+        assert levels.shape[0] == len(traces) == 2
+        assert traces.level_names == {var.level: var.name for var in ctx.bools}
+        decoded = [
+            {traces.level_names[level]: bool(value) for level, value in zip(row_levels, row_values) if value >= 0}
+            for row_levels, row_values in zip(levels.tolist(), values.tolist())
+        ]
+        assert decoded == traces.to_dicts()
+
+        # Every export views the same native tensors, which stay alive with
+        # the arrays even after the trace set is gone.
+        again_levels, again_values = traces.to_arrays()
+        assert numpy.shares_memory(levels, again_levels)
+        assert numpy.shares_memory(values, again_values)
+        assert not levels.flags.writeable and not values.flags.writeable
+        expected_levels = levels.tolist()
+        del traces, again_levels, again_values
+        gc.collect()
+        assert levels.tolist() == expected_levels
+        traces = (ctx.door_open | ~ctx.alarm).bdd_traces()
+
+        rows = traces.iter_dicts(sparse=False)
+        assert next(rows).keys() == {"door_open", "alarm", "light"}
+        assert list(traces.iter_dicts()) == list(traces) == traces.to_dicts()
+        assert ctx.false().bdd_traces().to_dicts() == []
+        assert ctx.false().bdd_traces().to_arrays()[0].shape[0] == 0
+
     def test_pure_clock_roundtrip_and_extraction(self):
         base = Context(["x", "y"], name="c")
         zone = ((base.x >= 1) & (base.x <= 2)) | (base.y == 0)
@@ -121,6 +171,86 @@ class TestUcddApi:
         assert isinstance(cdd.copy().nodecount(), int)
         assert isinstance(repr(cdd.copy()), str)
 
+    def test_layouts_with_different_clocks_and_bools_coexist(self):
+        base_x = Context(["x"], name="a")
+        base_xyz = Context(["x", "y", "z"], name="b")
+        narrow = base_x.to_cdd_context(bools=["door_open"])
+        wide = base_xyz.to_cdd_context(bools=["alarm", "door_open"])
+
+        narrow_state = (narrow.door_open & (narrow.x <= 2)) | (~narrow.door_open & (narrow.x >= 4))
+        wide_zone = (base_xyz.x - base_xyz.z <= 1) & (base_xyz.y == 3)
+        wide_state = wide.alarm & wide_zone.to_cdd(cdd_context=wide)
+        later = Context(["u", "v"]).to_cdd_context(bools=["mode"])
+        later_state = later.mode & (later.u <= 5)
+
+        assert narrow_state.to_federation(require_pure=False) == ((base_x.x <= 2) | (base_x.x >= 4))
+        assert narrow_state.delay().to_federation(require_pure=False) == (base_x.x >= 0)
+        [(guard, zone)] = wide_state.to_guarded_federations()
+        assert guard.equiv(wide.alarm.as_cdd())
+        assert zone == wide_zone
+        assert later_state.to_guarded_federations()[0][1] == (later.base_context.u <= 5)
+        assert (narrow.x <= 3).contains_dbm((base_x.x <= 2).to_dbm_list()[0])
+        assert not (narrow.x <= 3).contains_dbm((base_x.x >= 2).to_dbm_list()[0])
+        remainder, dbm = (narrow.x <= 3).extract_dbm()
+        assert remainder.is_false()
+        assert dbm.dimension == 2
+        assert narrow.bool_name_for_level(narrow.door_open.level) == "door_open"
+        assert wide.door_open.level == narrow.door_open.level
+        with pytest.raises(ValueError, match="same CDDContext"):
+            narrow_state & wide_state
+
+    def test_cdds_do_not_depend_on_runtime_width(self):
+        base = Context(["x", "y"], name="c")
+        ctx = base.to_cdd_context(bools=["door_open"])
+        zone = (base.x <= 3) & (base.y - base.x < 2)
+        before = CDD.from_federation(zone, cdd_context=ctx)
+
+        width = runtime_stats().clock_count
+        wider = Context(["w{0}".format(index) for index in range(width)], name="wide").to_cdd_context()
+        assert runtime_stats().clock_count > width
+        after = CDD.from_federation(zone, cdd_context=ctx)
+
+        assert before.equiv(after)
+        assert before == after
+        assert (before - after).is_false()
+        assert (after - before).to_federation().is_empty()
+        assert (ctx.door_open & before).to_guarded_federations()[0][1] == zone
+        assert wider.clock_names[0] == "w0"
+
+        # Clock operations run over every runtime clock, but must not leave
+        # constraints on the clocks only the wider context declares.
+        assert before.remove_negative() == before
+        assert (before - before.remove_negative()).is_false()
+        assert before.delay() == CDD.from_federation(zone.up(), cdd_context=ctx)
+        assert before.past() == CDD.from_federation(zone.down(), cdd_context=ctx)
+        assert (ctx.door_open & before).delay() == ctx.door_open & CDD.from_federation(zone.up(), cdd_context=ctx)
+        assert before.delay().equiv(after.delay())
+        assert (before.delay() - after.delay()).to_federation(require_pure=False).is_empty()
+
+        guard = ctx.x >= 1
+        expected = CDD.from_federation((zone & (base.x >= 1)).reset_value(base.x), cdd_context=ctx)
+        assert before.transition(guard=guard, clock_resets={ctx.x: 0}) == expected
+        target = CDD.from_federation(base.x == 0, cdd_context=ctx)
+        previous = target.transition_back(guard=ctx.x <= 2, update=ctx.x == 0, clock_resets=[ctx.x])
+        assert previous == CDD.from_federation(base.x <= 2, cdd_context=ctx)
+
+    def test_federation_conversion_uses_one_balanced_union(self):
+        base = Context(["x", "y"], name="c")
+        zone = base.x < 0
+        for value in range(0, 40, 3):
+            zone |= (base.x >= value) & (base.x <= value + 1) & (base.y - base.x <= value % 5)
+
+        cdd = CDD.from_federation(zone)
+        assert zone.get_size() > 1
+        assert cdd.to_federation() == zone
+        assert all(cdd.contains_dbm(dbm) for dbm in zone.to_dbm_list())
+        assert CDD.from_federation(base.x < 0).is_false()
+        first = zone.to_dbm_list()[0]
+        single = CDD.from_dbm(first)
+        assert single.contains_dbm(first)
+        assert single.to_federation().get_size() == 1
+        assert single.to_federation() <= zone
+
     def test_bool_dsl_and_bdd_trace_rendering(self):
         base = Context(["x", "y"], name="c")
         ctx = base.to_cdd_context(bools=["door_open", "alarm"])
@@ -304,10 +434,9 @@ class TestUcddApi:
         with pytest.raises(TypeError, match="Boolean reset lists must contain names or CDDBool objects"):
             ctx.true().transition_back(guard=ctx.true(), update=ctx.true(), bool_resets=[object()])
         assert ctx.true().transition_back(guard=ctx.true(), update=ctx.true(), bool_resets=["flag"]).equiv(ctx.true())
-        with pytest.raises(NotImplementedError, match="guarded federations"):
-            (ctx.flag & (ctx.x <= 2)).extract_bdd_and_dbm().to_federation(require_pure=False)
-        with pytest.raises(NotImplementedError, match="guarded federations"):
-            (ctx.flag & (ctx.x <= 2)).to_federation(require_pure=False)
+        guarded_zone = ctx.base_context.x <= 2
+        assert (ctx.flag & (ctx.x <= 2)).extract_bdd_and_dbm().to_federation(require_pure=False) == guarded_zone
+        assert (ctx.flag & (ctx.x <= 2)).to_federation(require_pure=False) == guarded_zone
         with pytest.raises(ValueError, match="mixed bool/clock CDD"):
             (ctx.flag & (ctx.x <= 2)).to_federation()
         with pytest.raises(ValueError, match="non-trivial boolean guard"):
@@ -323,17 +452,14 @@ class TestUcddApi:
         base_x = Context(["x"])
         ctx_x = base_x.to_cdd_context(bools=["flag"])
         hold_flag = ctx_x.true()
-        with pytest.raises(RuntimeError, match="already uses 2 clocks"):
-            Context(["x", "y"]).to_cdd_context(bools=["flag"])
+        ctx_xy = Context(["x", "y"]).to_cdd_context(bools=["flag"])
+        assert ctx_xy.flag.level == ctx_x.flag.level
         del hold_flag
         gc.collect()
 
-        base_xy = Context(["x", "y"])
-        ctx_xy = base_xy.to_cdd_context(bools=["flag"])
         hold_xy = ctx_xy.true()
         reloaded = importlib.reload(ucdd_module)
-        with pytest.raises(RuntimeError, match="boolean levels"):
-            reloaded.CDDContext(["x", "y"], bools=())
+        assert reloaded.CDDContext(["x", "y"], bools=()).dimension == 3
         del hold_xy
         gc.collect()
 
@@ -342,6 +468,50 @@ class TestUcddApi:
         restarted_x = Context(["x"]).to_cdd_context()
         assert restarted_x.dimension == 2
 
+    def test_runtime_configuration_and_stats(self):
+        with pytest.raises(TypeError):
+            configure_runtime(1.5, 10000, 10000)
+        with pytest.raises(TypeError):
+            configure_runtime(200000)
+        with pytest.raises(ValueError):
+            configure_runtime(0, 10000, 10000)
+
+        # Start from a fresh runtime with the built-in defaults, whatever the
+        # earlier tests left behind.
+        configure_runtime(None)
+        state = None
+        try:
+            ctx = Context(["x"]).to_cdd_context(bools=["flag"])
+            state = ctx.flag & (ctx.x <= 1)
+            stats = runtime_stats()
+            assert isinstance(stats, CDDRuntimeStats)
+            assert stats.running
+            assert (stats.maxsize, stats.cache_size, stats.stack_size) == (None, None, None)
+            assert (stats.clock_count, stats.bool_count) == (2, 1)
+            assert stats.level_count >= stats.bool_count
+            assert 1 <= stats.live_cdds <= stats.peak_live_cdds
+            with pytest.raises(RuntimeError, match="still alive"):
+                configure_runtime(200000, 50000, 10000)
+            del state
+            gc.collect()
+
+            configure_runtime(200000, 50000, 10000)
+            assert not runtime_stats().running
+            ctx = Context(["x"]).to_cdd_context(bools=["flag"])
+            state = ctx.flag & (ctx.x <= 1)
+            assert not state.is_false()
+            restarted = runtime_stats()
+            assert restarted.running
+            assert (restarted.maxsize, restarted.cache_size, restarted.stack_size) == (200000, 50000, 10000)
+            assert restarted.starts == stats.starts + 1
+        finally:
+            state = None
+            gc.collect()
+            configure_runtime(None)
+
+        assert runtime_stats().maxsize is None
+        assert not runtime_stats().running
+
     def test_pure_clock_transition_flows(self):
         base = Context(["x"], name="c")
         ctx = base.to_cdd_context()
@@ -388,6 +558,24 @@ class TestUcddApi:
         with pytest.raises(ValueError, match="mixed bool/clock CDD"):
             next_state.to_federation()
 
+        [(only_guard, only_zone)] = next_state.to_guarded_federations()
+        assert only_guard.equiv((~ctx.door_open) & ctx.alarm)
+        assert only_zone == (base.x == 0)
+
+        mixed = (ctx.door_open & (ctx.x <= 2)) | (~ctx.door_open & ((ctx.x >= 5) | (ctx.x == 3)))
+        guarded = mixed.to_guarded_federations()
+        assert len(guarded) == 2
+        zones = {guard.equiv(ctx.door_open.as_cdd()): federation for guard, federation in guarded}
+        assert zones[True] == (base.x <= 2)
+        assert zones[False] == ((base.x >= 5) | (base.x == 3))
+        rebuilt = ctx.false()
+        for guard, federation in guarded:
+            rebuilt |= guard & federation.to_cdd(cdd_context=ctx)
+        assert rebuilt.equiv(mixed)
+        assert mixed.to_federation(require_pure=False) == ((base.x <= 2) | (base.x == 3) | (base.x >= 5))
+        assert ctx.false().to_guarded_federations() == []
+        assert ctx.false().to_federation() == (base.x < 0)
+
     def test_extract_bdd_and_dbm_iteration_is_stable(self):
         base = Context(["x"], name="c")
         ctx = base.to_cdd_context(bools=["door_open"])
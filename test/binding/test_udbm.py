@@ -1,8 +1,36 @@
+import copy
+import importlib
+import importlib.util
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import pyudbm
 import pyudbm.binding
-from pyudbm.binding import DBM, Constraint, Context, Federation, FloatValuation, IntValuation, Valuation, VariableDifference
+from pyudbm.binding import (
+    AutoReduceInfo,
+    DBM,
+    Constraint,
+    ConstraintCacheInfo,
+    Context,
+    Federation,
+    FederationStats,
+    FederationStore,
+    FloatValuation,
+    IntValuation,
+    RELATION_DIFFERENT,
+    RELATION_EQUAL,
+    RELATION_SUBSET,
+    RELATION_SUPERSET,
+    SubsumptionIndex,
+    Valuation,
+    VariableDifference,
+    relation_matrix,
+)
+
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+numpy = importlib.import_module("numpy") if _HAS_NUMPY else None
 
 
 @pytest.mark.unittest
@@ -107,6 +135,31 @@ class TestBindingApi:
         assert original != intersected
         assert unioned != intersected
 
+    def test_copy_on_write(self):
+        c = self.c
+        original = (c.x - c.y) == 1
+        shared = original.copy()
+        derived = original.up()
+
+        assert shared.shares_storage_with(original)
+        assert copy.copy(original).shares_storage_with(original)
+        assert not derived.shares_storage_with(original)
+
+        shared &= c.z == 1
+        assert not shared.shares_storage_with(original)
+        assert original == ((c.x - c.y) == 1)
+
+        deep = copy.deepcopy(original)
+        assert deep == original
+        assert deep.context is original.context
+        assert not deep.shares_storage_with(original)
+
+        deep |= c.z == 1
+        assert original == ((c.x - c.y) == 1)
+
+        with pytest.raises(ValueError):
+            original.shares_storage_with(Context(["x", "y", "z"]).x <= 1)
+
     def test_reduce(self):
         c = self.c
         federation = (c.x >= 1) | (c.x <= 1)
@@ -415,6 +468,43 @@ class TestBindingApi:
         with pytest.raises(ValueError):
             federation.extrapolate_max_bounds({other.x: 100, context.y: 200, context.z: 300})
 
+    def test_extrapolate_lu_bounds(self):
+        context = Context(["x", "y", "z"])
+        federation = (context.x - context.y <= 1) & (context.x < 150) & (context.z < 150) & (context.x - context.z <= 1000)
+        bounds = {"x": 100, "y": 300, "z": 400}
+
+        assert federation.extrapolate_lu_bounds(bounds, bounds) == federation.extrapolate_max_bounds(bounds)
+
+        zone = (context.x >= 5) & (context.x <= 7) & (context.y <= 2) & (context.z <= 2)
+        result = zone.extrapolate_lu_bounds({"x": 3, "y": 10, "z": 10}, {"x": 10, "y": 10, "z": 10})
+        assert result == (context.x >= 5) & (context.y <= 2) & (context.z <= 2)
+        assert zone.extrapolate_max_bounds({"x": 10, "y": 10, "z": 10}) == zone
+
+        free = zone.extrapolate_max_bounds({"x": None, "y": 10, "z": 10})
+        assert free == zone.free_clock(context.x)
+
+        with pytest.raises(ValueError, match="extrapolate_lu_bounds requires bounds for every clock"):
+            zone.extrapolate_lu_bounds({"x": 3}, bounds)
+
+    def test_diagonal_extrapolation(self):
+        context = Context(["x", "y", "z"])
+        federation = (context.x - context.y <= 1) & (context.x < 150) & (context.z < 150) & (context.x - context.z <= 1000)
+        bounds = {"x": 100, "y": 300, "z": 400}
+
+        plain = federation.extrapolate_max_bounds(bounds)
+        diagonal = federation.extrapolate_max_bounds(bounds, diagonal=True)
+        assert federation <= plain
+        assert plain <= diagonal
+
+        lu_plain = federation.extrapolate_lu_bounds(bounds, bounds)
+        lu_diagonal = federation.extrapolate_lu_bounds(bounds, bounds, diagonal=True)
+        assert federation <= lu_plain
+        assert lu_plain <= lu_diagonal
+
+        target = federation.copy()
+        assert target.extrapolate_lu_bounds(bounds, bounds, inplace=True, diagonal=True) is target
+        assert target == lu_diagonal
+
     def test_context_public_edge_cases(self, caplog):
         with caplog.at_level("WARNING", logger="pyudbm"):
             warned = Context(["clocks", "x"])
@@ -434,6 +524,75 @@ class TestBindingApi:
         with pytest.raises(KeyError, match="Ambiguous clock name: x"):
             _ = ambiguous["x"]
 
+    def test_context_constraint_cache(self):
+        context = Context(["x", "y"], constraint_cache_size=2)
+
+        first = context.x <= 5
+        second = context.x <= 5
+        assert first == second
+        assert first is not second
+        assert context.constraint_cache_info() == ConstraintCacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+        second &= context.y <= 1
+        assert (context.x <= 5) == first
+        assert (context.x - context.y == 2) == ((context.x - context.y <= 2) & (context.y - context.x <= -2))
+        assert context.constraint_cache_info().currsize == 2
+
+        context.set_constraint_cache_size(1)
+        assert context.constraint_cache_info().currsize == 1
+        context.clear_constraint_cache()
+        assert context.constraint_cache_info() == ConstraintCacheInfo(hits=0, misses=0, maxsize=1, currsize=0)
+
+        context.set_constraint_cache_size(0)
+        _ = context.x <= 5
+        assert context.constraint_cache_info().misses == 0
+
+        restored = pickle.loads(pickle.dumps(context))
+        assert restored.constraint_cache_info().maxsize == 0
+
+        with pytest.raises(TypeError):
+            Context(["x"], constraint_cache_size=1.5)
+        with pytest.raises(ValueError):
+            context.set_constraint_cache_size(-1)
+
+    def test_context_auto_reduce(self):
+        context = Context(["x", "y"], auto_reduce=(2, 0))
+        zone = context.x <= 1
+        zone |= context.x >= 1
+        assert zone.get_size() == 2
+        assert context.auto_reduce_info() == AutoReduceInfo(threshold=2, level=0, runs=0, dbms_removed=0)
+
+        zone |= context.y <= 1
+        assert zone == Federation(context).set_init()
+        assert zone.get_size() == 1
+        info = context.auto_reduce_info()
+        assert info.runs == 1
+        assert info.dbms_removed == 2
+
+        unions = (context.x <= 1) | (context.x >= 1) | (context.y <= 1)
+        assert unions.get_size() == 3
+        unions -= (context.x == 5) & (context.y == 5)
+        assert context.auto_reduce_info().runs == 2
+
+        context.set_auto_reduce(None)
+        zone = context.x <= 1
+        zone |= context.x >= 1
+        zone |= context.y <= 1
+        assert zone.get_size() == 3
+        assert context.auto_reduce_info().threshold is None
+        assert context.auto_reduce_info().runs == 2
+
+        restored = pickle.loads(pickle.dumps(Context(["x"], auto_reduce=(4, 1))))
+        assert restored.auto_reduce_info().threshold == 4
+        assert restored.auto_reduce_info().level == 1
+
+        with pytest.raises(TypeError):
+            context.set_auto_reduce(4)
+        with pytest.raises(TypeError):
+            context.set_auto_reduce((4, 1.5))
+        with pytest.raises(ValueError):
+            Context(["x"], auto_reduce=(0, 0))
+
     def test_camel_case_binding_methods_are_gone(self):
         context = Context(["x", "y"])
         federation = context.x <= 1
@@ -613,3 +772,610 @@ class TestBindingApi:
         assert len(dbms) == 2
         assert all(isinstance(dbm, DBM) for dbm in dbms)
         assert sorted(str(dbm) for dbm in dbms) == ["(x==0)", "(x==1)"]
+
+    def test_thread_pool_shares_read_only_federation(self):
+        c = self.c
+        base = (c.x - c.y <= 1) & (c.y - c.x <= 1) & (c.x >= 1) & (c.y <= 4)
+
+        def explore(bound):
+            zone = base.up() & (c.z <= bound)
+            zone -= c.x > bound
+            return zone.predt(c.x == bound).reduce()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(explore, range(32)))
+
+        assert results == [explore(bound) for bound in range(32)]
+        assert base == (c.x - c.y <= 1) & (c.y - c.x <= 1) & (c.x >= 1) & (c.y <= 4)
+
+    def test_dbm_raw_view_matches_cells(self):
+        context = Context(["x", "y"])
+        dbm = ((context.x <= 1) & (context.x - context.y < 3)).to_dbm_list()[0]
+
+        assert dbm._raw_matrix() == tuple(cell for row in dbm.to_matrix(mode="raw") for cell in row)
+        assert dbm.raw("x", "0") == 3
+        assert dbm.raw(2, 1) == dbm.to_matrix(mode="raw")[2][1]
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_dbm_to_array(self):
+        context = Context(["x", "y"])
+        dbm = ((context.x <= 1) & (context.x - context.y < 3)).to_dbm_list()[0]
+
+        raw = dbm.to_array()
+        assert raw.dtype == numpy.int32
+        assert raw.shape == dbm.shape
+        assert not raw.flags.writeable
+        assert raw.tolist() == dbm.to_matrix(mode="raw")
+        assert numpy.shares_memory(raw, dbm.to_array())
+        assert dbm.to_array(mode="bound").tolist() == [
+            [dbm.bound(i, j) for j in range(dbm.dimension)] for i in range(dbm.dimension)
+        ]
+        assert dbm.to_array(mode="strict").tolist() == [
+            [dbm.is_strict(i, j) for j in range(dbm.dimension)] for i in range(dbm.dimension)
+        ]
+        assert dbm.to_array(mode="infinity").tolist() == [
+            [dbm.is_infinity(i, j) for j in range(dbm.dimension)] for i in range(dbm.dimension)
+        ]
+
+        with pytest.raises(TypeError):
+            dbm.to_array(mode=1)
+        with pytest.raises(ValueError):
+            dbm.to_array(mode="tuple")
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_federation_array_round_trip(self):
+        c = self.c
+        federation = ((c.x <= 1) & (c.y - c.z < 2)) | (c.x >= 3)
+
+        array = federation.to_array()
+        assert array.dtype == numpy.int32
+        assert array.shape == (2, 4, 4)
+        assert [dbm.to_matrix(mode="raw") for dbm in federation.to_dbm_list()] == array.tolist()
+        assert Federation.from_array(c, array) == federation
+        assert Federation.from_array(c, array.astype(numpy.int64), validate=False) == federation
+        assert Federation.from_array(c, array[:0]).is_empty()
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_federation_from_array_rejects_invalid_input(self):
+        c = self.c
+        array = (c.x <= 1).to_array()
+
+        with pytest.raises(TypeError):
+            Federation.from_array(None, array)
+        with pytest.raises(TypeError):
+            Federation.from_array(c, array.astype(numpy.float64))
+        with pytest.raises(ValueError):
+            Federation.from_array(c, array[0])
+        with pytest.raises(ValueError):
+            Federation.from_array(Context(["x"]), array)
+
+        broken = array.copy()
+        broken[0, 0, 0] = -1
+        with pytest.raises(ValueError):
+            Federation.from_array(c, broken)
+
+        wide = array.astype(numpy.int64)
+        wide[0, 1, 0] += 2 ** 32
+        for validate in (True, False):
+            with pytest.raises(ValueError, match="int32"):
+                Federation.from_array(c, wide, validate=validate)
+            with pytest.raises(ValueError, match="int32"):
+                Federation.from_array(c, numpy.full((1, 4, 4), 2 ** 63, dtype=numpy.uint64), validate=validate)
+
+    def test_federation_from_constraints(self):
+        c = self.c
+        expected = (c.x <= 5) & (c.y - c.x < 2) & (c.z >= 1)
+        constraints = [(c.x, None, 5, False), ("y", "x", 2, True), Constraint(None, c.z, -1, False)]
+
+        assert Federation.from_constraints(c, constraints) == expected
+        assert Federation.from_constraints(c, iter(constraints)).get_size() == 1
+        assert Federation.from_constraints(c, []) == Federation(c).set_init()
+        assert Federation.from_constraints(c, [("x", None, 1, False), (None, "x", -2, False)]).is_empty()
+
+        with pytest.raises(TypeError):
+            Federation.from_constraints(None, [])
+        with pytest.raises(TypeError):
+            Federation.from_constraints(c, [(1, None, 5, False)])
+        with pytest.raises(TypeError):
+            Federation.from_constraints(c, [("x", None, 5.0, False)])
+        with pytest.raises(ValueError):
+            Federation.from_constraints(c, [("x", "x", 5, False)])
+        with pytest.raises(ValueError):
+            Federation.from_constraints(c, [(Context(["x"]).x, None, 5, False)])
+        with pytest.raises(ValueError):
+            Federation.from_constraints(c, [("x", None, 2 ** 40, False)])
+
+    def test_federation_stats(self):
+        c = self.c
+        federation = (c.x >= 1) | (c.x <= 1) | (c.y - c.z < 2)
+        stats = federation.stats()
+
+        assert stats == FederationStats(
+            dbm_count=federation.get_size(),
+            dimension=4,
+            allocated_bytes=federation.get_size() * 4 * 4 * 4,
+            edge_counts=tuple(len(constraints) for constraints in federation.to_constraints()),
+            reduce_gain=stats.reduce_gain,
+        )
+        assert stats.edge_count == sum(stats.edge_counts)
+        assert stats.reduce_gain == federation.get_size() - federation.copy().reduce().get_size()
+        assert federation.get_size() == stats.dbm_count
+        assert Federation(c).set_init().stats().reduce_gain == 0
+        assert (c.x < 0).stats() == FederationStats(0, 4, 0, (), 0)
+
+    def test_live_counts(self):
+        c = self.c
+        federations = Federation.live_count()
+        dbms = DBM.live_count()
+
+        zone = (c.x <= 1) | (c.y <= 1)
+        snapshots = zone.to_dbm_list()
+        assert Federation.live_count() >= federations + 1
+        assert DBM.live_count() == dbms + len(snapshots)
+
+        del snapshots
+        assert DBM.live_count() == dbms
+
+    def test_federation_to_constraints(self):
+        c = self.c
+        federation = ((c.x <= 5) & (c.y - c.x < 2) & (c.z > 1)) | ((c.x == 1) & (c.y == 1))
+        systems = federation.to_constraints()
+
+        assert len(systems) == federation.get_size()
+        for dbm, constraints in zip(federation.to_dbm_list(), systems):
+            finite = sum(
+                1 for i in range(dbm.dimension) for j in range(dbm.dimension) if i != j and not dbm.is_infinity(i, j)
+            )
+            assert len(constraints) <= finite
+            for left, right, bound, is_strict in constraints:
+                assert left is None or left.context is c
+                assert right is None or right.context is c
+                assert left is not right
+                assert type(bound) is int
+                assert type(is_strict) is bool
+            rebuilt = Federation.from_constraints(c, constraints).to_dbm_list()
+            assert [item.to_matrix(mode="raw") for item in rebuilt] == [dbm.to_matrix(mode="raw")]
+
+        assert (c.x == 1).to_constraints() == [
+            [(None, c.x, -1, False), (None, c.y, 0, False), (None, c.z, 0, False), (c.x, None, 1, False)]
+        ]
+        assert (c.x < 0).to_constraints() == []
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_federation_from_constraint_array(self):
+        c = self.c
+        table = numpy.array([[1, 0, 5, 0], [2, 1, 2, 1], [0, 3, -1, 0]], dtype=numpy.int64)
+
+        assert Federation.from_constraints(c, table) == (c.x <= 5) & (c.y - c.x < 2) & (c.z >= 1)
+
+        with pytest.raises(TypeError):
+            Federation.from_constraints(c, table.astype(numpy.float64))
+        with pytest.raises(ValueError):
+            Federation.from_constraints(c, table[:, :3])
+        with pytest.raises(ValueError):
+            Federation.from_constraints(c, numpy.array([[4, 0, 5, 0]]))
+        with pytest.raises(ValueError, match="indices"):
+            Federation.from_constraints(c, numpy.array([[2 ** 32 + 1, 0, 5, 0]], dtype=numpy.int64))
+        with pytest.raises(ValueError, match="indices"):
+            Federation.from_constraints(c, numpy.array([[1, -1, 5, 0]]))
+
+        strict = numpy.array([[1, 0, 5, 2 ** 32]], dtype=numpy.int64)
+        assert Federation.from_constraints(c, strict) == (c.x < 5)
+
+        for bound in (2 ** 40, -(2 ** 40), 2 ** 32 + 5):
+            with pytest.raises(ValueError, match="out of range"):
+                Federation.from_constraints(c, [("x", None, bound, False)])
+            with pytest.raises(ValueError, match="out of range"):
+                Federation.from_constraints(c, numpy.array([[1, 0, bound, 0]], dtype=numpy.int64))
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_sample(self):
+        c = self.c
+        federation = ((c.x <= 2) & (c.y - c.x < 1)) | ((c.x >= 1) & (c.x <= 3) & (c.y <= 1))
+        bounds = {"z": 4}
+
+        points = federation.sample(500, seed=3, bounds=bounds)
+        assert points.dtype == numpy.float64
+        assert points.shape == (500, 3)
+        assert federation.contains_many(points).all()
+        assert (points[:, 2] <= 4).all()
+        assert numpy.array_equal(points, federation.sample(500, seed=3, bounds=bounds))
+        assert federation.sample(0, bounds=bounds).shape == (0, 3)
+
+        # The overlap x in [1, 2], y <= 1 covers 1/5 of the union; counting it
+        # once per DBM would raise that share to 1/3.
+        overlap = ((points[:, 0] >= 1) & (points[:, 0] <= 2) & (points[:, 1] <= 1)).mean()
+        assert 0.13 < overlap < 0.27
+
+        integers = federation.sample(300, seed=5, bounds=bounds, integer=True)
+        assert integers.dtype == numpy.int32
+        assert federation.contains_many(integers).all()
+
+        assert (c.x == 1).sample(4, bounds={"y": 1, "z": 1}, integer=True)[:, 0].tolist() == [1, 1, 1, 1]
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_sample_rejects_invalid_input(self):
+        c = self.c
+        zone = (c.x <= 2) & (c.y <= 2)
+
+        with pytest.raises(ValueError, match="unbounded"):
+            zone.sample(1)
+        with pytest.raises(ValueError, match="empty"):
+            (c.x < 0).sample(1, bounds={"z": 1})
+        with pytest.raises(ValueError):
+            (c.x == 1).sample(1, bounds={"y": 1, "z": 1})
+        with pytest.raises(ValueError):
+            zone.sample(-1, bounds={"z": 1})
+        with pytest.raises(ValueError):
+            zone.sample(1, bounds={"z": -1})
+        with pytest.raises(TypeError):
+            zone.sample(1.0, bounds={"z": 1})
+        with pytest.raises(TypeError):
+            zone.sample(1, seed="seed", bounds={"z": 1})
+        with pytest.raises(TypeError):
+            zone.sample(1, bounds={"z": 1.5})
+
+    def test_remap_and_project(self):
+        c = self.c
+        zone = ((c.x - c.y <= 1) & (c.y <= 3) & (c.z == 2)) | (c.x > 10)
+        reordered = Context(["z", "y", "x"])
+
+        moved = zone.remap(reordered)
+        assert moved.context is reordered
+        assert moved == ((reordered.x - reordered.y <= 1) & (reordered.y <= 3) & (reordered.z == 2)) | (
+            reordered.x > 10
+        )
+        assert moved.remap(c) == zone
+
+        wider = Context(["x", "y", "z", "w"])
+        assert zone.remap(wider) == ((wider.x - wider.y <= 1) & (wider.y <= 3) & (wider.z == 2)) | (wider.x > 10)
+        assert zone.remap(wider, {c.x: wider.w}) == (wider.w <= 4) | (wider.w > 10)
+
+        projected = zone.project(["x", c.z])
+        assert [clock.name for clock in projected.context.clocks] == ["x", "z"]
+        assert projected.context.name == "c"
+        assert projected == ((projected.context.x <= 4) & (projected.context.z == 2)) | (projected.context.x > 10)
+
+        target = Context(["a"])
+        assert zone.project([c.y], context=target) == (target.a >= 0)
+        assert Context(["x"]).get_zero_federation().project([]).get_size() == 1
+
+        with pytest.raises(TypeError):
+            zone.remap(None)
+        with pytest.raises(ValueError):
+            zone.remap(wider, {"x": "w", "y": "w"})
+        with pytest.raises(KeyError):
+            zone.remap(wider, {"x": "missing"})
+        with pytest.raises(ValueError):
+            zone.remap(wider, {wider.x: "x"})
+        with pytest.raises(ValueError):
+            zone.project(["x", "x"])
+        with pytest.raises(ValueError):
+            zone.project(["x"], context=wider)
+
+    def test_volume(self):
+        context = Context(["x", "y"])
+        triangle = (context.x <= 2) & (context.y - context.x < 1)
+        box = (context.x >= 1) & (context.x <= 3) & (context.y <= 1)
+
+        assert triangle.volume() == 4.0
+        assert triangle.volume(bounds={"y": 1}) == 2.0
+        assert (triangle | box).volume() == 5.0
+        assert (triangle | triangle.copy()).volume() == 4.0
+        assert (context.x == 1).volume(bounds={"y": 4}) == 0.0
+        assert (context.x < 0).volume() == 0.0
+        assert [dbm.volume() for dbm in box.to_dbm_list()] == [2.0]
+        assert (Context(["x"]).x <= 3).volume() == 3.0
+
+        c = self.c
+        zone = (c.x <= 2) & (c.y <= 2) & (c.z <= 2)
+        cube = zone.volume(samples=2000, seed=1)
+        assert cube == 8.0
+        half = (zone & (c.x - c.y <= 0)).volume(samples=20000, seed=1)
+        assert abs(half - 4.0) < 0.3
+        assert half == (zone & (c.x - c.y <= 0)).volume(samples=20000, seed=1)
+        assert zone.to_dbm_list()[0].volume(samples=100) == 8.0
+
+    def test_volume_rejects_invalid_input(self):
+        context = Context(["x", "y"])
+        zone = context.x <= 2
+
+        with pytest.raises(ValueError, match="unbounded"):
+            zone.volume()
+        with pytest.raises(ValueError):
+            zone.volume(bounds={"y": 1}, samples=0)
+        with pytest.raises(TypeError):
+            zone.volume(bounds={"y": 1.5})
+        with pytest.raises(TypeError):
+            zone.volume(bounds={"y": 1}, seed=1.5)
+        with pytest.raises(ValueError):
+            zone.to_dbm_list()[0].volume()
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_relation_matrix(self):
+        c = self.c
+        split = (c.x <= 2) | ((c.x >= 2) & (c.x <= 5))
+        zones = [c.x <= 1, c.x <= 5, split, c.y <= 1, Federation(c), (c.x <= 1).copy()]
+
+        codes = relation_matrix(zones)
+        assert codes.dtype == numpy.int32
+        assert codes.shape == (6, 6)
+        for i, left in enumerate(zones):
+            for j, right in enumerate(zones):
+                expected = RELATION_DIFFERENT
+                if left <= right:
+                    expected |= RELATION_SUBSET
+                if left >= right:
+                    expected |= RELATION_SUPERSET
+                assert codes[i, j] == expected
+
+        assert (relation_matrix(zones, threads=1) == codes).all()
+        assert (relation_matrix(reversed(zones), threads=3) == codes[::-1, ::-1]).all()
+        approximate = relation_matrix(zones, exact=False)
+        assert approximate[1, 2] == RELATION_SUPERSET
+        assert approximate[2, 1] == RELATION_SUBSET
+        assert codes[1, 2] == codes[2, 1] == RELATION_EQUAL
+        assert relation_matrix([]).shape == (0, 0)
+        assert pyudbm.relation_matrix is relation_matrix
+
+        with pytest.raises(TypeError):
+            relation_matrix([c.x <= 1, c.x])
+        with pytest.raises(ValueError):
+            relation_matrix([c.x <= 1, Context(["x", "y", "z"]).x <= 1])
+        with pytest.raises(ValueError):
+            relation_matrix(zones, threads=-1)
+
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+    def test_contains_many(self):
+        c = self.c
+        federation = ((c.x <= 2) & (c.y - c.x < 1)) | (c.z > 5)
+        points = numpy.array([[0, 0, 0], [2, 3, 0], [3, 0, 6], [3, 0, 5]])
+
+        expected = []
+        for row in points.tolist():
+            valuation = IntValuation(c)
+            for clock, value in zip(c.clocks, row):
+                valuation[clock] = value
+            expected.append(federation.contains(valuation))
+
+        mask = federation.contains_many(points)
+        assert mask.dtype == numpy.bool_
+        assert mask.tolist() == expected == [True, False, True, False]
+        assert federation.contains_many([[1.5, 2.25, 0.0], [0.5, 1.5, 0.0]]).tolist() == [True, False]
+        assert federation.contains_many(numpy.zeros((0, 3), dtype=numpy.int32)).tolist() == []
+
+        with pytest.raises(ValueError):
+            federation.contains_many([[0, 0]])
+        with pytest.raises(TypeError):
+            federation.contains_many([["a", "b", "c"]])
+        with pytest.raises(TypeError):
+            federation.contains_many(numpy.zeros((1, 3), dtype=numpy.bool_))
+        with pytest.raises(ValueError, match="2\\*\\*31"):
+            federation.contains_many(numpy.array([[0, 0, -1]]))
+        with pytest.raises(ValueError, match="2\\*\\*31"):
+            federation.contains_many(numpy.array([[0, 0, 2 ** 32]], dtype=numpy.int64))
+        with pytest.raises(ValueError, match="2\\*\\*31"):
+            federation.contains_many(numpy.array([[0, 0, 2 ** 63]], dtype=numpy.uint64))
+
+    def test_federation_bytes_round_trip(self):
+        c = self.c
+        federation = ((c.x - c.y <= 2) & (c.z < 7)) | (c.y > 5) | ((c.x == 3) & (c.z - c.x < -1))
+
+        data = federation.to_bytes()
+        restored = Federation.from_bytes(c, data)
+        assert isinstance(data, bytes)
+        assert restored == federation
+        assert restored.get_size() == federation.get_size()
+        assert Federation.from_bytes(c, Federation(c).set_init().to_bytes()) == Federation(c).set_init()
+        assert Federation.from_bytes(c, (federation - federation).to_bytes()).is_empty()
+
+        other = Context(["a", "b", "c"], name="o")
+        assert str(Federation.from_bytes(other, (c.x < 3).to_bytes())) == "(o.a<3)"
+
+    def test_federation_from_bytes_rejects_invalid_payloads(self):
+        c = self.c
+        data = (c.x < 3).to_bytes()
+
+        with pytest.raises(TypeError):
+            Federation.from_bytes(None, data)
+        with pytest.raises(ValueError):
+            Federation.from_bytes(c, data[:5])
+        with pytest.raises(ValueError):
+            Federation.from_bytes(c, b"XXXX" + data[4:])
+        with pytest.raises(ValueError):
+            Federation.from_bytes(Context(["x"]), data)
+        with pytest.raises(ValueError):
+            Federation.from_bytes(c, data[:-4])
+
+    def test_pickle_round_trip(self):
+        c = self.c
+        federation = ((c.x - c.y <= 2) & (c.z < 7)) | (c.y > 5)
+        dbm = federation.to_dbm_list()[0]
+
+        context, clock, restored, restored_dbm = pickle.loads(pickle.dumps((c, c.y, federation, dbm)))
+        assert context is not c
+        assert context.name == "c"
+        assert [item.name for item in context.clocks] == ["x", "y", "z"]
+        assert clock is context.y
+        assert restored.context is context
+        assert restored_dbm.context is context
+        assert str(restored) == str(federation)
+        assert restored == Federation.from_bytes(context, federation.to_bytes())
+        assert restored_dbm.to_matrix() == dbm.to_matrix()
+
+    def test_federation_store_interns_equal_zones(self):
+        c = self.c
+        store = FederationStore()
+
+        first = store.intern((c.x - c.y <= 1) & (c.z < 4))
+        second = store.intern((c.z < 4) & (c.y - c.x >= -1))
+        third = store.intern(c.x < 2)
+
+        assert first is second
+        assert third is not first
+        assert len(store) == 2
+        assert (store.hits, store.misses) == (1, 2)
+        assert store.hit_rate == pytest.approx(1 / 3)
+        assert store.memory_saved == 4 * 4 * 4
+        assert (c.x < 2) in store
+        assert (c.x < 3) not in store
+        assert store.get(c.x < 3) is None
+        assert store.get(c.x < 2) is third
+        assert sorted(str(item) for item in store) == sorted([str(first), str(third)])
+
+    def test_federation_store_keeps_contexts_and_inputs_apart(self):
+        c = self.c
+        other = Context(["x", "y", "z"], name="c")
+        store = FederationStore()
+        zone = c.x < 2
+
+        stored = store.intern(zone)
+        zone &= c.y < 1
+
+        assert stored == (c.x < 2)
+        assert store.intern(other.x < 2) is not stored
+        assert len(store) == 2
+
+        store.clear()
+        assert len(store) == 0
+        assert (store.hits, store.misses, store.memory_saved) == (0, 0, 0)
+        with pytest.raises(TypeError):
+            store.intern(None)
+
+    def test_subsumption_index(self):
+        c = self.c
+        passed = SubsumptionIndex(c)
+
+        assert passed.insert((c.x <= 5) & (c.y <= 5), key=("l0", 1)) == 1
+        assert passed.insert((c.x <= 3) & (c.y <= 2), key=("l0", 1)) == 0
+        assert passed.insert(c.z >= 2, key="l1") == 1
+        assert len(passed) == 2
+        assert passed.keys() == [("l0", 1), "l1"]
+
+        assert passed.is_covered((c.x <= 3) & (c.y < 1), key=("l0", 1))
+        assert not passed.is_covered(((c.x <= 3) & (c.y < 1)) | (c.x > 6), key=("l0", 1))
+        assert not passed.is_covered(c.x <= 3, key=("l0", 1))
+        assert not passed.is_covered(c.z >= 2, key="missing")
+        assert passed.is_covered(c.x < 0, key="missing")
+        assert passed.get(("l0", 1)) == (c.x <= 5) & (c.y <= 5)
+        assert passed.get("missing").is_empty()
+
+        assert passed.remove_covered_by(c.x <= 5, key=("l0", 1)) == 1
+        assert passed.remove_covered_by(c.x <= 5, key="missing") == 0
+        assert passed.keys() == ["l1"]
+        assert len(passed) == 1
+
+        passed.clear()
+        assert len(passed) == 0
+
+    def test_subsumption_index_evicts_empty_keys(self):
+        c = self.c
+        passed = SubsumptionIndex(c)
+
+        assert passed.insert(c.x < 0, key="empty") == 0
+        assert passed.keys() == []
+        assert passed._keys == {}
+
+        for step in range(50):
+            assert passed.insert(c.x <= step, key=("l", step)) == 1
+            assert passed.remove_covered_by(c.x <= step, key=("l", step)) == 1
+        assert passed.keys() == []
+        assert passed._keys == {}
+        assert len(passed) == 0
+
+        passed.insert(c.x <= 1, key="a")
+        passed.insert(c.y <= 1, key="b")
+        passed.remove_covered_by(c.x <= 1, key="a")
+        passed.insert(c.z <= 1, key="c")
+        assert passed.keys() == ["b", "c"]
+        assert passed.get("b") == (c.y <= 1)
+        assert passed.get("c") == (c.z <= 1)
+
+    def test_subsumption_index_rejects_foreign_federations(self):
+        passed = SubsumptionIndex(self.c)
+
+        with pytest.raises(TypeError):
+            SubsumptionIndex(None)
+        with pytest.raises(TypeError):
+            passed.insert(None)
+        with pytest.raises(ValueError):
+            passed.insert(Context(["x", "y", "z"]).x <= 1)
+
+    def test_inplace_transformers(self):
+        c = self.c
+        base = (c.x - c.y <= 1) & (c.y - c.x <= 1) & (c.x >= 1) & (c.y >= 1) & (c.y <= 4)
+        bounds = {c.x: 2, c.y: 3, c.z: 4}
+        steps = [
+            lambda zone, **kwargs: zone.up(**kwargs),
+            lambda zone, **kwargs: zone.down(**kwargs),
+            lambda zone, **kwargs: zone.free_clock(c.x, **kwargs),
+            lambda zone, **kwargs: zone.convex_hull(**kwargs),
+            lambda zone, **kwargs: zone.predt(c.z > 3, **kwargs),
+            lambda zone, **kwargs: zone.update_value(c.y, 3, **kwargs),
+            lambda zone, **kwargs: zone.reset_value(c.z, **kwargs),
+            lambda zone, **kwargs: zone.extrapolate_max_bounds(bounds, **kwargs),
+        ]
+
+        for step in steps:
+            expected = step(base)
+            trial = base.copy()
+            assert step(trial, inplace=True) is trial
+            assert trial == expected
+            assert base == (c.x - c.y <= 1) & (c.y - c.x <= 1) & (c.x >= 1) & (c.y >= 1) & (c.y <= 4)
+
+        zone = (base & (c.x > 2)).reset_value(c.x, inplace=True).up(inplace=True)
+        assert zone == (base & (c.x > 2)).reset_value(c.x).up()
+
+    def test_successor_matches_operation_chain(self):
+        c = self.c
+        zone = (c.x - c.y == 0) & (c.z <= 3)
+        guard = c.x >= 2
+        invariant = (c.y <= 5) & (c.z <= 8)
+        bounds = {c.x: 2, c.y: 5, c.z: 8}
+
+        expected = zone & guard
+        expected = expected.reset_value(c.x).update_value(c.z, 1) & invariant
+        expected = expected.up() & invariant
+        expected = expected.extrapolate_max_bounds(bounds)
+
+        result = zone.successor(guard=guard, resets={c.x: 0, "z": 1}, invariant=invariant, max_bounds=bounds)
+        assert result == expected
+        assert zone == (c.x - c.y == 0) & (c.z <= 3)
+        assert zone.successor(guard, [c.x], invariant, delay=False) == (zone & guard).reset_value(c.x) & invariant
+        assert zone.successor(guard=c.x > 10, resets=[c.x], invariant=invariant).is_empty()
+        assert zone.successor() == zone.up()
+
+    def test_predecessor(self):
+        c = self.c
+        target = (c.x <= 1) & (c.y <= 4)
+
+        assert target.predecessor(guard=c.y >= 3, resets=[c.x]) == (c.y <= 4)
+        assert target.predecessor(guard=c.y >= 3, resets=[c.x], delay=False) == (c.y >= 3) & (c.y <= 4)
+        assert target.predecessor(resets={c.x: 2}).is_empty()
+        assert target.predecessor() == target.down()
+
+    def test_successor_rejects_invalid_operands(self):
+        c = self.c
+        zone = c.x <= 1
+        other = Context(["x", "y", "z"])
+
+        with pytest.raises(ValueError):
+            zone.successor(guard=other.x <= 1)
+        with pytest.raises(ValueError):
+            zone.successor(resets=[other.x])
+        with pytest.raises(TypeError):
+            zone.successor(resets=c.x)
+        with pytest.raises(TypeError):
+            zone.successor(resets={c.x: 1.5})
+        with pytest.raises(ValueError):
+            zone.successor(resets={c.x: 0, "x": 1})
+        with pytest.raises(ValueError, match="out of range"):
+            zone.successor(resets={c.x: -1})
+        with pytest.raises(ValueError, match="out of range"):
+            zone.predecessor(resets={"y": -3})
+        with pytest.raises(ValueError, match="out of range"):
+            zone.successor(resets={c.x: 2 ** 40})
+        with pytest.raises(ValueError):
+            zone.successor(max_bounds={c.x: 1})
+        with pytest.raises(ValueError):
+            zone.predecessor(invariant=other.x <= 1)